@@ -0,0 +1,103 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Compare torrent hashing throughput of torf, the threaded PieceHasher and mkbrr.
+
+    python -m bin.bench_hashing [path] [--size-mib N] [--files N] [--piece-size-mib N] [--threads N]
+
+Without a path, a temporary multi-file payload of random data is generated.
+Use a real path (and drop the page cache between runs) to measure disk bound
+throughput rather than hashing from memory.
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional
+
+from torf import Torrent
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.piecehasher import default_hash_threads  # noqa: E402
+from src.torrentcreate import TorrentCreator  # noqa: E402
+
+
+def make_payload(root: str, size_mib: int, files: int) -> str:
+    payload = os.path.join(root, "Bench.Payload")
+    os.makedirs(payload)
+    per_file = size_mib * 1024 * 1024 // files
+    for i in range(files):
+        # Odd sizes so pieces straddle file boundaries
+        with open(os.path.join(payload, f"file{i:03d}.mkv"), "wb") as f:
+            f.write(os.urandom(per_file + 12345 * i))
+    return payload
+
+
+def new_torrent(path: str, piece_size: int) -> Torrent:
+    torrent = Torrent(path=path, private=True)
+    torrent.piece_size = piece_size
+    return torrent
+
+
+def report(name: str, elapsed: float, size: int) -> None:
+    print(f"{name:<14} {elapsed:8.2f}s  {size / elapsed / 1024 / 1024:10.1f} MiB/s")
+
+
+def bench_mkbrr(path: str, piece_size: int, threads: int) -> Optional[float]:
+    mkbrr = shutil.which("mkbrr")
+    if not mkbrr:
+        return None
+    with tempfile.TemporaryDirectory() as out_dir:
+        cmd = [mkbrr, "create", path, "--private", "-l", str(piece_size.bit_length() - 1), "-o", os.path.join(out_dir, "bench.torrent")]
+        if threads:
+            cmd.extend(["--workers", str(threads)])
+        started = time.perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)  # nosec B603
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--size-mib", type=int, default=2048)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--piece-size-mib", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=0)
+    args = parser.parse_args()
+
+    piece_size = args.piece_size_mib * 1024 * 1024
+    threads = args.threads or default_hash_threads()
+    temp_dir = None if args.path else tempfile.mkdtemp(prefix="ua-bench-")
+    try:
+        path = args.path or make_payload(str(temp_dir), args.size_mib, args.files)
+        size = new_torrent(path, piece_size).size
+        print(f"{path}: {size / 1024 / 1024:.0f} MiB, {piece_size // 1024 // 1024} MiB pieces, {threads} threads")
+
+        torf_torrent = new_torrent(path, piece_size)
+        started = time.perf_counter()
+        torf_torrent.generate(threads=threads)
+        report("torf", time.perf_counter() - started, size)
+
+        threaded_torrent = new_torrent(path, piece_size)
+        started = time.perf_counter()
+        TorrentCreator.generate_threaded(threaded_torrent, threads)
+        report("piecehasher", time.perf_counter() - started, size)
+        if threaded_torrent.hashes != torf_torrent.hashes:
+            print("piecehasher: piece hashes DIFFER from torf")
+            sys.exit(1)
+
+        mkbrr_elapsed = bench_mkbrr(path, piece_size, args.threads)
+        if mkbrr_elapsed is None:
+            print("mkbrr          not found on PATH, skipped")
+        else:
+            report("mkbrr", mkbrr_elapsed, size)
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
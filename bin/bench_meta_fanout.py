@@ -0,0 +1,116 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Compare per-tracker deep copies of meta with copy-on-write MetaView views.
+
+    python -m bin.bench_meta_fanout [--trackers N] [--rounds N] [--tracks N]
+
+A synthetic meta of realistic size (MediaInfo JSON, BDInfo text, image list,
+TMDb payload, descriptions) is fanned out to N trackers the way the dupe check
+does it, with every per-tracker copy alive at the same time. Each tracker reads
+the keys a dupe search typically touches and writes a few keys of its own.
+Reported are the time per fan-out and the peak memory allocated by it.
+"""
+import argparse
+import copy
+import os
+import random
+import statistics
+import string
+import sys
+import time
+import tracemalloc
+from collections.abc import MutableMapping
+from typing import Any, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.metaview import MetaView  # noqa: E402
+
+Meta = MutableMapping[str, Any]
+
+
+def random_text(rng: random.Random, length: int) -> str:
+    return "".join(rng.choices(string.ascii_letters + " ", k=length))
+
+
+def make_meta(tracks: int, trackers: list[str]) -> dict[str, Any]:
+    rng = random.Random(1)  # nosec B311 - benchmark data
+    track_list: list[dict[str, Any]] = [
+        {"@type": "General" if i == 0 else "Video" if i == 1 else "Audio", **{f"Field{j}": random_text(rng, 24) for j in range(80)}}
+        for i in range(tracks)
+    ]
+    return {
+        "name": "Some Movie 2024 1080p BluRay DTS-HD MA 5.1 AVC-GROUP DUPE?",
+        "title": "Some Movie",
+        "year": 2024,
+        "tmdb_id": 12345,
+        "imdb_id": 1234567,
+        "resolution": "1080p",
+        "type": "DISC",
+        "category": "MOVIE",
+        "debug": False,
+        "unattended": True,
+        "mediainfo": {"media": {"@ref": "/path/to/file.mkv", "track": track_list}},
+        "bdinfo": {"summary": random_text(rng, 200_000), "files": [{"file": f"{i:05d}.m2ts", "length": "0:10:00"} for i in range(40)]},
+        "image_list": [{"img_url": f"https://img/{i}", "raw_url": f"https://raw/{i}", "web_url": f"https://web/{i}"} for i in range(20)],
+        "tmdb_credits": {"cast": [{"name": random_text(rng, 20), "character": random_text(rng, 20), "order": i} for i in range(200)]},
+        "overview": random_text(rng, 4_000),
+        "description": random_text(rng, 50_000),
+        "tracker_status": {tracker: {} for tracker in trackers},
+    }
+
+
+def simulate_tracker(local_meta: Meta, tracker: str) -> None:
+    if local_meta["name"].endswith("DUPE?"):
+        local_meta["name"] = local_meta["name"].replace(" DUPE?", "")
+    local_meta["tracker_status"][tracker].get("skip_upload")
+    for key in ("title", "year", "tmdb_id", "imdb_id", "resolution", "type", "category"):
+        local_meta.get(key)
+    mediainfo: dict[str, Any] = local_meta.get("mediainfo", {})
+    for track in mediainfo.get("media", {}).get("track", []):
+        if track.get("@type") == "Video":
+            track.get("Field0")
+    local_meta["were_trumping"] = False
+    local_meta[f"{tracker}_cross_seed"] = None
+
+
+def fan_out(meta: dict[str, Any], trackers: list[str], make_view: Callable[[dict[str, Any]], Meta]) -> list[Meta]:
+    views: list[Meta] = []
+    for tracker in trackers:
+        local_meta = make_view(meta)
+        simulate_tracker(local_meta, tracker)
+        views.append(local_meta)
+    return views
+
+
+def bench(name: str, meta: dict[str, Any], trackers: list[str], rounds: int, make_view: Callable[[dict[str, Any]], Meta]) -> None:
+    timings: list[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fan_out(meta, trackers, make_view)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    views = fan_out(meta, trackers, make_view)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del views
+    print(f"{name:<10} {statistics.median(timings) * 1000:9.2f} ms  {peak / 1024 / 1024:9.2f} MiB peak")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trackers", type=int, default=25)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--tracks", type=int, default=12)
+    args = parser.parse_args()
+
+    trackers = [f"T{i:02d}" for i in range(args.trackers)]
+    meta = make_meta(args.tracks, trackers)
+    print(f"{args.trackers} trackers, {args.tracks} MediaInfo tracks, median of {args.rounds} rounds")
+    bench("deepcopy", meta, trackers, args.rounds, copy.deepcopy)
+    bench("MetaView", meta, trackers, args.rounds, MetaView)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Compare plain guessit calls with the memoized and pooled parsing of src.name_parsing.
+
+    python -m bin.bench_name_parsing [--episodes N] [--calls N] [--rounds N]
+
+The file names of a synthetic season pack are parsed ``--calls`` times each,
+the way prep, tags, source, edition and season detection each parse the same
+names in one run. Reported are the median time for the whole pack with plain
+guessit, with the memoized guessit_fn (cold cache), with an in-process
+guessit_many batch followed by the per-file lookups, and with the same batch
+on the worker processes (started inside the first timed run, then reused).
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, cast
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import guessit  # noqa: E402
+
+from src import name_parsing  # noqa: E402
+
+guessit_module: Any = cast(Any, guessit)
+
+
+def make_pack(episodes: int) -> list[str]:
+    seasons = max(1, episodes // 20)
+    return [
+        f"/media/Some.Show.2019.S{season + 1:02d}.1080p.BluRay.DTS-HD.MA.5.1.x264-GROUP/"
+        f"Some.Show.2019.S{season + 1:02d}E{episode + 1:02d}.Episode.Title.1080p.BluRay.DTS-HD.MA.5.1.x264-GROUP.mkv"
+        for season in range(seasons)
+        for episode in range(episodes // seasons)
+    ]
+
+
+def plain(files: list[str], calls: int) -> None:
+    for _ in range(calls):
+        for path in files:
+            guessit_module.guessit(path)
+
+
+def memoized(files: list[str], calls: int) -> None:
+    for _ in range(calls):
+        for path in files:
+            name_parsing.guessit_fn(path)
+
+
+def batched(use_pool: bool) -> Callable[[list[str], int], None]:
+    def run(files: list[str], calls: int) -> None:
+        name_parsing.guessit_many(files, use_pool=use_pool)
+        memoized(files, calls)
+    return run
+
+
+def bench(name: str, files: list[str], calls: int, rounds: int, run: Callable[[list[str], int], None]) -> None:
+    timings: list[float] = []
+    for _ in range(rounds):
+        name_parsing.cache.clear()
+        started = time.perf_counter()
+        run(files, calls)
+        timings.append(time.perf_counter() - started)
+    print(f"{name:<16} {statistics.median(timings) * 1000:9.1f} ms  first round {timings[0] * 1000:9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--episodes", type=int, default=200)
+    parser.add_argument("--calls", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    files = make_pack(args.episodes)
+    # Load guessit's rules outside the timed runs
+    guessit_module.guessit(files[0])
+    print(f"{len(files)} files, {args.calls} parses per file, median of {args.rounds} rounds")
+    bench("guessit", files, args.calls, args.rounds, plain)
+    bench("guessit_fn", files, args.calls, args.rounds, memoized)
+    bench("batch", files, args.calls, args.rounds, batched(use_pool=False))
+    bench("batch + pool", files, args.calls, args.rounds, batched(use_pool=True))
+    name_parsing.workers.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Measure the cold start import time of upload.py.
+
+    python -m bin.bench_startup [--module upload] [--runs N] [--top N] [--max-ms N]
+
+Every run imports the module in a fresh interpreter with ``-X importtime`` and
+the median is reported, together with the slowest imports. Tracker modules
+(other than the shared COMMON helpers) and the heavy optional clients are only
+meant to be imported when they are used; finding one of them at startup, or a
+median above ``--max-ms``, exits with status 1 so a regression fails CI.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+# Modules that must stay out of the startup path
+LAZY_MODULES = ("discord", "cloudscraper", "pyimgbox")
+EAGER_TRACKER_MODULES = ("src.trackers", "src.trackers.COMMON")
+
+
+def measure(module: str) -> dict[str, tuple[int, int]]:
+    """Import ``module`` once in a fresh interpreter and return {name: (self us, cumulative us)} for top level entries."""
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    timings: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            timings[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    # upload.py exits when data/config.py is missing, but only after all of its imports have been timed
+    if module not in timings:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return timings
+
+
+def unexpected_imports(names: set[str]) -> list[str]:
+    return [
+        name for name in sorted(names)
+        if (name.startswith("src.trackers.") and name not in EAGER_TRACKER_MODULES) or name in LAZY_MODULES
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="upload")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=0.0, help="fail when the median import time is above this budget")
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(max(1, args.runs))]
+    totals = [run[args.module][1] / 1000 for run in runs]
+    median_total = statistics.median(totals)
+    print(f"import {args.module}: median {median_total:.0f} ms over {len(totals)} runs (min {min(totals):.0f} ms, max {max(totals):.0f} ms)")
+
+    names = set().union(*runs)
+    cumulative = {name: statistics.median(run[name][1] for run in runs if name in run) / 1000 for name in names if name != args.module}
+    print(f"\nSlowest imports (cumulative, median of {len(runs)} runs):")
+    for name, ms in sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    failed = False
+    unexpected = unexpected_imports(names)
+    if unexpected:
+        failed = True
+        print("\nImported at startup but expected to load lazily:")
+        for name in unexpected:
+            print(f"  {name}")
+    if args.max_ms and median_total > args.max_ms:
+        failed = True
+        print(f"\nMedian import time {median_total:.0f} ms is above the {args.max_ms:.0f} ms budget")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
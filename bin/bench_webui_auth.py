@@ -0,0 +1,72 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Measure requests per second of token-authenticated web UI API calls.
+
+    python -m bin.bench_webui_auth [--requests N] [--tokens N] [--cold]
+
+A throwaway config directory with a persisted user, N API tokens and IP
+lists is created, and /api/browse_roots is called through the Flask test
+client with a Bearer token, so every request runs the full before_request
+auth path (IP checks, token lookup, user lookup) and the access log hook.
+``--cold`` drops the cached auth state before every request to show the
+cost of reading and decrypting webui_auth.json each time.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def setup_config_dir(tokens: int) -> tuple[Any, str]:
+    """Point the web UI at a fresh config dir, import it and create a user with API tokens."""
+    config_home = tempfile.mkdtemp(prefix="ua-bench-auth-")
+    os.environ["XDG_CONFIG_HOME"] = config_home
+    os.environ["SESSION_SECRET"] = "b" * 64
+    os.environ.setdefault("UA_BROWSE_ROOTS", config_home)
+
+    import web_ui.auth as auth_mod  # noqa: E402
+    import web_ui.server as server  # noqa: E402
+
+    auth_mod.create_user("bench", "Correct-Horse-Battery-Staple-42")
+    store = {f"token-{i}": {"user": "bench", "label": "", "created": 0, "expiry": None} for i in range(tokens)}
+    auth_mod.set_api_tokens(store)
+    server._set_ip_whitelist([])
+    server._set_ip_blacklist([f"10.0.0.{i}" for i in range(50)])
+    # Keep the default rate limits from turning the benchmark into 429s
+    server.limiter.enabled = False
+    return server, f"token-{tokens - 1}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--tokens", type=int, default=20)
+    parser.add_argument("--cold", action="store_true", help="drop the cached auth state before every request")
+    args = parser.parse_args()
+
+    server, token = setup_config_dir(max(1, args.tokens))
+    import web_ui.auth as auth_mod  # noqa: E402
+
+    client = server.app.test_client()
+    headers = {"Authorization": f"Bearer {token}"}
+    response = client.get("/api/browse_roots", headers=headers)
+    if response.status_code != 200:
+        raise SystemExit(f"Warm-up request failed with {response.status_code}: {json.dumps(response.get_json())}")
+
+    started = time.perf_counter()
+    for _ in range(args.requests):
+        if args.cold:
+            auth_mod.invalidate_user_cache()
+        client.get("/api/browse_roots", headers=headers)
+    elapsed = time.perf_counter() - started
+    mode = "cold" if args.cold else "cached"
+    print(f"{args.requests} requests ({mode}): {args.requests / elapsed:8.1f} req/s, {elapsed / args.requests * 1000:.3f} ms per request")
+
+
+if __name__ == "__main__":
+    main()
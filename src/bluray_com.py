@@ -2,7 +2,6 @@
 import asyncio
 import json
 import os
-import random
 import re
 from collections.abc import Mapping, MutableMapping, Sequence
 from pathlib import Path
@@ -14,6 +13,9 @@ from bs4 import BeautifulSoup
 from bs4.element import AttributeValueList
 from rich.console import Console
 
+from src.bluray_pages import RELEASE_LIST_TTL, RELEASE_TTL, SEARCH_TTL, fetch_page
+from src.http_pool import pooled_client
+
 console = Console()
 
 Meta = MutableMapping[str, Any]
@@ -79,72 +81,15 @@ async def search_bluray(meta: Meta) -> Optional[str]:
         "Cache-Control": "max-age=0"
     }
 
-    max_retries = 2
-    retry_count = 0
-    backoff_time = 3.0
-
-    while retry_count <= max_retries:
+    response_text = await fetch_page(url, headers, meta, SEARCH_TTL, timeout=10.0)
+    if response_text:
         try:
-            delay = random.uniform(1, 3)  # nosec B311 - Rate limiting delay, not cryptographic
-            if meta.get('debug'):
-                console.print(f"[dim]Waiting {delay:.2f} seconds before request (attempt {retry_count + 1}/{max_retries + 1})...[/dim]")
-            await asyncio.sleep(delay)
-
+            debug_path = Path(base_dir) / "tmp" / uuid / f"debug_bluray_search_{imdb_id}.html"
+            await asyncio.to_thread(debug_path.write_text, response_text, encoding="utf-8")
             if meta.get('debug'):
-                console.print(f"[yellow]Sending request to blu-ray.com (attempt {retry_count + 1}/{max_retries + 1})...[/yellow]")
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                response = await client.get(url, headers=headers)
-
-                if response.status_code == 200 and "No index" not in response.text:
-                    response_text = response.text
-
-                    try:
-                        debug_path = Path(base_dir) / "tmp" / uuid / f"debug_bluray_search_{imdb_id}.html"
-                        await asyncio.to_thread(debug_path.write_text, response_text, encoding="utf-8")
-                        if meta.get('debug'):
-                            console.print(f"[dim]Saved search response to debug_bluray_search_{imdb_id}.html[/dim]")
-                    except Exception as e:
-                        console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
-
-                    break
-
-                elif "No index" in response.text:
-                    console.print(f"[red]Blocked by blu-ray.com (Anti-scraping protection) (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                    console.print(f"[dim]Response preview: {response.text[:150]}...[/dim]")
-
-                    # use less retries for blocked requests since it's probably just borked
-                    if retry_count < 2:
-                        backoff_time *= 2
-                        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on search[/red]")
-                        break
-                else:
-                    console.print(f"[red]Failed with status code: {response.status_code} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-
-                    if retry_count < max_retries:
-                        backoff_time *= 2
-                        if meta['debug']:
-                            console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on search[/red]")
-                        break
-
-        except httpx.RequestError as e:
-            console.print(f"[red]HTTP request error when accessing {url} (attempt {retry_count + 1}/{max_retries + 1}): {str(e)}[/red]")
-            if retry_count < max_retries:
-                backoff_time *= 2
-                if meta.get('debug'):
-                    console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                await asyncio.sleep(backoff_time)
-                retry_count += 1
-            else:
-                console.print("[red]Maximum retries reached, giving up on search[/red]")
-                break
+                console.print(f"[dim]Saved search response to debug_bluray_search_{imdb_id}.html[/dim]")
+        except Exception as e:
+            console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
 
     if not response_text:
         console.print("[red]Failed to retrieve search results after all attempts[/red]")
@@ -352,26 +297,26 @@ async def get_bluray_releases(meta: Meta) -> list[Release]:
             console.print(f"[red]No movies found for IMDB ID: tt{meta['imdb_id']:07d}[/red]")
         return []
 
-    matching_releases: list[Release] = []
+    is_3d = str(meta.get('3D', '')).lower() == 'yes'
+    resolution = str(meta.get('resolution', '')).lower()
+    is_4k = '2160p' in resolution or '4k' in resolution
+    release_type = "4K" if is_4k else "3D" if is_3d else "BD"
 
-    for idx, movie in enumerate(movie_links, 1):
+    async def movie_releases_for(idx: int, movie: MovieLink, client: httpx.AsyncClient) -> list[Release]:
         if meta.get('debug'):
             console.print(f"[blue]Processing movie {idx}/{len(movie_links)}: {movie['title']} ({movie['year']})[/blue]")
         releases_url = movie['releases_url']
         product_id = await extract_product_id(releases_url, meta)
         if not product_id:
             console.print(f"[red]Could not extract product ID from {releases_url}[/red]")
-            continue
+            return []
 
         ajax_url = f"https://www.blu-ray.com/products/menu_ajax.php?p={product_id}&c=20&action=showreleasesall"
         console.print(f"[dim]Releases URL: {ajax_url}[/dim]")
 
-        is_3d = str(meta.get('3D', '')).lower() == 'yes'
-        resolution = str(meta.get('resolution', '')).lower()
-        is_4k = '2160p' in resolution or '4k' in resolution
-        release_type = "4K" if is_4k else "3D" if is_3d else "BD"
         release_debug_filename = f"{meta.get('base_dir', '')}/tmp/{meta.get('uuid', '')}/debug_bluray_{release_type}.html"
-
+        response_text: Optional[str] = None
+        cached = False
         try:
             if os.path.exists(release_debug_filename):
                 if meta.get('debug'):
@@ -379,90 +324,44 @@ async def get_bluray_releases(meta: Meta) -> list[Release]:
                 response_text = await asyncio.to_thread(Path(release_debug_filename).read_text, encoding="utf-8")
 
                 if response_text and "No index" not in response_text:
-                    movie_releases = await extract_bluray_release_info(response_text, meta)
-
-                    for release in movie_releases:
-                        release['movie_title'] = movie['title']
-                        release['movie_year'] = movie['year']
-
-                    matching_releases.extend(movie_releases)
-                    continue
+                    cached = True
                 else:
                     console.print("[yellow]Cached file exists but appears to be invalid, will fetch fresh data[/yellow]")
         except Exception as e:
             console.print(f"[yellow]Error reading cached file: {str(e)}[/yellow]")
 
-        # If we're here, we need to make a request
-        delay = random.uniform(2, 4)  # nosec B311 - Rate limiting delay, not cryptographic
-        if meta.get('debug'):
-            console.print(f"[dim]Waiting {delay:.2f} seconds before request...[/dim]")
-        await asyncio.sleep(delay)
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Referer": releases_url,
-            "X-Requested-With": "XMLHttpRequest",
-        }
+        if not cached:
+            headers = {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+                "Accept-Encoding": "gzip, deflate, br",
+                "Connection": "keep-alive",
+                "Referer": releases_url,
+                "X-Requested-With": "XMLHttpRequest",
+            }
+            response_text = await fetch_page(ajax_url, headers, meta, RELEASE_LIST_TTL, client=client)
+            if not response_text:
+                return []
 
         try:
-            max_retries = 2
-            retry_count = 0
-            backoff_time = 3.0
-
-            while retry_count <= max_retries:
-                try:  # noqa: PERF203
-                    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                        response = await client.get(ajax_url, headers=headers)
-
-                        if response.status_code == 200 and "No index" not in response.text:
-                            movie_releases = await extract_bluray_release_info(response.text, meta)
-
-                            for release in movie_releases:
-                                release['movie_title'] = movie['title']
-                                release['movie_year'] = movie['year']
-
-                            console.print(f"[green]Found {len(movie_releases)} matching releases for this movie[/green]")
-                            matching_releases.extend(movie_releases)
-                            break
-                        elif "No index" in response.text:
-                            console.print(f"[red]Blocked by blu-ray.com when accessing {ajax_url} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                            if retry_count < max_retries:
-                                backoff_time *= 2
-                                console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                                await asyncio.sleep(backoff_time)
-                                retry_count += 1
-                            else:
-                                console.print("[red]Maximum retries reached, giving up on this URL[/red]")
-                                break
-                        else:
-                            console.print(f"[red]Failed to get release information from {ajax_url}, status code: {response.status_code} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                            if retry_count < max_retries:
-                                backoff_time *= 2
-                                console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                                await asyncio.sleep(backoff_time)
-                                retry_count += 1
-                            else:
-                                console.print("[red]Maximum retries reached, giving up on this URL[/red]")
-                                break
-
-                except httpx.RequestError as e:
-                    console.print(f"[red]HTTP request error when accessing {ajax_url} (attempt {retry_count + 1}/{max_retries + 1}): {str(e)}[/red]")
-                    if retry_count < max_retries:
-                        backoff_time *= 2
-                        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on this URL[/red]")
-                        break
-
+            movie_releases = await extract_bluray_release_info(response_text or "", meta)
         except Exception as e:
             console.print(f"[red]Error fetching release details from {ajax_url}: {str(e)}[/red]")
             console.print_exception()
+            return []
+
+        for release in movie_releases:
+            release['movie_title'] = movie['title']
+            release['movie_year'] = movie['year']
+        if not cached:
+            console.print(f"[green]Found {len(movie_releases)} matching releases for this movie[/green]")
+        return movie_releases
+
+    # The release lists of all movies are requested together, the rate limiter spaces the requests out
+    async with pooled_client(timeout=15.0, follow_redirects=True) as client:
+        per_movie = await asyncio.gather(*(movie_releases_for(idx, movie, client) for idx, movie in enumerate(movie_links, 1)))
+    matching_releases: list[Release] = [release for movie_releases in per_movie for release in movie_releases]
 
     console.print("[yellow]===== BluRay.com search results summary =====[/yellow]")
 
@@ -780,7 +679,7 @@ async def download_cover_images(meta: Meta) -> bool:
     downloaded_images: dict[str, str] = {}
     console.print("[blue]Downloading cover images...[/blue]")
 
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+    async with pooled_client(timeout=30.0, follow_redirects=True) as client:
         cover_images = cast(Mapping[str, str], meta.get('cover_images', {}))
         for img_type, url in cover_images.items():
             file_ext = os.path.splitext(url)[1]
@@ -895,7 +794,7 @@ def clean_image_url(url: Optional[str]) -> Optional[str]:
     return url
 
 
-async def fetch_release_details(release: Release, meta: Meta) -> Release:
+async def fetch_release_details(release: Release, meta: Meta, client: Optional[httpx.AsyncClient] = None) -> Release:
     release_url = release['url']
     release_id = release.get('release_id', '0000000')
     debug_filename = f"{meta.get('base_dir', '')}/tmp/{meta.get('uuid', '')}/debug_release_{release_id}.html"
@@ -918,12 +817,6 @@ async def fetch_release_details(release: Release, meta: Meta) -> Release:
     except Exception as e:
         console.print(f"[yellow]Error reading cached file: {str(e)}[/yellow]")
 
-    # If we're here, we need to make a request
-    delay = random.uniform(2, 4)  # nosec B311 - Rate limiting delay, not cryptographic
-    if meta.get('debug'):
-        console.print(f"[dim]Waiting {delay:.2f} seconds before request...[/dim]")
-    await asyncio.sleep(delay)
-
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
@@ -936,63 +829,15 @@ async def fetch_release_details(release: Release, meta: Meta) -> Release:
         "Sec-Fetch-Site": "same-origin"
     }
 
-    max_retries = 2
-    retry_count = 0
-    backoff_time = 3.0
-
-    while retry_count <= max_retries:
+    response_text = await fetch_page(release_url, headers, meta, RELEASE_TTL, client=client)
+    if response_text:
         try:
+            debug_path = Path(str(meta.get('base_dir', ''))) / "tmp" / str(meta.get('uuid', '')) / f"debug_release_{release_id}.html"
+            await asyncio.to_thread(debug_path.write_text, response_text, encoding="utf-8")
             if meta.get('debug'):
-                console.print(f"[yellow]Sending request to {release_url} (attempt {retry_count + 1}/{max_retries + 1})...[/yellow]")
-
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                response = await client.get(release_url, headers=headers)
-
-                if response.status_code == 200 and "No index" not in response.text:
-                    response_text = response.text
-
-                    try:
-                        release_id = release.get('release_id', '0000000')
-                        debug_path = Path(str(meta.get('base_dir', ''))) / "tmp" / str(meta.get('uuid', '')) / f"debug_release_{release_id}.html"
-                        await asyncio.to_thread(debug_path.write_text, response_text, encoding="utf-8")
-                        if meta.get('debug'):
-                            console.print(f"[dim]Saved release page to debug_release_{release_id}.html[/dim]")
-                    except Exception as e:
-                        console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
-
-                    break
-
-                elif "No index" in response.text:
-                    console.print(f"[red]Blocked by blu-ray.com when accessing {release_url} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                    if retry_count < 2:
-                        backoff_time *= 2
-                        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on this release[/red]")
-                        break
-                else:
-                    console.print(f"[red]Failed to get release details, status code: {response.status_code} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                    if retry_count < max_retries:
-                        backoff_time *= 2
-                        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on this release[/red]")
-                        break
-
-        except httpx.RequestError as e:
-            console.print(f"[red]HTTP request error when accessing {release_url} (attempt {retry_count + 1}/{max_retries + 1}): {str(e)}[/red]")
-            if retry_count < max_retries:
-                backoff_time *= 2
-                console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                await asyncio.sleep(backoff_time)
-                retry_count += 1
-            else:
-                console.print("[red]Maximum retries reached, giving up on this release[/red]")
-                break
+                console.print(f"[dim]Saved release page to debug_release_{release_id}.html[/dim]")
+        except Exception as e:
+            console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
 
     if not response_text:
         console.print("[red]Failed to retrieve release details after all attempts[/red]")
@@ -1107,11 +952,11 @@ async def process_all_releases(releases: Sequence[Release], meta: Meta) -> list[
         else:
             console.print(f"[red]BD_SUMMARY file not found: {bd_summary_path}[/red]")
 
-    detailed_releases: list[Release] = []
     for idx, release in enumerate(releases, 1):
         console.print(f"[cyan]Processing release {idx}/{len(releases)}: {release['title']} ({release['country']})")
-        detailed_release = await fetch_release_details(release, meta)
-        detailed_releases.append(detailed_release)
+    # All release pages are requested together on one client, the rate limiter spaces the requests out
+    async with pooled_client(timeout=15.0, follow_redirects=True) as client:
+        detailed_releases: list[Release] = list(await asyncio.gather(*(fetch_release_details(release, meta, client) for release in releases)))
 
     if meta.get('debug'):
         console.print()
@@ -0,0 +1,179 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Rate limited, cached page fetching for blu-ray.com.
+
+Every request to blu-ray.com takes a token from one shared token bucket, so
+concurrent lookups (the details of several releases, the release lists of
+several movies) are spaced out like the old fixed delays, while pages that
+already arrived are parsed during the waits for the next ones. A block by the
+anti-scraping protection drains the bucket, which slows down every pending
+request and not only the retried one.
+
+Fetched pages are kept in a SQLite database under ``data/cache`` keyed by
+URL, so re-runs and other discs of the same title reuse them until their TTL
+runs out.
+"""
+import asyncio
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Optional
+
+import httpx
+
+from src.console import console
+from src.http_pool import pooled_client
+from src.sqlite_cache import SQLiteCache
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+SEARCH_TTL = DAY
+RELEASE_LIST_TTL = 7 * DAY
+RELEASE_TTL = 30 * DAY
+
+# One request every 3 seconds on average (the old delays were 2-4 s), with a burst of 2 after a quiet period
+REQUEST_RATE = 1 / 3.0
+BURST = 2.0
+MAX_RETRIES = 2
+BACKOFF = 3.0
+# blu-ray.com answers with this page when it blocks a client
+BLOCKED_MARKER = "No index"
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out start times: a caller takes a token now and sleeps until it is due.
+    A penalty also reaches callers that are already asleep, they sleep off every penalty
+    added while they waited before they start.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        # Seconds of penalty handed out so far, sleeping callers compare it with the value they started with
+        self.penalties = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> tuple[float, float]:
+        """
+        Take a token and return the seconds until it may be used, with the penalties so far.
+        Tokens go negative while requests queue up.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate, self.penalties
+
+    def penalize(self, seconds: float) -> None:
+        """Push every pending and future request back by ``seconds``."""
+        with self._lock:
+            self.tokens -= seconds * self.rate
+            self.penalties += seconds
+
+    async def acquire(self) -> float:
+        # Penalties from before the reservation are already part of its delay
+        delay, seen = self.reserve()
+        waited = 0.0
+        while delay > 0:
+            # A little jitter so queued requests do not arrive on an exact beat
+            delay += random.uniform(0, 0.5)  # nosec B311 - Rate limiting jitter, not cryptographic
+            await asyncio.sleep(delay)
+            waited += delay
+            with self._lock:
+                delay, seen = self.penalties - seen, self.penalties
+        return waited
+
+
+bucket = TokenBucket(REQUEST_RATE, BURST)
+
+
+class PageCache(SQLiteCache):
+    file_name = "bluray_pages.sqlite3"
+    schema = ("CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, body TEXT NOT NULL, fetched REAL NOT NULL)",)
+    label = "blu-ray.com page cache"
+
+    @classmethod
+    def from_meta(cls, meta: Mapping[str, Any]) -> "PageCache":
+        return cls(cls.meta_path(meta))
+
+    def get(self, url: str, ttl: float) -> Optional[str]:
+        def query(conn: sqlite3.Connection) -> Optional[str]:
+            row = conn.execute("SELECT body, fetched FROM pages WHERE url = ?", (url,)).fetchone()
+            if row is None or time.time() - float(row[1]) > ttl:
+                return None
+            return str(row[0])
+
+        return self.read(query, None)
+
+    def store(self, url: str, body: str) -> None:
+        now = time.time()
+
+        def update(conn: sqlite3.Connection) -> None:
+            conn.execute("INSERT OR REPLACE INTO pages (url, body, fetched) VALUES (?, ?, ?)", (url, body, now))
+            # Nothing is kept longer than the longest TTL
+            conn.execute("DELETE FROM pages WHERE fetched < ?", (now - RELEASE_TTL,))
+
+        self.write(update)
+
+
+async def fetch_page(
+    url: str,
+    headers: Mapping[str, str],
+    meta: Mapping[str, Any],
+    ttl: float,
+    client: Optional[httpx.AsyncClient] = None,
+    timeout: float = 15.0,
+) -> Optional[str]:
+    """
+    The page at ``url``, from the page cache while it is younger than ``ttl``,
+    otherwise fetched through the shared rate limiter with retries. Pass
+    ``client`` to run a batch of requests on one pooled client.
+    """
+    cache = PageCache.from_meta(meta)
+    # SQLite is synchronous, keep it off the event loop
+    cached = await asyncio.to_thread(cache.get, url, ttl)
+    if cached is not None:
+        if meta.get('debug'):
+            console.print(f"[green]Using cached blu-ray.com page: {url}[/green]")
+        return cached
+
+    backoff_time = BACKOFF
+    for attempt in range(1, MAX_RETRIES + 2):
+        waited = await bucket.acquire()
+        if meta.get('debug'):
+            console.print(f"[dim]Waited {waited:.2f} seconds, sending request to {url} (attempt {attempt}/{MAX_RETRIES + 1})...[/dim]")
+        try:
+            if client is None:
+                async with pooled_client(timeout=timeout, follow_redirects=True) as own_client:
+                    response = await own_client.get(url, headers=dict(headers))
+            else:
+                response = await client.get(url, headers=dict(headers), timeout=timeout)
+        except httpx.RequestError as e:
+            console.print(f"[red]HTTP request error when accessing {url} (attempt {attempt}/{MAX_RETRIES + 1}): {str(e)}[/red]")
+        else:
+            text = response.text
+            if response.status_code == 200 and BLOCKED_MARKER not in text:
+                await asyncio.to_thread(cache.store, url, text)
+                return text
+            if BLOCKED_MARKER in text:
+                console.print(f"[red]Blocked by blu-ray.com (Anti-scraping protection) when accessing {url} (attempt {attempt}/{MAX_RETRIES + 1})[/red]")
+                if meta.get('debug'):
+                    console.print(f"[dim]Response preview: {text[:150]}...[/dim]")
+            else:
+                console.print(f"[red]Failed with status code: {response.status_code} for {url} (attempt {attempt}/{MAX_RETRIES + 1})[/red]")
+
+        if attempt > MAX_RETRIES:
+            break
+        backoff_time *= 2
+        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
+        # The retry waits for the bucket, so every other queued request backs off as well
+        bucket.penalize(backoff_time)
+
+    console.print(f"[red]Maximum retries reached, giving up on {url}[/red]")
+    return None
@@ -8,12 +8,14 @@ import re
 import subprocess
 import sys
 import threading
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 import psutil
 
 from src.console import console
+from src.http_pool import close_http_pool
 
 if os.name == "posix":
     import termios
@@ -30,8 +32,22 @@ erase_key: Optional[str] = None
 
 
 class CleanupManager:
+    def __init__(self) -> None:
+        self._deferred = 0
+
+    @contextlib.contextmanager
+    def deferred(self) -> Iterator[None]:
+        """Skip cleanup() while several queue items share the event loop, one item must not tear down the others."""
+        self._deferred += 1
+        try:
+            yield
+        finally:
+            self._deferred -= 1
+
     async def cleanup(self) -> None:
         """Ensure all running tasks, threads, and subprocesses are properly cleaned up before exiting."""
+        if self._deferred:
+            return
         # console.print("[yellow]Cleaning up tasks before exiting...[/yellow]")
 
         # Step 1: Shutdown ThreadPoolExecutor **before checking for threads**
@@ -82,6 +98,10 @@ class CleanupManager:
         with contextlib.suppress(RuntimeError):
             await asyncio.sleep(0.1)
 
+        # 🔹 Close the shared HTTP connections while the event loop is still running
+        with contextlib.suppress(RuntimeError):
+            await close_http_pool()
+
         # 🔹 Step 5: Cancel all running asyncio tasks **gracefully**
         try:
             tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
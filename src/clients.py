@@ -3,6 +3,7 @@ import asyncio
 import os
 import re
 import shutil
+import time
 import urllib.parse
 from pathlib import Path
 from typing import Any, Optional, Union, cast
@@ -13,7 +14,9 @@ import qbittorrentapi
 from torf import Torrent
 
 from src.console import console
+from src.pieceverify import SAMPLE_MODES, verify_pieces
 from src.torrent_clients import DelugeClientMixin, QbittorrentClientMixin, RtorrentClientMixin, TransmissionClientMixin
+from src.torrent_clients.client_index import get_client_index
 
 # Secure XML-RPC client using defusedxml to prevent XML attacks
 defusedxml.xmlrpc.monkey_patch()
@@ -393,7 +396,7 @@ class Clients(QbittorrentClientMixin, RtorrentClientMixin, DelugeClientMixin, Tr
                 else:
                     qbt_client = await self.init_qbittorrent_client(client)
 
-                found_hash = await self.search_qbit_for_torrent(meta, client, qbt_client, qbt_session, proxy_url)
+                found_hash = await self.search_qbit_for_torrent(meta, client, qbt_client, qbt_session, proxy_url, client_name)
 
                 # Clean up session if we created one
                 if qbt_session:
@@ -496,30 +499,56 @@ class Clients(QbittorrentClientMixin, RtorrentClientMixin, DelugeClientMixin, Tr
                     valid = False
                     console.print("[cyan]DEBUG: Skipping validation because found_hash is None[/cyan]")
 
-                if valid:
-                    torrent = Torrent.read(resolved_path)
-                    piece_size = torrent.piece_size
-                    piece_in_mib = int(piece_size) / 1024 / 1024
-
-                    if not prefer_small_pieces:
-                        console.print(f"[green]Found a valid torrent from client search with piece size {piece_in_mib} MiB: [bold yellow]{found_hash}")
-                        return resolved_path
-
-                    # Track best match for small pieces
-                    if piece_size <= 8388608 and mtv_torrent:
-                        console.print(f"[green]Found a valid torrent with preferred piece size from client search: [bold yellow]{found_hash}")
-                        return resolved_path
-
-                    if piece_size < 16777216 and piece_limit:  # 16 MiB
-                        console.print(f"[green]Found a valid torrent with piece size under 16 MiB from client search: [bold yellow]{found_hash}")
-                        return resolved_path
+                if valid and found_hash:
+                    preferred_path, best_match = self._check_searched_torrent(resolved_path, found_hash, prefer_small_pieces, mtv_torrent, piece_limit, best_match)
+                    if preferred_path:
+                        return preferred_path
+
+        elif torrent_client == 'rtorrent' and client.get('enable_search') and torrent_storage_dir:
+            # rTorrent has no search API, so candidates come from the client index and the .torrent from the session folder
+            index = await get_client_index(client_name, client, str(meta.get('base_dir', '')), debug=bool(meta.get('debug')))
+            if index is not None:
+                for entry in index.find(names=[str(meta.get('uuid', ''))]):
+                    found_hash = str(entry['hash']).upper()
+                    found_torrent_path = os.path.join(torrent_storage_dir, f"{found_hash}.torrent")
+                    if not os.path.exists(found_torrent_path):
+                        if meta['debug']:
+                            console.print(f"[yellow]Torrent file not found in storage directory: {found_torrent_path}")
+                        continue
 
-                    if best_match is None or piece_size < best_match['piece_size']:
-                        best_match = {'torrenthash': found_hash, 'torrent_path': resolved_path, 'piece_size': piece_size}
-                        console.print(f"[yellow]Storing valid torrent from client search as best match: [bold yellow]{found_hash}")
+                    valid, resolved_path = await self.is_valid_torrent(meta, found_torrent_path, found_hash, torrent_client, client)
+                    if valid:
+                        preferred_path, best_match = self._check_searched_torrent(resolved_path, found_hash, prefer_small_pieces, mtv_torrent, piece_limit, best_match)
+                        if preferred_path:
+                            return preferred_path
 
         return best_match
 
+    @staticmethod
+    def _check_searched_torrent(resolved_path: str, found_hash: str, prefer_small_pieces: bool, mtv_torrent: bool, piece_limit: bool, best_match: Optional[dict[str, Any]]) -> tuple[Optional[str], Optional[dict[str, Any]]]:
+        """Return the torrent path if its piece size is acceptable, otherwise the (possibly updated) best match to fall back to."""
+        torrent = Torrent.read(resolved_path)
+        piece_size = torrent.piece_size
+        piece_in_mib = int(piece_size) / 1024 / 1024
+
+        if not prefer_small_pieces:
+            console.print(f"[green]Found a valid torrent from client search with piece size {piece_in_mib} MiB: [bold yellow]{found_hash}")
+            return resolved_path, best_match
+
+        # Track best match for small pieces
+        if piece_size <= 8388608 and mtv_torrent:
+            console.print(f"[green]Found a valid torrent with preferred piece size from client search: [bold yellow]{found_hash}")
+            return resolved_path, best_match
+
+        if piece_size < 16777216 and piece_limit:  # 16 MiB
+            console.print(f"[green]Found a valid torrent with piece size under 16 MiB from client search: [bold yellow]{found_hash}")
+            return resolved_path, best_match
+
+        if best_match is None or piece_size < best_match['piece_size']:
+            best_match = {'torrenthash': found_hash, 'torrent_path': resolved_path, 'piece_size': piece_size}
+            console.print(f"[yellow]Storing valid torrent from client search as best match: [bold yellow]{found_hash}")
+        return None, best_match
+
     async def is_valid_torrent(self, meta: dict[str, Any], torrent_path: str, torrenthash: str, torrent_client: str, client: dict[str, Any]) -> tuple[bool, str]:
         valid = False
         wrong_file = False
@@ -626,6 +655,8 @@ class Clients(QbittorrentClientMixin, RtorrentClientMixin, DelugeClientMixin, Tr
                         if meta['debug']:
                             console.log("[bold red]Provided .torrent has files that were not expected")
                         valid = False
+                    elif not await self.verify_reused_torrent(meta, reuse_torrent):
+                        valid = False
                     else:
                         if meta['debug']:
                             console.log(f"[bold green]REUSING .torrent with infohash: [bold yellow]{torrenthash}")
@@ -641,6 +672,58 @@ class Clients(QbittorrentClientMixin, RtorrentClientMixin, DelugeClientMixin, Tr
 
         return valid, torrent_path
 
+    @staticmethod
+    def _local_torrent_files(meta: dict[str, Any], torrent: Torrent) -> list[tuple[str, int]]:
+        """Map the files of a reused torrent onto the local content in meta."""
+        meta_path = str(meta.get('path', ''))
+        filelist = cast(list[str], meta.get('filelist', []))
+        if 'length' in torrent.metainfo['info']:
+            if os.path.isfile(meta_path):
+                local_file = meta_path
+            elif len(filelist) == 1:
+                local_file = filelist[0]
+            else:
+                local_file = os.path.join(meta_path, str(torrent.name))
+            return [(local_file, int(torrent.size))]
+
+        content_root = meta_path if os.path.isdir(meta_path) else os.path.dirname(meta_path)
+        # Torrent paths start with the torrent name, which is the local content folder
+        return [(os.path.join(content_root, *file.parts[1:]), int(file.size)) for file in torrent.files]
+
+    async def verify_reused_torrent(self, meta: dict[str, Any], torrent: Torrent) -> bool:
+        """Hash a sample of pieces against the local files. Disabled when reuse_verify_pieces is 0."""
+        default_cfg = cast(dict[str, Any], self.config.get('DEFAULT', {}))
+        try:
+            sample_count = int(default_cfg.get('reuse_verify_pieces', 0) or 0)
+        except (TypeError, ValueError):
+            sample_count = 0
+        if sample_count <= 0:
+            return True
+        mode = str(default_cfg.get('reuse_verify_mode', 'stratified')).lower()
+        if mode not in SAMPLE_MODES:
+            mode = 'stratified'
+
+        started = time.perf_counter()
+        try:
+            result = await asyncio.to_thread(
+                verify_pieces,
+                self._local_torrent_files(meta, torrent),
+                torrent.piece_size,
+                bytes(torrent.metainfo['info']['pieces']),
+                sample_count,
+                mode,
+            )
+        except (OSError, ValueError) as e:
+            console.print(f"[bold red]Could not verify pieces of reused torrent: {e}")
+            return False
+
+        elapsed = time.perf_counter() - started
+        if not result.ok:
+            console.print(f"[bold red]Reused torrent failed piece verification ({result.reason}), not reusing it")
+        elif meta['debug']:
+            console.log(f"[green]Verified {result.checked} sampled pieces of reused torrent in {elapsed:.2f}s")
+        return result.ok
+
     async def remote_path_map(self, meta: dict[str, Any], torrent_client_name: Optional[Union[str, dict[str, Any]]] = None) -> tuple[str, str]:
         if isinstance(torrent_client_name, dict):
             client_config: dict[str, Any] = torrent_client_name
@@ -25,6 +25,10 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "img_host_1": (str,),
     "img_host_2": (str,),
     "img_host_3": (str,),
+    "image_url_cache": (bool,),
+    "image_url_cache_days": (str, int),
+    "image_upload_concurrency": (str, int),
+    "image_upload_max_concurrency": (str, int),
     "imgbb_api": (str,),
     "ptpimg_api": (str,),
     "lensdump_api": (str,),
@@ -35,6 +39,8 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "episode_overview": (bool,),
     "screens": (str, int),
     "cutoff_screens": (str, int),
+    "screenshot_scoring": (bool,),
+    "screenshot_candidates": (str, int),
     "thumbnail_size": (str, int),
     "frame_overlay": (bool,),
     "tone_map": (bool,),
@@ -45,6 +51,7 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "process_limit": (str, int),
     "threads": (str, int),
     "ffmpeg_limit": (bool,),
+    "batch_screenshots": (bool,),
     "multiScreens": (str, int),
     "pack_thumb_size": (str, int),
     "charLimit": (str, int),
@@ -55,12 +62,19 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "sfx_on_prompt": (bool,),
     "tracker_pass_checks": (str, int),
     "use_largest_playlist": (bool,),
+    "bdinfo_scans_per_device": (str, int),
     "keep_images": (bool,),
     "only_id": (bool,),
     "use_sonarr": (bool,),
     "use_radarr": (bool,),
     "mkbrr": (bool,),
     "mkbrr_threads": (str, int),
+    "threaded_hashing": (bool,),
+    "hash_threads": (str, int),
+    "piece_hash_cache": (bool,),
+    "piece_hash_cache_size_mb": (str, int),
+    "reuse_verify_pieces": (str, int),
+    "reuse_verify_mode": (str,),
     "user_overrides": (bool,),
     "ping_unit3d": (bool,),
     "get_bluray_info": (bool,),
@@ -81,6 +95,18 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "cross_seeding": (bool,),
     "cross_seed_check_everything": (bool,),
     "auto_mode": (bool, str),
+    "queue_pipeline_items": (str, int),
+    "queue_pipeline_prep": (str, int),
+    "queue_pipeline_screens": (str, int),
+    "queue_pipeline_torrent": (str, int),
+    "queue_pipeline_trackers": (str, int),
+    "http_max_connections_per_host": (str, int),
+    "http_keepalive_expiry": (str, int),
+    "http_upload_inflight_mb": (str, int),
+    "metadata_cache": (bool,),
+    "metadata_cache_offline": (bool,),
+    "mediainfo_cache": (bool,),
+    "playlist_index_cache": (bool,),
 }
 
 # Valid image hosts
@@ -410,7 +436,9 @@ def _validate_default_section(default: dict[str, Any]) -> tuple[list[str], list[
     # Validate numeric string values can be parsed
     numeric_keys = ["screens", "cutoff_screens", "thumbnail_size", "process_limit", "threads",
                     "multiScreens", "pack_thumb_size", "charLimit", "fileLimit", "processLimit",
-                    "tracker_pass_checks", "mkbrr_threads", "ffmpeg_compression"]
+                    "tracker_pass_checks", "mkbrr_threads", "hash_threads", "piece_hash_cache_size_mb", "image_url_cache_days", "image_upload_concurrency", "image_upload_max_concurrency", "bdinfo_scans_per_device", "reuse_verify_pieces", "screenshot_candidates", "ffmpeg_compression", "queue_pipeline_items",
+                    "queue_pipeline_prep", "queue_pipeline_screens", "queue_pipeline_torrent", "queue_pipeline_trackers",
+                    "http_max_connections_per_host", "http_keepalive_expiry", "http_upload_inflight_mb"]
     for key in numeric_keys:
         if key in default:
             value = default[key]
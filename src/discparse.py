@@ -1,12 +1,16 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import contextlib
 import json
 import os
 import platform
 import re
 import shutil
+import time
 import traceback
 from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from glob import escape as escape_glob
 from glob import glob
 from pathlib import Path
 from typing import Any, Optional, cast
@@ -16,13 +20,41 @@ import defusedxml.ElementTree as ET
 from langcodes import Language
 from pymediainfo import MediaInfo
 
-from bin.get_playlist import MplsParser
 from src.console import console
 from src.exportmi import setup_mediainfo_library
+from src.playlist_index import PlaylistIndex, disc_playlists
 
 PlaylistItem = dict[str, Any]
 PlaylistInfo = dict[str, Any]
 
+# BDInfo reads whole playlists, so discs on the same device are scanned one at a time by default
+DEFAULT_BDINFO_SCANS_PER_DEVICE = 1
+MAX_PARALLEL_BDINFO = 4
+
+
+@dataclass
+class BdinfoScan:
+    disc_index: int
+    path: str
+    playlist: PlaylistInfo
+    report_path: str
+    ok: bool = False
+
+
+def _device_key(path: str) -> Any:
+    """The device a disc is stored on, so scans of discs on the same disk can be serialised."""
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return os.path.splitdrive(os.path.abspath(path))[0] or path
+
+
+def _text_report(directory: str, name: str, normalize_newlines: bool = True) -> str:
+    """MediaInfo text report of ``name`` in ``directory``, with the file named as if MediaInfo ran inside the directory."""
+    file_path = os.path.join(directory, name)
+    report = str(MediaInfo.parse(file_path, output='STRING', full=False)).replace(file_path, name)
+    return report.replace('\r\n', '\n') if normalize_newlines else report
+
 
 class DiscParse:
     def __init__(self, config: dict[str, Any]) -> None:
@@ -106,6 +138,8 @@ class DiscParse:
         if meta.get('emby', False):
             return discs, meta_discs
 
+        # Discs that need their playlists scanned: index, path, valid and selected playlists, one scan per selected playlist
+        selections: list[tuple[int, str, list[PlaylistInfo], list[PlaylistInfo], list[BdinfoScan]]] = []
         for i in range(len(discs)):
             bdinfo_text = None
             path = os.path.abspath(discs[i]['path'])
@@ -127,88 +161,8 @@ class DiscParse:
                 if meta.get('debug'):
                     console.print(f"[cyan]Parsing playlists from: {playlists_path}")
 
-                def _load_mpls(mpls_path: str) -> tuple[Any, Any]:
-                    with open(mpls_path, "rb") as mpls_file:
-                        parser = MplsParser(mpls_file)
-                        header = parser.load_movie_playlist()
-                        mpls_file.seek(header.playlist_start_address, os.SEEK_SET)
-                        playlist_data = parser.load_playlist()
-                    return header, playlist_data
-
-                # Parse playlists
-                valid_playlists: list[PlaylistInfo] = []
-                for file_name in os.listdir(playlists_path):
-                    if not file_name.endswith(".mpls"):
-                        continue
-
-                    mpls_path = os.path.join(playlists_path, file_name)
-                    if meta.get('debug'):
-                        console.print(f"[cyan]Processing playlist: {file_name}")
-
-                    try:
-                        _, playlist_data = await asyncio.to_thread(_load_mpls, mpls_path)
-                        duration: float = 0.0
-                        stream_directory = os.path.join(path, "STREAM")
-                        file_counts: defaultdict[str, int] = defaultdict(int)
-                        file_sizes: dict[str, int] = {}
-                        total_play_items: int = 0
-
-                        play_items = getattr(playlist_data, "play_items", None)
-                        if not play_items:
-                            if meta.get('debug'):
-                                console.print(f"[yellow]  No play_items found in {file_name}")
-                            continue
-
-                        if meta.get('debug'):
-                            console.print(f"[cyan]  Found {len(play_items)} play items in {file_name}")
-
-                        for item in play_items:
-                            intime = getattr(item, "intime", None)
-                            outtime = getattr(item, "outtime", None)
-                            if intime is None or outtime is None:
-                                continue
-                            duration += (outtime - intime) / 45000.0
-                            try:
-                                clip_name = getattr(item, "clip_information_filename", None)
-                                if not isinstance(clip_name, str):
-                                    continue
-                                clip_name = clip_name.strip()
-                                if not clip_name:
-                                    continue
-                                m2ts_file = os.path.join(stream_directory, clip_name + ".m2ts")
-                                if os.path.exists(m2ts_file):
-                                    size = os.path.getsize(m2ts_file)
-                                    file_counts[m2ts_file] += 1
-                                    file_sizes[m2ts_file] = size
-                                    total_play_items += 1
-                                elif meta.get('debug'):
-                                    console.print(f"[yellow]    Missing m2ts file: {clip_name}.m2ts")
-                            except AttributeError as e:
-                                console.print(f"[bold red]Error accessing clip information for item in {file_name}: {e}")
-
-                        if not file_sizes:
-                            if meta.get('debug'):
-                                console.print(f"[yellow]  No m2ts files found for {file_name}")
-                            continue
-
-                        items = [{"file": file, "size": file_sizes[file]} for file in file_counts]
-                        total_size = sum(file_sizes.values())
-                        valid_playlists.append({
-                            "file": file_name,
-                            "duration": duration,
-                            "path": mpls_path,
-                            "items": items,
-                            "total_play_items": total_play_items,
-                        })
-
-                        if meta.get('debug'):
-                            duplicates = [f for f, c in file_counts.items() if c > 1]
-                            if duplicates:
-                                console.print(f"[green]  ✓ Added {file_name}: {duration:.1f}s, {len(file_sizes)} unique files ({len(duplicates)} files repeated), {total_size // (1024 * 1024)} MB total")
-                            else:
-                                console.print(f"[green]  ✓ Added {file_name}: {duration:.1f}s, {len(items)} unique files, {total_size // (1024 * 1024)} MB total")
-                    except Exception as e:
-                        console.print(f"[bold red]Error parsing playlist {mpls_path}: {e}")
+                # Durations, clips and sizes of every playlist, cached per disc while its PLAYLIST and STREAM folders are unchanged
+                valid_playlists: list[PlaylistInfo] = await asyncio.to_thread(disc_playlists, path, PlaylistIndex.from_meta(meta), bool(meta.get('debug')))
 
                 if not valid_playlists:
                     console.print(f"[bold red]No playlists found for disc {path}")
@@ -255,163 +209,248 @@ class DiscParse:
                                 except ValueError:
                                     console.print("[bold red]Invalid input. Please try again.")
 
-                for idx, playlist in enumerate(selected_playlists):
-                    console.print(f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds")
+                disc_scans: list[BdinfoScan] = []
+                for playlist in selected_playlists:
                     playlist_number = playlist['file'].replace(".mpls", "")
-                    playlist_report_path = os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")
+                    disc_scans.append(BdinfoScan(i, path, playlist, os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")))
+                selections.append((i, path, valid_playlists, selected_playlists, disc_scans))
 
-                    if os.path.exists(playlist_report_path):
-                        bdinfo_text = playlist_report_path
-                    else:
-                        try:
-                            bdinfo_executable = None
-                            # Prefer the bundled bdinfo binary for the detected OS/arch
-                            system = platform.system().lower()
-                            machine = platform.machine().lower()
-                            if system == "linux":
-                                if machine in ("x86_64", "amd64"):
-                                    folder = "linux/amd64"
-                                elif machine in ("arm64", "aarch64"):
-                                    folder = "linux/arm64"
-                                else:
-                                    folder = "linux/arm"
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, path, '-m', playlist['file'], save_dir]
-                            elif system == "darwin":
-                                folder = "macos/arm64" if machine in ("arm64",) else "macos/x86_64"
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, path, '-m', playlist['file'], save_dir]
-                            elif system == "windows":
-                                # Windows builds are provided as x64
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/windows/x86_64/bdinfo.exe"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, '-m', playlist['file'], path, save_dir]
-
-                            # Fallback to system-installed commands if bundled binary not present
-                            if bdinfo_executable is None:
-                                if shutil.which("bdinfo"):
-                                    bdinfo_executable = ["bdinfo", path, '-m', playlist['file'], save_dir]
-                                elif shutil.which("BDInfo"):
-                                    bdinfo_executable = ["BDInfo", path, '-m', playlist['file'], save_dir]
-                                else:
-                                    console.print(f"[bold red]BDInfo not found. Please download bdinfo and place it under {base_dir}/bin/bdinfo/ or install a system bdinfo/BDInfo binary[/bold red]")
-                                    continue
-
-                            if bdinfo_executable:
-                                proc = await asyncio.create_subprocess_exec(
-                                    *bdinfo_executable
-                                )
-                                await proc.wait()
-
-                                if proc.returncode != 0:
-                                    console.print(f"[bold red]BDInfo failed with return code {proc.returncode}[/bold red]")
-                                    continue
-
-                                # Rename the output to playlist_report_path
-                                for file in os.listdir(save_dir):
-                                    if file.startswith("BDINFO") and file.endswith(".txt"):
-                                        bdinfo_text = os.path.join(save_dir, file)
-                                        shutil.move(bdinfo_text, playlist_report_path)
-                                        bdinfo_text = playlist_report_path  # Update bdinfo_text to the renamed file
-                                        break
-                        except Exception as e:
-                            console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
-                            continue
+            else:
+                discs = meta_discs
 
-                    # Process the BDInfo report in the while True loop
-                    while True:
-                        try:
-                            if not os.path.exists(bdinfo_text):
-                                console.print(f"[bold red]No valid BDInfo file found for playlist {playlist_number}.")
-                                break
+        # Playlists of all discs are scanned at once, the reports are then read in disc and playlist order
+        await self._scan_playlists([scan for selection in selections for scan in selection[4]], base_dir, save_dir, meta)
 
-                            text = await asyncio.to_thread(Path(bdinfo_text).read_text, encoding="utf-8", errors="replace")
-                            result = text.split("QUICK SUMMARY:", 2)
-                            files = result[0].split("FILES:", 2)[1].split("CHAPTERS:", 2)[0].split("-------------")
-                            result2 = result[1].rstrip(" \n")
-                            result = result2.split("********************", 1)
-                            bd_summary = result[0].rstrip(" \n")
-
-                            result = text.split("[code]", 3)
-                            result2 = result[2].rstrip(" \n")
-                            result = result2.split("FILES:", 1)
-                            ext_bd_summary = result[0].rstrip(" \n")
-
-                            # Save summaries and bdinfo for each playlist
-                            if idx == 0:
-                                summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}.txt"
-                                extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}.txt"
-                            else:
-                                summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}_{idx}.txt"
-                                extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}_{idx}.txt"
-
-                            # Strip multiple spaces to single spaces before saving
-                            bd_summary_cleaned = re.sub(r' +', ' ', bd_summary.strip())
-                            ext_bd_summary_cleaned = re.sub(r' +', ' ', ext_bd_summary.strip())
-
-                            await asyncio.to_thread(Path(summary_file).write_text, bd_summary_cleaned, encoding="utf-8", errors="replace")
-                            await asyncio.to_thread(Path(extended_summary_file).write_text, ext_bd_summary_cleaned, encoding="utf-8", errors="replace")
-
-                            bdinfo = self.parse_bdinfo(bd_summary_cleaned, files[1], path)
-
-                            # Prompt user for custom edition if conditions are met
-                            if len(selected_playlists) > 1:
-                                current_label = bdinfo.get('label', f"Playlist {idx}")
-                                console.print(f"[bold yellow]Current label for playlist {playlist['file']}: {current_label}")
-
-                                if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
-                                    console.print("[bold green]You can create a custom Edition for this playlist.")
-                                    user_input_raw = cli_ui.ask_string(f"Enter a new Edition title for playlist {playlist['file']} (or press Enter to keep the current label): ")
-                                    user_input = (user_input_raw or "").strip()
-                                    if user_input:
-                                        bdinfo['edition'] = user_input
-                                        selected_playlists[idx]['edition'] = user_input
-                                        console.print(f"[bold green]Edition updated to: {bdinfo['edition']}")
-                                else:
-                                    console.print("[bold yellow]Unattended mode: Custom edition not added.")
-
-                            # Save to discs array
-                            if idx == 0:
-                                discs[i]['summary'] = bd_summary_cleaned
-                                discs[i]['bdinfo'] = bdinfo
-                                discs[i]['playlists'] = selected_playlists
-                                if valid_playlists and meta['unattended'] and not meta.get('unattended_confirm', False):
-                                    simplified_playlists: list[dict[str, Any]] = [{"file": p["file"], "duration": p["duration"]} for p in valid_playlists]
-                                    duration_map: dict[int, dict[str, Any]] = {}
-
-                                    # Store simplified version with only file and duration, keeping only one per unique duration
-                                    for playlist in valid_playlists:
-                                        rounded_duration = round(float(playlist["duration"]))
-                                        if rounded_duration in duration_map:
-                                            continue
-
-                                        duration_map[rounded_duration] = {
-                                            "file": playlist["file"],
-                                            "duration": playlist["duration"]
-                                        }
-
-                                    simplified_playlists = list(duration_map.values())
-                                    simplified_playlists.sort(key=lambda x: float(x["duration"]), reverse=True)
-                                    discs[i]['all_valid_playlists'] = simplified_playlists
-
-                                    if meta['debug']:
-                                        console.print(f"[cyan]Stored {len(simplified_playlists)} unique playlists by duration (from {len(valid_playlists)} total)")
+        for i, path, valid_playlists, selected_playlists, disc_scans in selections:
+            for idx, (playlist, scan) in enumerate(zip(selected_playlists, disc_scans)):
+                playlist_number = playlist['file'].replace(".mpls", "")
+                if not scan.ok:
+                    continue
+                bdinfo_text = scan.report_path
+
+                # Process the BDInfo report in the while True loop
+                while True:
+                    try:
+                        if not os.path.exists(bdinfo_text):
+                            console.print(f"[bold red]No valid BDInfo file found for playlist {playlist_number}.")
+                            break
+
+                        text = await asyncio.to_thread(Path(bdinfo_text).read_text, encoding="utf-8", errors="replace")
+                        result = text.split("QUICK SUMMARY:", 2)
+                        files = result[0].split("FILES:", 2)[1].split("CHAPTERS:", 2)[0].split("-------------")
+                        result2 = result[1].rstrip(" \n")
+                        result = result2.split("********************", 1)
+                        bd_summary = result[0].rstrip(" \n")
+
+                        result = text.split("[code]", 3)
+                        result2 = result[2].rstrip(" \n")
+                        result = result2.split("FILES:", 1)
+                        ext_bd_summary = result[0].rstrip(" \n")
+
+                        # Save summaries and bdinfo for each playlist
+                        if idx == 0:
+                            summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}.txt"
+                            extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}.txt"
+                        else:
+                            summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}_{idx}.txt"
+                            extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}_{idx}.txt"
+
+                        # Strip multiple spaces to single spaces before saving
+                        bd_summary_cleaned = re.sub(r' +', ' ', bd_summary.strip())
+                        ext_bd_summary_cleaned = re.sub(r' +', ' ', ext_bd_summary.strip())
+
+                        await asyncio.to_thread(Path(summary_file).write_text, bd_summary_cleaned, encoding="utf-8", errors="replace")
+                        await asyncio.to_thread(Path(extended_summary_file).write_text, ext_bd_summary_cleaned, encoding="utf-8", errors="replace")
+
+                        bdinfo = self.parse_bdinfo(bd_summary_cleaned, files[1], path)
+
+                        # Prompt user for custom edition if conditions are met
+                        if len(selected_playlists) > 1:
+                            current_label = bdinfo.get('label', f"Playlist {idx}")
+                            console.print(f"[bold yellow]Current label for playlist {playlist['file']}: {current_label}")
+
+                            if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
+                                console.print("[bold green]You can create a custom Edition for this playlist.")
+                                user_input_raw = cli_ui.ask_string(f"Enter a new Edition title for playlist {playlist['file']} (or press Enter to keep the current label): ")
+                                user_input = (user_input_raw or "").strip()
+                                if user_input:
+                                    bdinfo['edition'] = user_input
+                                    selected_playlists[idx]['edition'] = user_input
+                                    console.print(f"[bold green]Edition updated to: {bdinfo['edition']}")
                             else:
-                                discs[i][f'summary_{idx}'] = bd_summary_cleaned
-                                discs[i][f'bdinfo_{idx}'] = bdinfo
+                                console.print("[bold yellow]Unattended mode: Custom edition not added.")
+
+                        # Save to discs array
+                        if idx == 0:
+                            discs[i]['summary'] = bd_summary_cleaned
+                            discs[i]['bdinfo'] = bdinfo
+                            discs[i]['playlists'] = selected_playlists
+                            if valid_playlists and meta['unattended'] and not meta.get('unattended_confirm', False):
+                                simplified_playlists: list[dict[str, Any]] = [{"file": p["file"], "duration": p["duration"]} for p in valid_playlists]
+                                duration_map: dict[int, dict[str, Any]] = {}
+
+                                # Store simplified version with only file and duration, keeping only one per unique duration
+                                for playlist in valid_playlists:
+                                    rounded_duration = round(float(playlist["duration"]))
+                                    if rounded_duration in duration_map:
+                                        continue
+
+                                    duration_map[rounded_duration] = {
+                                        "file": playlist["file"],
+                                        "duration": playlist["duration"]
+                                    }
+
+                                simplified_playlists = list(duration_map.values())
+                                simplified_playlists.sort(key=lambda x: float(x["duration"]), reverse=True)
+                                discs[i]['all_valid_playlists'] = simplified_playlists
+
+                                if meta['debug']:
+                                    console.print(f"[cyan]Stored {len(simplified_playlists)} unique playlists by duration (from {len(valid_playlists)} total)")
+                        else:
+                            discs[i][f'summary_{idx}'] = bd_summary_cleaned
+                            discs[i][f'bdinfo_{idx}'] = bdinfo
 
-                        except Exception:
-                            console.print(traceback.format_exc())
-                            await asyncio.sleep(5)
-                            continue
-                        break
+                    except Exception:
+                        console.print(traceback.format_exc())
+                        await asyncio.sleep(5)
+                        continue
+                    break
+
+        return discs, discs[0]['bdinfo']
 
+    @staticmethod
+    def _bdinfo_command(base_dir: str, path: str, playlist_file: str, output_dir: str) -> Optional[list[str]]:
+        """Command line of a BDInfo scan of one playlist, or None when no BDInfo binary is available."""
+        # Prefer the bundled bdinfo binary for the detected OS/arch
+        system = platform.system().lower()
+        machine = platform.machine().lower()
+        if system == "linux":
+            if machine in ("x86_64", "amd64"):
+                folder = "linux/amd64"
+            elif machine in ("arm64", "aarch64"):
+                folder = "linux/arm64"
             else:
-                discs = meta_discs
+                folder = "linux/arm"
+            bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, path, '-m', playlist_file, output_dir]
+        elif system == "darwin":
+            folder = "macos/arm64" if machine in ("arm64",) else "macos/x86_64"
+            bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, path, '-m', playlist_file, output_dir]
+        elif system == "windows":
+            # Windows builds are provided as x64
+            bdinfo_path = f"{base_dir}/bin/bdinfo/windows/x86_64/bdinfo.exe"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, '-m', playlist_file, path, output_dir]
+
+        # Fallback to system-installed commands if bundled binary not present
+        for name in ("bdinfo", "BDInfo"):
+            if shutil.which(name):
+                return [name, path, '-m', playlist_file, output_dir]
+        return None
 
-        return discs, discs[0]['bdinfo']
+    async def _scan_playlists(self, scans: list[BdinfoScan], base_dir: str, save_dir: str, meta: dict[str, Any]) -> None:
+        """
+        Run BDInfo for every scan that has no report yet.
+
+        Scans run concurrently, limited per device by ``bdinfo_scans_per_device``
+        (discs on different disks run in parallel, discs on the same disk do not
+        compete for it) and to MAX_PARALLEL_BDINFO overall. Each scan writes into
+        its own directory before its report is moved to ``report_path``.
+        """
+        pending: dict[str, list[BdinfoScan]] = {}
+        for scan in scans:
+            if os.path.exists(scan.report_path):
+                scan.ok = True
+            else:
+                # The same playlist selected twice is scanned once
+                pending.setdefault(scan.report_path, []).append(scan)
+        if not pending:
+            return
+
+        command_probe = self._bdinfo_command(base_dir, "", "", "")
+        if command_probe is None:
+            console.print(f"[bold red]BDInfo not found. Please download bdinfo and place it under {base_dir}/bin/bdinfo/ or install a system bdinfo/BDInfo binary[/bold red]")
+            return
+
+        try:
+            per_device = max(1, int(self.config['DEFAULT'].get('bdinfo_scans_per_device', DEFAULT_BDINFO_SCANS_PER_DEVICE) or DEFAULT_BDINFO_SCANS_PER_DEVICE))
+        except (TypeError, ValueError):
+            per_device = DEFAULT_BDINFO_SCANS_PER_DEVICE
+        device_slots: dict[Any, asyncio.Semaphore] = {}
+        overall = asyncio.Semaphore(MAX_PARALLEL_BDINFO)
+        # With several scans at once their progress output would interleave, so it is only shown for a single scan
+        quiet = len(pending) > 1
+        total = len(pending)
+        done = 0
+        remaining_per_disc: defaultdict[int, int] = defaultdict(int)
+        disc_started: dict[int, float] = {}
+        for group in pending.values():
+            remaining_per_disc[group[0].disc_index] += 1
+
+        async def run(group: list[BdinfoScan]) -> None:
+            nonlocal done
+            scan = group[0]
+            playlist = scan.playlist
+            disc = scan.disc_index + 1
+            slot = device_slots.setdefault(_device_key(scan.path), asyncio.Semaphore(per_device))
+            async with slot, overall:
+                started = time.monotonic()
+                disc_started.setdefault(scan.disc_index, started)
+                console.print(f"[bold green]Disc {disc}: scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds")
+                output_dir = os.path.join(save_dir, f"bdinfo_disc{disc}_{os.path.splitext(playlist['file'])[0]}")
+                ok = False
+                try:
+                    os.makedirs(output_dir, exist_ok=True)
+                    command = self._bdinfo_command(base_dir, scan.path, playlist['file'], output_dir)
+                    if command is None:
+                        return
+                    proc = await asyncio.create_subprocess_exec(
+                        *command,
+                        stdout=asyncio.subprocess.DEVNULL if quiet else None,
+                        stderr=asyncio.subprocess.PIPE if quiet else None,
+                    )
+                    try:
+                        _stdout, stderr = await proc.communicate()
+                    except asyncio.CancelledError:
+                        with contextlib.suppress(ProcessLookupError):
+                            proc.kill()
+                        raise
+
+                    if proc.returncode != 0:
+                        console.print(f"[bold red]BDInfo failed with return code {proc.returncode} for disc {disc} playlist {playlist['file']}[/bold red]")
+                        if stderr:
+                            console.print(stderr.decode("utf-8", errors="replace").strip()[-2000:], markup=False)
+                        return
+
+                    # Rename the output to the report path
+                    for file in os.listdir(output_dir):
+                        if file.startswith("BDINFO") and file.endswith(".txt"):
+                            shutil.move(os.path.join(output_dir, file), scan.report_path)
+                            ok = True
+                            break
+                except Exception as e:
+                    console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
+                finally:
+                    shutil.rmtree(output_dir, ignore_errors=True)
+                    for each in group:
+                        each.ok = ok
+                    done += 1
+                    remaining_per_disc[scan.disc_index] -= 1
+                    finished = time.monotonic()
+                    console.print(f"[cyan]Disc {disc}: playlist {playlist['file']} {'scanned' if ok else 'failed'} in {finished - started:.1f}s ({done}/{total} scans done)")
+                    if remaining_per_disc[scan.disc_index] == 0:
+                        console.print(f"[green]Disc {disc}: all playlists done in {finished - disc_started[scan.disc_index]:.1f}s")
+
+        if meta.get('debug'):
+            devices = {_device_key(group[0].path) for group in pending.values()}
+            console.print(f"[cyan]Scanning {total} playlists on {len(devices)} device(s), {per_device} scan(s) per device")
+        started = time.monotonic()
+        await asyncio.gather(*(run(group) for group in pending.values()))
+        if total > 1:
+            console.print(f"[green]BDInfo scans finished in {time.monotonic() - started:.1f}s")
 
     def parse_bdinfo_files(self, files: str) -> list[dict[str, str]]:
         """
@@ -555,9 +594,7 @@ class DiscParse:
             path = each.get('path')
             if not isinstance(path, str) or not path:
                 continue
-            os.chdir(path)
-            files = glob("VTS_*.VOB")
-            files.sort()
+            files = sorted(os.path.basename(file) for file in glob(os.path.join(escape_glob(path), "VTS_*.VOB")))
             filesdict: OrderedDict[str, list[str]] = OrderedDict()
             main_set: list[str] = []
             for file in files:
@@ -569,7 +606,7 @@ class DiscParse:
 
             for vob_set in filesdict.values():
                 try:
-                    ifo_file = f"VTS_{vob_set[0][:2]}_0.IFO"
+                    ifo_file = os.path.join(path, f"VTS_{vob_set[0][:2]}_0.IFO")
 
                     try:
                         if mediainfo_binary:
@@ -635,7 +672,8 @@ class DiscParse:
                         process = await asyncio.create_subprocess_exec(
                             mediainfo_binary, vob_basename,
                             stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE
+                            stderr=asyncio.subprocess.PIPE,
+                            cwd=path
                         )
                         stdout, stderr = await process.communicate()
 
@@ -645,12 +683,12 @@ class DiscParse:
                             console.print("[yellow]Specialized MediaInfo failed for VOB, falling back[/yellow]")
                             if stderr:
                                 console.print(f"[red]MediaInfo stderr: {stderr.decode()}[/red]")
-                            vob_mi_output = MediaInfo.parse(vob_basename, output='STRING', full=False).replace('\r\n', '\n')
+                            vob_mi_output = _text_report(path, vob_basename)
                     else:
-                        vob_mi_output = MediaInfo.parse(vob_basename, output='STRING', full=False).replace('\r\n', '\n')
+                        vob_mi_output = _text_report(path, vob_basename)
                 except Exception as e:
                     console.print(f"[yellow]Error with DVD MediaInfo binary for VOB: {str(e)}")
-                    vob_mi_output = MediaInfo.parse(vob_basename, output='STRING', full=False).replace('\r\n', '\n')
+                    vob_mi_output = _text_report(path, vob_basename)
 
                 # Store VOB mediainfo (same output for both keys)
                 each['vob_mi'] = vob_mi_output
@@ -662,7 +700,8 @@ class DiscParse:
                         process = await asyncio.create_subprocess_exec(
                             mediainfo_binary, ifo_basename,
                             stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE
+                            stderr=asyncio.subprocess.PIPE,
+                            cwd=path
                         )
                         stdout, stderr = await process.communicate()
 
@@ -672,12 +711,12 @@ class DiscParse:
                             console.print("[yellow]Specialized MediaInfo failed for IFO, falling back[/yellow]")
                             if stderr:
                                 console.print(f"[red]MediaInfo stderr: {stderr.decode()}[/red]")
-                            ifo_mi_output = MediaInfo.parse(ifo_basename, output='STRING', full=False).replace('\r\n', '\n')
+                            ifo_mi_output = _text_report(path, ifo_basename)
                     else:
-                        ifo_mi_output = MediaInfo.parse(ifo_basename, output='STRING', full=False).replace('\r\n', '\n')
+                        ifo_mi_output = _text_report(path, ifo_basename)
                 except Exception as e:
                     console.print(f"[yellow]Error with DVD MediaInfo binary for IFO: {str(e)}")
-                    ifo_mi_output = MediaInfo.parse(ifo_basename, output='STRING', full=False).replace('\r\n', '\n')
+                    ifo_mi_output = _text_report(path, ifo_basename)
 
                 each['ifo_mi'] = ifo_mi_output
                 each['ifo_mi_full'] = ifo_mi_output
@@ -685,14 +724,15 @@ class DiscParse:
             except Exception as e:
                 console.print(f"[yellow]Error using DVD MediaInfo binary, falling back to standard: {e}")
                 # Fallback to standard MediaInfo using basenames
-                vob_mi_output = MediaInfo.parse(vob_basename, output='STRING', full=False).replace('\r\n', '\n')
-                ifo_mi_output = MediaInfo.parse(ifo_basename, output='STRING', full=False).replace('\r\n', '\n')
+                vob_mi_output = _text_report(path, vob_basename)
+                ifo_mi_output = _text_report(path, ifo_basename)
                 each['vob_mi'] = vob_mi_output
                 each['ifo_mi'] = ifo_mi_output
                 each['vob_mi_full'] = vob_mi_output
                 each['ifo_mi_full'] = ifo_mi_output
 
-            size = sum(os.path.getsize(f) for f in os.listdir('.') if os.path.isfile(f)) / float(1 << 30)
+            disc_files = [os.path.join(path, name) for name in os.listdir(path)]
+            size = sum(os.path.getsize(f) for f in disc_files if os.path.isfile(f)) / float(1 << 30)
             each['disc_size'] = round(size, 2)
             dvd_size = "DVD9"
             if size <= 4.37:
@@ -706,7 +746,6 @@ class DiscParse:
             path = each.get('path')
             if not isinstance(path, str) or not path:
                 continue
-            os.chdir(path)
 
             try:
                 # Define the playlist path
@@ -957,7 +996,7 @@ class DiscParse:
                 console.print(f"Playlist processing failed: {e}. Falling back to largest EVO file detection.")
 
                 # Fallback to largest .EVO file
-                files = glob("*.EVO")
+                files = glob(os.path.join(escape_glob(path), "*.EVO"))
                 if not files:
                     console.print("No EVO files found in the directory.")
                     continue
@@ -973,8 +1012,8 @@ class DiscParse:
                         size = file_size
 
                 # Generate MediaInfo for the largest EVO file
-                each['evo_mi'] = MediaInfo.parse(os.path.basename(largest), output='STRING', full=False)
-                each['largest_evo'] = os.path.abspath(f"{path}/{largest}")
+                each['evo_mi'] = _text_report(path, os.path.basename(largest), normalize_newlines=False)
+                each['largest_evo'] = os.path.abspath(largest)
 
         return discs
 
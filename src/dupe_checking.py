@@ -8,7 +8,6 @@ from typing_extensions import TypeAlias
 
 from cogs.redaction import Redaction
 from src.console import console
-from src.trackers.HUNO import HUNO
 
 Meta: TypeAlias = MutableMapping[str, Any]
 
@@ -378,6 +377,7 @@ class DupeChecker:
                     return False
 
             if tracker_name == "HUNO":
+                from src.trackers.HUNO import HUNO
                 huno = HUNO(config=self.config)
                 huno_name_result: Any = await huno.get_name(cast(dict[str, Any], meta))
                 huno_name_map = cast(dict[str, Any], huno_name_result)
@@ -3,19 +3,13 @@ import os
 import re
 from typing import Any, Callable, Optional, Union, cast
 
-import guessit
-
 from src.console import console
+from src.name_parsing import guessit_fn
 from src.region import get_distributor
 
-guessit_module: Any = cast(Any, guessit)
 GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
 
 
-def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-    return cast(dict[str, Any], guessit_module.guessit(value, options))
-
-
 async def get_edition(video: str, bdinfo: Optional[dict[str, Any]], filelist: list[str], manual_edition: Union[str, list[str]], meta: dict[str, Any]) -> tuple[str, str, bool]:
     edition = ""
     imdb_info = cast(dict[str, Any], meta.get('imdb_info', {}))
@@ -1,5 +1,6 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import functools
 import json
 import os
 import platform
@@ -11,6 +12,7 @@ import aiofiles
 from pymediainfo import MediaInfo
 
 from src.console import console
+from src.mediainfo_cache import MediaInfoCache
 
 
 def validate_file_path(file_path: str) -> str:
@@ -158,13 +160,109 @@ async def mi_resolution(
     return resolution
 
 
+@functools.cache
+def _library_version() -> str:
+    try:
+        lib, handle, version, _ = cast(Any, MediaInfo)._get_library()
+        lib.MediaInfo_Delete(handle)
+        return str(version)
+    except Exception:
+        return "unknown"
+
+
+def parse_text_and_json(video: str) -> tuple[str, str]:
+    """
+    The text report (``full=False``) and the JSON report (``full=True``) of ``video`` from one libmediainfo parse.
+
+    pymediainfo only renders one report per parse, so the library handle is driven directly with
+    the same options ``MediaInfo.parse`` uses. If that is not possible, it falls back to two parses.
+    """
+    try:
+        lib, handle, _, lib_version = cast(Any, MediaInfo)._get_library()
+    except Exception:
+        return MediaInfo.parse(video, output="STRING", full=False), MediaInfo.parse(video, output="JSON")
+
+    try:
+        if lib_version >= (18, 3):
+            lib.MediaInfo_Option(handle, "Cover_Data", "")
+        lib.MediaInfo_Option(handle, "CharSet", "UTF-8")
+        lib.MediaInfo_Option(handle, "ParseSpeed", "0.5")
+        lib.MediaInfo_Option(handle, "LegacyStreamDisplay", "")
+        if lib.MediaInfo_Open(handle, video) == 0:
+            if not os.path.exists(video):
+                raise FileNotFoundError(video)
+            raise RuntimeError(f"An error occured while opening {video} with libmediainfo")
+        # Inform and Complete only change how the parsed data is rendered, so both reports come from the same parse
+        lib.MediaInfo_Option(handle, "Inform", "STRING")
+        lib.MediaInfo_Option(handle, "Complete", "")
+        text = str(lib.MediaInfo_Inform(handle, 0))
+        lib.MediaInfo_Option(handle, "Inform", "JSON")
+        lib.MediaInfo_Option(handle, "Complete", "1")
+        json_text = str(lib.MediaInfo_Inform(handle, 0))
+    finally:
+        lib.MediaInfo_Close(handle)
+        lib.MediaInfo_Delete(handle)
+    return text, json_text
+
+
+async def _cli_report(mediainfo_cmd: str, video: str, as_json: bool, debug: bool) -> Optional[str]:
+    """Report from the specialized MediaInfo CLI, or None (after saying why) when the library has to be used instead."""
+    kind = "JSON" if as_json else "text"
+    result: Optional[subprocess.CompletedProcess[str]] = None
+    try:
+        # Validate and sanitize the video path
+        safe_video_path = validate_file_path(video)
+        safe_mediainfo_cmd = validate_file_path(mediainfo_cmd)
+        cmd = [safe_mediainfo_cmd, "--Output=JSON", safe_video_path] if as_json else [safe_mediainfo_cmd, safe_video_path]
+        result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
+
+        if result.returncode == 0 and result.stdout:
+            if as_json:
+                json.loads(result.stdout)
+            return result.stdout
+        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+
+    except subprocess.TimeoutExpired:
+        console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
+    except ValueError as e:
+        # json.JSONDecodeError is a ValueError as well
+        if isinstance(e, json.JSONDecodeError):
+            console.print(f"[bold red]Error getting JSON from specialized MediaInfo: {e}")
+            if debug and result is not None and result.stdout:
+                console.print(f"[red]Subprocess stdout preview: {result.stdout[:200]}...[/red]")
+        else:
+            console.print(f"[bold red]Path validation error: {e}[/bold red]")
+    except Exception as e:
+        console.print(f"[bold red]Error getting {kind} from specialized MediaInfo: {e}")
+        if debug and result is not None:
+            console.print(f"[red]Subprocess stderr: {result.stderr}[/red]")
+            console.print(f"[red]Subprocess returncode: {result.returncode}[/red]")
+    console.print(f"[bold yellow]Falling back to standard MediaInfo for {kind}...")
+    return None
+
+
+async def _parse_reports(video: str, mediainfo_cmd: Optional[str], debug: bool) -> tuple[str, str]:
+    """(text, json) reports of ``video``, from the specialized CLI when given and otherwise from one library parse."""
+    if mediainfo_cmd:
+        # The CLI renders one format per run. Both runs go at once so the second one reads from the page cache
+        text, json_text = await asyncio.gather(
+            _cli_report(mediainfo_cmd, video, False, debug),
+            _cli_report(mediainfo_cmd, video, True, debug),
+        )
+        if text is not None and json_text is not None:
+            return text, json_text
+        lib_text, lib_json = await asyncio.to_thread(parse_text_and_json, video)
+        return text if text is not None else lib_text, json_text if json_text is not None else lib_json
+    return await asyncio.to_thread(parse_text_and_json, video)
+
+
 async def exportInfo(
     video: str,
-    isdir: bool,
     folder_id: str,
     base_dir: str,
     is_dvd: bool = False,
     debug: bool = False,
+    cache: Optional[MediaInfoCache] = None,
 ) -> dict[str, Any]:
     def filter_mediainfo(data: dict[str, Any]) -> dict[str, Any]:
         media = data.get("media")
@@ -407,39 +505,20 @@ async def exportInfo(
 
     if debug:
         console.print("[bold yellow]Exporting MediaInfo...")
-    if not isdir:
-        os.chdir(os.path.dirname(video))
-
-    if mediainfo_cmd and is_dvd:
-        result = None
-        try:
-            # Validate and sanitize the video path
-            safe_video_path = validate_file_path(video)
-            safe_mediainfo_cmd = validate_file_path(mediainfo_cmd)
-            cmd = [safe_mediainfo_cmd, safe_video_path]
-            result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0 and result.stdout:
-                media_info = result.stdout
-            else:
-                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
 
-        except subprocess.TimeoutExpired:
-            console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
-            media_info = MediaInfo.parse(video, output="STRING", full=False)
-        except ValueError as e:
-            console.print(f"[bold red]Path validation error: {e}[/bold red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for text...")
-            media_info = MediaInfo.parse(video, output="STRING", full=False)
-        except (subprocess.CalledProcessError, Exception) as e:
-            console.print(f"[bold red]Error getting text from specialized MediaInfo: {e}")
-            if debug and result is not None:
-                console.print(f"[red]Subprocess stderr: {result.stderr}[/red]")
-                console.print(f"[red]Subprocess returncode: {result.returncode}[/red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for text...")
-            media_info = MediaInfo.parse(video, output="STRING", full=False)
+    cli_cmd = mediainfo_cmd if is_dvd else None
+    backend = f"cli:{cli_cmd}" if cli_cmd else f"lib:{_library_version()}"
+    # The key stats the files and the cache is SQLite, keep both off the event loop
+    cache_key = await asyncio.to_thread(MediaInfoCache.key, video, backend, is_dvd=is_dvd) if cache is not None else None
+    cached = await asyncio.to_thread(cache.get, cache_key) if cache is not None and cache_key is not None else None
+    if cached is not None:
+        media_info, media_info_json = cached
+        if debug:
+            console.print("[green]Using cached MediaInfo[/green]")
     else:
-        media_info = MediaInfo.parse(video, output="STRING", full=False)
+        media_info, media_info_json = await _parse_reports(video, cli_cmd, debug)
+        if cache is not None and cache_key is not None:
+            await asyncio.to_thread(cache.store, cache_key, media_info, media_info_json)
 
     # Filter out unwanted lines from media info regardless of type
     filtered_media_info = "\n".join(line for line in media_info.splitlines() if not line.strip().startswith("ReportBy") and not line.strip().startswith("Report created by "))
@@ -451,55 +530,13 @@ async def exportInfo(
     if debug:
         console.print("[bold green]MediaInfo Exported.")
 
-    if mediainfo_cmd and is_dvd:
-        result: Optional[subprocess.CompletedProcess[str]] = None
-        try:
-            # Validate and sanitize the video path
-            safe_video_path = validate_file_path(video)
-            safe_mediainfo_cmd = validate_file_path(mediainfo_cmd)
-            cmd = [safe_mediainfo_cmd, "--Output=JSON", safe_video_path]
-            result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0 and result.stdout:
-                media_info_json = result.stdout
-                media_info_dict = json.loads(media_info_json)
-            else:
-                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
-
-        except ValueError as e:
-            console.print(f"[bold red]Path validation error: {e}[/bold red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for JSON...")
-            media_info_json = MediaInfo.parse(video, output="JSON")
-            media_info_dict = json.loads(media_info_json)
-        except subprocess.TimeoutExpired:
-            console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
-            media_info_json = MediaInfo.parse(video, output="JSON")
-            media_info_dict = json.loads(media_info_json)
-        except (subprocess.CalledProcessError, json.JSONDecodeError, Exception) as e:
-            console.print(f"[bold red]Error getting JSON from specialized MediaInfo: {e}")
-            if debug and result is not None:
-                console.print(f"[red]Subprocess stderr: {result.stderr}[/red]")
-                console.print(f"[red]Subprocess returncode: {result.returncode}[/red]")
-                if result.stdout:
-                    console.print(f"[red]Subprocess stdout preview: {result.stdout[:200]}...[/red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for JSON...[/bold yellow]")
-            media_info_json = MediaInfo.parse(video, output="JSON")
-            media_info_dict = json.loads(media_info_json)
-    else:
-        # Use standard MediaInfo library for non-DVD or when specialized CLI not available
-        media_info_json = MediaInfo.parse(video, output="JSON")
-        media_info_dict = json.loads(media_info_json)
-
-    filtered_info = filter_mediainfo(media_info_dict)
+    mi = filter_mediainfo(cast(dict[str, Any], json.loads(media_info_json)))
 
     async with aiofiles.open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", "w", encoding="utf-8") as export:
-        await export.write(json.dumps(filtered_info, indent=4))
+        await export.write(json.dumps(mi, indent=4))
         if debug:
             console.print(f"[green]JSON file written to: {base_dir}/tmp/{folder_id}/MediaInfo.json[/green]")
 
-    async with aiofiles.open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", encoding="utf-8") as f:
-        mi = cast(dict[str, Any], json.loads(await f.read()))
-
     # Cleanup: Reset library configuration if we modified it
     if is_dvd and platform.system().lower() in ["linux", "windows"]:
         # Reset MediaInfo library file to default (Linux only)
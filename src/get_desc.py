@@ -9,12 +9,12 @@ from typing import Any, Union, cast
 from urllib.parse import ParseResult
 
 import aiofiles
-import httpx
 from jinja2 import Template
 from pymediainfo import MediaInfo
 
 from src.bbcode import BBCODE
 from src.console import console
+from src.http_pool import pooled_client
 from src.languages import languages_manager
 from src.takescreens import TakeScreensManager
 from src.trackers.COMMON import COMMON
@@ -148,7 +148,7 @@ async def gen_desc(
                 path=f"{split[0]}/raw/{split[1]}" if split[0] != "/" else f"/raw{parsed.path}"
             )
             raw_url = urllib.parse.urlunparse(raw)
-            async with httpx.AsyncClient(timeout=20.0) as client:
+            async with pooled_client(timeout=20.0) as client:
                 response = await client.get(raw_url)
             description_link_content = response.text
             cleaned_content = clean_text(description_link_content)
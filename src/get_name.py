@@ -5,22 +5,17 @@ import sys
 from collections.abc import MutableMapping, Sequence
 from typing import Any, Callable, Optional, cast
 
-import anitopy
 import cli_ui
-import guessit
 from typing_extensions import TypeAlias
 
 from src.cleanup import cleanup_manager
 from src.console import console
+from src.name_parsing import anitopy_parse, guessit_fn
 from src.trackers.COMMON import COMMON
 
-guessit_module: Any = cast(Any, guessit)
 GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
 
 
-def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-    return cast(dict[str, Any], guessit_module.guessit(value, options))
-
 TRACKER_DISC_REQUIREMENTS = {
     'ULCX': {'region': 'mandatory', 'distributor': 'mandatory'},
     'SHRI': {'region': 'mandatory', 'distributor': 'optional'},
@@ -263,7 +258,7 @@ class NameManager:
         # lets do some subsplease handling
         if 'subsplease' in folder_name.lower():
             guess_data = guessit_fn(folder_name, {"excludes": ["country", "language"]})
-            parsed = cast(Optional[dict[str, Any]], cast(Any, anitopy).parse(cast(str, guess_data.get('title', ''))))
+            parsed = cast(Optional[dict[str, Any]], anitopy_parse(cast(str, guess_data.get('title', ''))))
             parsed_title = parsed.get('anime_title') if parsed else None
             if parsed_title:
                 return str(parsed_title), None, None
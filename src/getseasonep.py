@@ -8,22 +8,16 @@ from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Any, Callable, Optional, cast
 
-import anitopy
-import guessit
-import httpx
-
 from src.console import console
 from src.exceptions import *  # noqa: F403
+from src.http_pool import pooled_client
+from src.name_parsing import anitopy_parse, guessit_batch, guessit_fn
 from src.tags import get_tag
 from src.tmdb import TmdbManager
 
-guessit_module: Any = cast(Any, guessit)
 GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
 
 
-def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-    return cast(dict[str, Any], guessit_module.guessit(value, options))
-
 Meta = dict[str, Any]
 
 
@@ -32,8 +26,7 @@ def _guessit_data(value: str, options: Optional[dict[str, Any]] = None) -> dict[
 
 
 def _anitopy_parse(value: str) -> dict[str, Any]:
-    anitopy_any = cast(Any, anitopy)
-    return cast(dict[str, Any], anitopy_any.parse(value) or {})
+    return anitopy_parse(value)
 
 
 def _safe_int(value: Any, default: int = 0) -> int:
@@ -224,7 +217,7 @@ class SeasonEpisodeManager:
                                     'absolute': str(episode_int),
                                 }
                                 url = "https://thexem.info/map/single"
-                                async with httpx.AsyncClient(timeout=30.0) as client:
+                                async with pooled_client(timeout=30.0) as client:
                                     response = (await client.post(url, params=params)).json()
                                 if response['result'] == "failure":
                                     raise XEMNotFound  # noqa: F405
@@ -239,7 +232,7 @@ class SeasonEpisodeManager:
                                 season_int = 1  # Default to 1 if error occurs
                                 season = "S01"
                                 names_url = f"https://thexem.info/map/names?origin=tvdb&id={str(meta['tvdb_id'])}"
-                                async with httpx.AsyncClient(timeout=30.0) as client:
+                                async with pooled_client(timeout=30.0) as client:
                                     names_response = (await client.get(names_url)).json()
                                 if meta['debug']:
                                     console.log(f'[cyan]Matching Season Number from TheXEM\n{names_response}')
@@ -426,6 +419,11 @@ class SeasonEpisodeManager:
         except (TypeError, ValueError):
             default_season_num = 1
 
+        if meta.get('is_disc') == "BDMV":
+            # get_tag skips its regex for BDMV and always falls back to guessit, parse the whole pack at once so the
+            # per-file lookups hit the cache. Other discs usually match the regex and never reach guessit
+            await guessit_batch(files)
+
         for file_path in files:
             filename = os.path.basename(file_path)
 
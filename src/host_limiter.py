@@ -0,0 +1,231 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Adaptive concurrency and rate control for image hosts.
+
+Every image host gets a limiter that decides how many uploads run against it
+at once. The limit starts from the value learned on earlier runs (or the
+configured default), grows by one after a full window of fast, successful
+uploads and is halved when the host pushes back with a 429, a 5xx or a
+timeout. A Retry-After header pauses the host for that long, otherwise
+retries back off exponentially with jitter.
+
+Learned limits are kept in ``data/cache/image_host_limits.json``, and
+per host throughput counters are available for the debug output.
+"""
+import asyncio
+import contextlib
+import email.utils
+import json
+import os
+import random
+import time
+import weakref
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from src.console import console
+
+DEFAULT_CONCURRENCY = 6
+DEFAULT_MAX_CONCURRENCY = 12
+# Starting points for hosts with known limits, and hard caps for hosts that only allow a few parallel uploads
+HOST_DEFAULTS = {"onlyimage": 6, "ptscreens": 6, "passtheimage": 6, "lensdump": 1}
+HOST_MAX_CONCURRENCY = {"lensdump": 1}
+
+# Growth stops once latency is this much worse than the best seen for the host
+LATENCY_TOLERANCE = 1.5
+MAX_BACKOFF = 60.0
+THROTTLE_STATUS = (429, 502, 503, 504)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header holding either seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+@dataclass
+class HostStats:
+    uploads: int = 0
+    failures: int = 0
+    throttled: int = 0
+    bytes_sent: int = 0
+    busy_seconds: float = 0.0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    @property
+    def images_per_second(self) -> float:
+        return self.uploads / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class HostLimiter:
+    def __init__(self, host: str, limit: int, max_limit: int) -> None:
+        self.host = host
+        self.max_limit = max(1, max_limit)
+        self.limit = min(max(1, limit), self.max_limit)
+        self.active = 0
+        self.blocked_until = 0.0
+        self.stats = HostStats()
+        self._successes = 0
+        self._latency: Optional[float] = None
+        self._best_latency: Optional[float] = None
+        self._released: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Event] = weakref.WeakKeyDictionary()
+
+    def _event(self) -> asyncio.Event:
+        return self._released.setdefault(asyncio.get_running_loop(), asyncio.Event())
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free upload slot on this host and for any Retry-After pause to pass."""
+        released = self._event()
+        while True:
+            pause = self.blocked_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            if self.active < self.limit:
+                break
+            released.clear()
+            await released.wait()
+        self.active += 1
+        now = time.monotonic()
+        if self.stats.started is None:
+            self.stats.started = now
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.stats.finished = time.monotonic()
+            self.stats.busy_seconds += self.stats.finished - now
+            released.set()
+
+    def record_success(self, latency: float, nbytes: int) -> None:
+        self.stats.uploads += 1
+        self.stats.bytes_sent += nbytes
+        self._latency = latency if self._latency is None else 0.7 * self._latency + 0.3 * latency
+        if self._best_latency is None or self._latency < self._best_latency:
+            self._best_latency = self._latency
+        self._successes += 1
+        # Grow by one after a whole window at the current limit went through without the host slowing down
+        if self._successes >= self.limit and self._latency <= LATENCY_TOLERANCE * self._best_latency:
+            if self.limit < self.max_limit:
+                self.limit += 1
+            self._successes = 0
+
+    def record_failure(self) -> None:
+        self.stats.failures += 1
+        self._successes = 0
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        """The host answered 429/5xx or timed out: halve the limit and pause the host if it asked for it."""
+        self.stats.throttled += 1
+        self._successes = 0
+        self.limit = max(1, self.limit // 2)
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + min(retry_after, MAX_BACKOFF))
+
+    def retry_delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt``: the Retry-After pause if one is set, otherwise exponential backoff with jitter."""
+        pause = self.blocked_until - time.monotonic()
+        if pause > 0:
+            return pause
+        return min(MAX_BACKOFF, 2.0 ** (attempt - 1)) * random.uniform(0.75, 1.25)  # nosec B311 - jitter
+
+    def summary(self) -> str:
+        stats = self.stats
+        return (
+            f"{self.host}: {stats.uploads} uploaded, {stats.failures} failed, {stats.throttled} throttled, "
+            f"limit {self.limit}, {stats.images_per_second:.2f} images/s, {stats.bytes_per_second / 1024 / 1024:.1f} MiB/s"
+        )
+
+
+class HostLimiters:
+    """The limiters of all image hosts, with learned limits persisted between runs."""
+
+    def __init__(self) -> None:
+        self.path: Optional[str] = None
+        self.default_limit = DEFAULT_CONCURRENCY
+        self.max_limit = DEFAULT_MAX_CONCURRENCY
+        self._limiters: dict[str, HostLimiter] = {}
+        self._learned: dict[str, int] = {}
+
+    def configure(self, config: Mapping[str, Any], base_dir: str) -> None:
+        default_section = config.get('DEFAULT', {})
+        default_config: Mapping[str, Any] = default_section if isinstance(default_section, Mapping) else {}
+        try:
+            self.default_limit = max(1, int(default_config.get('image_upload_concurrency', DEFAULT_CONCURRENCY) or DEFAULT_CONCURRENCY))
+        except (TypeError, ValueError):
+            self.default_limit = DEFAULT_CONCURRENCY
+        try:
+            self.max_limit = max(1, int(default_config.get('image_upload_max_concurrency', DEFAULT_MAX_CONCURRENCY) or DEFAULT_MAX_CONCURRENCY))
+        except (TypeError, ValueError):
+            self.max_limit = DEFAULT_MAX_CONCURRENCY
+        path = os.path.join(base_dir, "data", "cache", "image_host_limits.json")
+        if path != self.path:
+            self.path = path
+            self._limiters.clear()
+            self._learned = self._load()
+
+    def _load(self) -> dict[str, int]:
+        if not self.path or not os.path.isfile(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {str(host): int(limit) for host, limit in data.items()}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            console.print(f"[yellow]Could not read learned image host limits: {e}")
+            return {}
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        learned = dict(self._learned)
+        learned.update({host: limiter.limit for host, limiter in self._limiters.items()})
+        if learned == self._learned and os.path.isfile(self.path):
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(learned, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._learned = learned
+        except OSError as e:
+            console.print(f"[yellow]Could not save learned image host limits: {e}")
+
+    def get(self, host: str) -> HostLimiter:
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            max_limit = min(self.max_limit, HOST_MAX_CONCURRENCY.get(host, self.max_limit))
+            start = self._learned.get(host, HOST_DEFAULTS.get(host, self.default_limit))
+            limiter = HostLimiter(host, start, max_limit)
+            self._limiters[host] = limiter
+        return limiter
+
+    def summary(self) -> list[str]:
+        return [limiter.summary() for limiter in self._limiters.values() if limiter.stats.uploads or limiter.stats.failures]
+
+
+host_limiters = HostLimiters()
@@ -0,0 +1,261 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Shared, pooled HTTP connections.
+
+``pooled_client()`` is a drop in replacement for ``httpx.AsyncClient()``. The
+client it returns is as cheap to create as before and keeps its own headers,
+cookies, timeout and redirect settings, but sends every request through one
+shared transport that keeps a connection pool per host. Connections (and their
+TCP/TLS handshakes) are reused across clients, trackers and image hosts, and
+HTTP/2 is used when the optional ``h2`` package is installed.
+
+Closing a pooled client leaves the shared connections open. They are closed by
+``close_http_pool()``, which ``cleanup_manager.cleanup()`` calls.
+
+Large request bodies (screenshots, torrents) are sent from open files with
+``open_for_upload()``, which httpx streams in 64 KiB chunks, and
+``upload_slot()`` caps how many upload bytes are in flight at once.
+"""
+import asyncio
+import contextlib
+import contextvars
+import importlib.util
+import time
+import weakref
+from collections.abc import AsyncIterator, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Optional
+
+import httpx
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_UPLOAD_INFLIGHT_MB = 64
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+HostKey = tuple[str, str, Optional[int]]
+
+
+@dataclass
+class HttpPoolStats:
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    handshake_seconds: float = 0.0
+
+    @property
+    def average_handshake(self) -> float:
+        return self.handshake_seconds / self.new_connections if self.new_connections else 0.0
+
+    @property
+    def handshake_seconds_saved(self) -> float:
+        # Every reused connection skipped a handshake of about the average measured cost
+        return self.reused_connections * self.average_handshake
+
+
+@dataclass
+class ResponseLog:
+    """Status codes and Retry-After headers of the responses received while it is being tracked."""
+    statuses: list[int] = field(default_factory=list)
+    retry_after: Optional[str] = None
+
+
+_response_log: contextvars.ContextVar[Optional[ResponseLog]] = contextvars.ContextVar("_response_log", default=None)
+
+
+class _RequestTrace:
+    """httpcore trace hook for one request: records whether a connection was opened and how long that took."""
+
+    def __init__(self) -> None:
+        self.connect_started: Optional[float] = None
+        self.connect_seconds = 0.0
+
+    async def __call__(self, event_name: str, info: Mapping[str, Any]) -> None:  # noqa: ARG002 - httpcore trace signature
+        if event_name == "connection.connect_tcp.started":
+            self.connect_started = time.perf_counter()
+        elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete") and self.connect_started is not None:
+            self.connect_seconds = time.perf_counter() - self.connect_started
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """Routes requests to one pooled ``AsyncHTTPTransport`` per host and event loop."""
+
+    def __init__(self, max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST, keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY) -> None:
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.stats = HttpPoolStats()
+        self.host_stats: dict[str, HttpPoolStats] = {}
+        # Connections belong to the event loop that opened them, so pools are kept per loop
+        self._pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[HostKey, httpx.AsyncHTTPTransport]] = weakref.WeakKeyDictionary()
+
+    def _transport_for(self, url: httpx.URL) -> httpx.AsyncHTTPTransport:
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        key: HostKey = (url.scheme, url.host, url.port)
+        transport = pools.get(key)
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_host,
+                    max_keepalive_connections=self.max_connections_per_host,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+            pools[key] = transport
+        return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport = self._transport_for(request.url)
+        trace = _RequestTrace()
+        outer_trace = request.extensions.get("trace")
+        if outer_trace is None:
+            request.extensions["trace"] = trace
+        else:
+            async def chained(event_name: str, info: Mapping[str, Any]) -> None:
+                await trace(event_name, info)
+                await outer_trace(event_name, info)
+            request.extensions["trace"] = chained
+
+        response = await transport.handle_async_request(request)
+
+        log = _response_log.get()
+        if log is not None:
+            log.statuses.append(response.status_code)
+            retry_after = response.headers.get("retry-after")
+            if retry_after:
+                log.retry_after = retry_after
+
+        host = request.url.host
+        for stats in (self.stats, self.host_stats.setdefault(host, HttpPoolStats())):
+            stats.requests += 1
+            if trace.connect_started is None:
+                stats.reused_connections += 1
+            else:
+                stats.new_connections += 1
+                stats.handshake_seconds += trace.connect_seconds
+        return response
+
+    async def aclose(self) -> None:
+        # Clients closing their transport must not tear down the shared pools
+        return None
+
+    async def close_pools(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        pools = self._pools.pop(loop, {})
+        for transport in pools.values():
+            # One broken pool must not keep the others open
+            with contextlib.suppress(Exception):
+                await transport.aclose()
+
+
+@dataclass
+class _LoopBudget:
+    in_flight: int = 0
+    released: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class ByteBudget:
+    """
+    Caps the upload bytes in flight at once. A body larger than the whole budget
+    still goes, but only once nothing else is in flight. Like the connection
+    pools, the budget is kept per event loop.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.peak = 0
+        self._loops: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopBudget] = weakref.WeakKeyDictionary()
+
+    @contextlib.asynccontextmanager
+    async def reserve(self, nbytes: int) -> AsyncIterator[None]:
+        state = self._loops.setdefault(asyncio.get_running_loop(), _LoopBudget())
+        nbytes = max(0, nbytes)
+        while state.in_flight and state.in_flight + nbytes > self.limit:
+            state.released.clear()
+            await state.released.wait()
+        state.in_flight += nbytes
+        self.peak = max(self.peak, state.in_flight)
+        try:
+            yield
+        finally:
+            state.in_flight -= nbytes
+            state.released.set()
+
+
+shared_transport = SharedTransport()
+upload_budget = ByteBudget(DEFAULT_UPLOAD_INFLIGHT_MB * 1024 * 1024)
+
+
+def configure_http_pool(config: Mapping[str, Any]) -> None:
+    default_section = config.get('DEFAULT', {})
+    default_config: Mapping[str, Any] = default_section if isinstance(default_section, Mapping) else {}
+    try:
+        shared_transport.max_connections_per_host = max(1, int(default_config.get('http_max_connections_per_host', DEFAULT_MAX_CONNECTIONS_PER_HOST) or DEFAULT_MAX_CONNECTIONS_PER_HOST))
+    except (TypeError, ValueError):
+        shared_transport.max_connections_per_host = DEFAULT_MAX_CONNECTIONS_PER_HOST
+    try:
+        shared_transport.keepalive_expiry = float(default_config.get('http_keepalive_expiry', DEFAULT_KEEPALIVE_EXPIRY))
+    except (TypeError, ValueError):
+        shared_transport.keepalive_expiry = DEFAULT_KEEPALIVE_EXPIRY
+    try:
+        upload_budget.limit = max(1, int(default_config.get('http_upload_inflight_mb', DEFAULT_UPLOAD_INFLIGHT_MB) or DEFAULT_UPLOAD_INFLIGHT_MB)) * 1024 * 1024
+    except (TypeError, ValueError):
+        upload_budget.limit = DEFAULT_UPLOAD_INFLIGHT_MB * 1024 * 1024
+
+
+def pooled_client(**kwargs: Any) -> httpx.AsyncClient:
+    """An ``httpx.AsyncClient`` built with the given settings on top of the shared connection pools."""
+    return httpx.AsyncClient(transport=shared_transport, **kwargs)
+
+
+@contextlib.contextmanager
+def track_responses() -> Iterator[ResponseLog]:
+    """Record the responses of pooled requests made in this context, including tasks created inside it."""
+    log = ResponseLog()
+    token = _response_log.set(log)
+    try:
+        yield log
+    finally:
+        _response_log.reset(token)
+
+
+def upload_slot(nbytes: int) -> contextlib.AbstractAsyncContextManager[None]:
+    """Wait until ``nbytes`` more upload bytes fit in the in-flight budget and hold them for the duration."""
+    return upload_budget.reserve(nbytes)
+
+
+@contextlib.asynccontextmanager
+async def open_for_upload(path: str) -> AsyncIterator[BinaryIO]:
+    """
+    ``path`` opened for a multipart upload. httpx streams file objects in chunks
+    and seeks back to the start when a request is retried, so the file is never
+    read into memory as a whole.
+    """
+    file = await asyncio.to_thread(open, path, "rb")
+    try:
+        yield file
+    finally:
+        file.close()
+
+
+async def close_http_pool() -> None:
+    """Close the shared connections of the running event loop. New requests open fresh pools."""
+    await shared_transport.close_pools()
+
+
+def http_pool_stats() -> HttpPoolStats:
+    return shared_transport.stats
+
+
+def http_pool_summary() -> str:
+    stats = shared_transport.stats
+    return (
+        f"HTTP pool: {stats.requests} requests, {stats.new_connections} new connections, "
+        f"{stats.reused_connections} reused, ~{stats.handshake_seconds_saved:.2f}s of handshakes saved"
+        f"{' (HTTP/2 enabled)' if HTTP2_AVAILABLE else ''}, "
+        f"peak upload bytes in flight {upload_budget.peak / 1024 / 1024:.1f} MiB"
+    )
@@ -0,0 +1,137 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Persistent cache of uploaded image URLs.
+
+Every successful screenshot upload is recorded under the SHA-256 of the image
+file and the image host (with the server URL for self-hosted hosts), so the same PNG is not pushed to the same host again:
+re-runs, ``--retake`` of frames that came out identical and rehosting for
+trackers that need a different host all reuse the earlier upload.
+
+Entries expire after ``image_url_cache_days``. Because hosts may delete images
+earlier, an entry that was not confirmed recently is checked with a request to
+its raw URL before it is reused, and dropped when the host answers that the
+image is gone.
+"""
+import asyncio
+import hashlib
+import sqlite3
+import time
+from collections.abc import Mapping
+from typing import Any, Optional
+
+import httpx
+
+from src.console import console
+from src.http_pool import pooled_client
+from src.sqlite_cache import SQLiteCache
+
+DAY = 24 * 3600.0
+DEFAULT_TTL_DAYS = 90
+# Entries confirmed within this time are reused without asking the host
+LIVENESS_INTERVAL = DAY
+# Answers meaning the image no longer exists
+GONE_STATUS = (404, 410)
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageUrlCache(SQLiteCache):
+    file_name = "image_urls.sqlite3"
+    schema = (
+        "CREATE TABLE IF NOT EXISTS urls ("
+        " content_hash TEXT NOT NULL, host TEXT NOT NULL,"
+        " img_url TEXT NOT NULL, raw_url TEXT NOT NULL, web_url TEXT NOT NULL,"
+        " uploaded REAL NOT NULL, checked REAL NOT NULL,"
+        " PRIMARY KEY (content_hash, host))",
+    )
+    label = "image URL cache"
+
+    def __init__(self, db_path: str, ttl_days: float = DEFAULT_TTL_DAYS) -> None:
+        super().__init__(db_path)
+        self.ttl = ttl_days * DAY
+
+    @classmethod
+    def from_meta(cls, meta: Mapping[str, Any]) -> Optional["ImageUrlCache"]:
+        if not meta.get('image_url_cache', True):
+            return None
+        try:
+            ttl_days = float(meta.get('image_url_cache_days') or DEFAULT_TTL_DAYS)
+        except (TypeError, ValueError):
+            ttl_days = DEFAULT_TTL_DAYS
+        if ttl_days <= 0:
+            return None
+        return cls(cls.meta_path(meta), ttl_days)
+
+    def _get(self, content_hash: str, host: str) -> Optional[tuple[str, str, str, float, float]]:
+        def query(conn: sqlite3.Connection) -> Optional[tuple[str, str, str, float, float]]:
+            row = conn.execute(
+                "SELECT img_url, raw_url, web_url, uploaded, checked FROM urls WHERE content_hash = ? AND host = ?",
+                (content_hash, host),
+            ).fetchone()
+            if row is None:
+                return None
+            return str(row[0]), str(row[1]), str(row[2]), float(row[3]), float(row[4])
+
+        return self.read(query, None)
+
+    def _execute(self, sql: str, params: tuple[Any, ...]) -> None:
+        def update(conn: sqlite3.Connection) -> None:
+            conn.execute(sql, params)
+
+        self.write(update)
+
+    async def lookup(self, content_hash: str, host: str, debug: bool = False) -> Optional[dict[str, str]]:
+        """The URLs of an earlier upload of this content to ``host`` that is still usable."""
+        # SQLite is synchronous, every query runs in a worker thread
+        entry = await asyncio.to_thread(self._get, content_hash, host)
+        if entry is None:
+            return None
+        img_url, raw_url, web_url, uploaded, checked = entry
+        now = time.time()
+        if now - uploaded > self.ttl:
+            await self.forget(content_hash, host)
+            return None
+        if now - checked > LIVENESS_INTERVAL:
+            if not await is_alive(raw_url):
+                if debug:
+                    console.print(f"[yellow]Cached image {raw_url} is gone from {host}, uploading again[/yellow]")
+                await self.forget(content_hash, host)
+                return None
+            await asyncio.to_thread(self._execute, "UPDATE urls SET checked = ? WHERE content_hash = ? AND host = ?", (now, content_hash, host))
+        return {'img_url': img_url, 'raw_url': raw_url, 'web_url': web_url}
+
+    async def store(self, content_hash: str, host: str, img_url: str, raw_url: str, web_url: str) -> None:
+        now = time.time()
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO urls (content_hash, host, img_url, raw_url, web_url, uploaded, checked) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (content_hash, host, img_url, raw_url, web_url, now, now),
+        )
+        # Expired entries are dropped whenever something new is stored
+        await asyncio.to_thread(self._execute, "DELETE FROM urls WHERE uploaded < ?", (now - self.ttl,))
+
+    async def forget(self, content_hash: str, host: str) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM urls WHERE content_hash = ? AND host = ?", (content_hash, host))
+
+
+async def is_alive(url: str) -> bool:
+    """
+    Whether ``url`` still serves an image. Only a definite "gone" answer counts as dead,
+    hosts that refuse HEAD requests or hotlinking are given the benefit of the doubt.
+    A request that fails outright counts as dead, since an upload is the safe fallback.
+    """
+    try:
+        async with pooled_client(follow_redirects=True, timeout=10) as client:
+            response = await client.head(url)
+            if response.status_code == 405:
+                async with client.stream("GET", url, headers={"Range": "bytes=0-0"}) as streamed:
+                    return streamed.status_code not in GONE_STATUS
+            return response.status_code not in GONE_STATUS
+    except httpx.HTTPError:
+        return False
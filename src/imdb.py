@@ -7,23 +7,17 @@ from datetime import datetime, timezone
 from difflib import SequenceMatcher
 from typing import Any, Callable, Optional, Union, cast
 
-import anitopy
 import cli_ui
-import guessit
 import httpx
 
 from src.cleanup import cleanup_manager
 from src.console import console
+from src.metadata_cache import metadata_client
+from src.name_parsing import anitopy_parse, guessit_fn
 
-anitopy_parse_fn: Any = cast(Any, anitopy).parse
-guessit_module: Any = cast(Any, guessit)
 GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
 
 
-def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-    return cast(dict[str, Any], guessit_module.guessit(value, options))
-
-
 class ImdbManager:
     def safe_get(self, data: Any, path: list[str], default: Any = None) -> Any:
         for key in path:
@@ -268,7 +262,7 @@ class ImdbManager:
             """
         }
 
-        async with httpx.AsyncClient() as client:
+        async with metadata_client() as client:
             try:
                 response = await client.post(
                     "https://api.graphql.imdb.com/",
@@ -574,7 +568,7 @@ class ImdbManager:
             }
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with metadata_client() as client:
                     response = await client.post(url, json=query, headers={"Content-Type": "application/json"}, timeout=10)
                     response.raise_for_status()
                     data = response.json()
@@ -637,7 +631,7 @@ class ImdbManager:
         if not search_results:
             try:
                 parsed = guessit_fn(untouched_filename or "", {"excludes": ["country", "language"]})
-                parsed_title_data = cast(dict[str, Any], anitopy_parse_fn(parsed.get('title', '')) or {})
+                parsed_title_data = cast(dict[str, Any], anitopy_parse(parsed.get('title', '')) or {})
                 parsed_title = str(parsed_title_data.get('anime_title', ''))
                 if debug:
                     console.print(f"[bold yellow]Trying IMDB with parsed title: {parsed_title}[/bold yellow]")
@@ -944,7 +938,7 @@ class ImdbManager:
             """
         }
 
-        async with httpx.AsyncClient() as client:
+        async with metadata_client() as client:
             try:
                 response = await client.post(
                     "https://api.graphql.imdb.com/",
@@ -11,10 +11,10 @@ from pathlib import Path
 from typing import Any, Union, cast
 
 import aiofiles
-import httpx
 from torf import Torrent
 
 from src.console import console
+from src.http_pool import pooled_client
 from src.uploadscreens import UploadScreensManager
 
 
@@ -50,7 +50,7 @@ class ManualPackageManager:
             poster_img = f"{meta['base_dir']}/tmp/{meta['uuid']}/POSTER.png"
             if meta.get('poster') not in ['', None] and not os.path.exists(poster_img):
                 if meta.get('rehosted_poster') is None:
-                    async with httpx.AsyncClient(timeout=30.0) as client:
+                    async with pooled_client(timeout=30.0) as client:
                         response = await client.get(meta['poster'])
                     if response.status_code == 200:
                         console.print("[bold yellow]Rehosting Poster")
@@ -101,7 +101,7 @@ class ManualPackageManager:
                 files = {
                     "files[]": (f"{meta['title']}.tar", tar_bytes)
                 }
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with pooled_client(timeout=30.0) as client:
                     response = (await client.post("https://uguu.se/upload.php", files=files)).json()
                 if meta['debug']:
                     console.print(f"[cyan]{response}")
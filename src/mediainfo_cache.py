@@ -0,0 +1,89 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Persistent cache of MediaInfo reports.
+
+The text and JSON reports of a file are stored together in a small SQLite
+database under ``data/cache``, keyed by the path that was parsed, the identity
+(real path, size, mtime, inode) of every file the report depends on and the
+MediaInfo build that produced it. Running again on unchanged content skips
+parsing the container. For DVDs, every file of the title set is part of the
+identity, since MediaInfo reads the VOBs behind the IFO.
+
+The database is capped in size and trimmed least recently used first.
+"""
+import hashlib
+import os
+import sqlite3
+import time
+from collections.abc import Mapping
+from typing import Any, Optional
+
+from src.sqlite_cache import SQLiteCache
+
+DEFAULT_CACHE_SIZE_MB = 64
+
+
+def _key(*parts: Any) -> str:
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+class MediaInfoCache(SQLiteCache):
+    file_name = "mediainfo.sqlite3"
+    schema = (
+        "CREATE TABLE IF NOT EXISTS reports ("
+        " key TEXT PRIMARY KEY, text TEXT NOT NULL, json TEXT NOT NULL, last_used REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS reports_last_used ON reports (last_used)",
+    )
+    label = "MediaInfo cache"
+
+    def __init__(self, db_path: str, max_bytes: int = DEFAULT_CACHE_SIZE_MB * 1024 * 1024) -> None:
+        super().__init__(db_path)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_meta(cls, meta: Mapping[str, Any]) -> Optional["MediaInfoCache"]:
+        if not meta.get('mediainfo_cache', True):
+            return None
+        return cls(cls.meta_path(meta))
+
+    @staticmethod
+    def key(video: str, backend: str, is_dvd: bool = False) -> Optional[str]:
+        """Cache key for the report of ``video`` made by ``backend``, or None if the file can not be identified."""
+        paths = [video]
+        if is_dvd:
+            # The IFO report covers every VOB of its title set (VTS_01_0.IFO -> VTS_01_*)
+            folder = os.path.dirname(video)
+            prefix = os.path.basename(video)[:7]
+            try:
+                paths = sorted(os.path.join(folder, name) for name in os.listdir(folder) if name.startswith(prefix))
+            except OSError:
+                return None
+        identities: list[tuple[str, int, int, int]] = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            identities.append((os.path.realpath(path), st.st_size, st.st_mtime_ns, st.st_ino))
+        return _key(video, backend, identities)
+
+    def get(self, key: str) -> Optional[tuple[str, str]]:
+        """The cached (text, json) reports for ``key``."""
+        def query(conn: sqlite3.Connection) -> Optional[tuple[str, str]]:
+            row = conn.execute("SELECT text, json FROM reports WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE reports SET last_used = ? WHERE key = ?", (time.time(), key))
+            return str(row[0]), str(row[1])
+
+        return self.read(query, None)
+
+    def store(self, key: str, text: str, json_text: str) -> None:
+        def update(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "INSERT OR REPLACE INTO reports (key, text, json, last_used) VALUES (?, ?, ?, ?)",
+                (key, text, json_text, time.time()),
+            )
+            self.trim_to_bytes(conn, "reports", "LENGTH(text) + LENGTH(json)", self.max_bytes)
+
+        self.write(update)
@@ -0,0 +1,300 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Persistent cache for metadata lookups (TMDb, IMDb, TVmaze, AniList and TVDB).
+
+Responses are kept in a SQLite database under ``data/cache`` and shared by
+every queue item and run, so uploading a season episode by episode only asks
+the metadata sites once per show, season and episode.
+
+- ``metadata_client()`` is a drop in for ``pooled_client()``. Requests to the
+  known metadata APIs go through a caching transport keyed by method, url
+  (without api keys) and request body, everything else is passed through.
+- ``cached_call()`` caches the JSON result of any other lookup, such as the
+  synchronous TVDB library calls.
+
+Each endpoint has its own TTL. An expired entry is still served for a while
+(stale-while-revalidate) while a background refresh updates it, concurrent
+identical lookups share one request, and in offline mode only the cache is
+used: a miss fails the way a network error would.
+"""
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from collections.abc import Awaitable, Mapping, Sequence
+from typing import Any, Callable, NamedTuple, Optional, TypeVar
+
+import httpx
+
+from src.http_pool import shared_transport
+from src.sqlite_cache import SQLiteCache
+
+T = TypeVar("T")
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+
+# How long an expired entry is still served while it is refreshed in the background
+DEFAULT_STALE_SECONDS = 14 * DAY
+# Not found answers are kept for a short time only
+NEGATIVE_TTL = 6 * HOUR
+CACHEABLE_STATUS = (200, 301, 302, 307, 308, 404)
+
+# The body is stored already de-chunked, so these do not describe it any more
+HOP_BY_HOP_HEADERS = frozenset({"connection", "keep-alive", "transfer-encoding"})
+
+# Query parameters that never become part of a cache key
+SECRET_PARAMS = frozenset({"api_key", "apikey", "key", "token"})
+
+
+class EndpointRule(NamedTuple):
+    host: str
+    path: "re.Pattern[str]"
+    endpoint: str
+    ttl: float
+
+
+# First match wins. TV details are kept shorter than movies since new seasons and episodes show up there
+ENDPOINT_RULES: tuple[EndpointRule, ...] = (
+    EndpointRule("api.themoviedb.org", re.compile(r"/search/"), "tmdb_search", DAY),
+    EndpointRule("api.themoviedb.org", re.compile(r"/tv/\d+/season/"), "tmdb_season", DAY),
+    EndpointRule("api.themoviedb.org", re.compile(r"/tv/\d+$"), "tmdb_tv", DAY),
+    EndpointRule("api.themoviedb.org", re.compile(r"/find/"), "tmdb_find", 7 * DAY),
+    EndpointRule("api.themoviedb.org", re.compile(r"."), "tmdb", 7 * DAY),
+    EndpointRule("api.graphql.imdb.com", re.compile(r"."), "imdb", 3 * DAY),
+    EndpointRule("api.tvmaze.com", re.compile(r"/(search|lookup)/"), "tvmaze_search", DAY),
+    EndpointRule("api.tvmaze.com", re.compile(r"."), "tvmaze", DAY),
+    EndpointRule("graphql.anilist.co", re.compile(r"."), "anilist", 7 * DAY),
+)
+
+# TTLs of the cached_call() endpoints
+CALL_TTLS: dict[str, float] = {
+    "tvdb_search": DAY,
+    "tvdb_series": DAY,
+    "tvdb_episodes": DAY,
+    "tvdb_episode": 7 * DAY,
+}
+
+
+class MetadataCacheMiss(Exception):
+    """Raised in offline mode when a lookup is not cached."""
+
+
+class CacheEntry(NamedTuple):
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    stored: float
+    ttl: float
+
+
+def _key(*parts: Any) -> str:
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def _public_url(url: httpx.URL) -> str:
+    params = tuple(sorted((name, value) for name, value in url.params.multi_items() if name.lower() not in SECRET_PARAMS))
+    return str(url.copy_with(params=httpx.QueryParams(params)))
+
+
+def match_rule(url: httpx.URL) -> Optional[EndpointRule]:
+    for rule in ENDPOINT_RULES:
+        if url.host == rule.host and rule.path.search(url.path):
+            return rule
+    return None
+
+
+class MetadataCache(SQLiteCache):
+    file_name = "metadata.sqlite3"
+    schema = (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        " key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, status INTEGER NOT NULL,"
+        " headers TEXT NOT NULL, body BLOB NOT NULL, stored REAL NOT NULL, ttl REAL NOT NULL)",
+    )
+    label = "metadata cache"
+
+    def __init__(self, db_path: str, offline: bool = False, stale_seconds: float = DEFAULT_STALE_SECONDS) -> None:
+        super().__init__(db_path)
+        self.offline = offline
+        self.stale_seconds = stale_seconds
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        def query(conn: sqlite3.Connection) -> Optional[CacheEntry]:
+            row = conn.execute("SELECT status, headers, body, stored, ttl FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            headers = [(str(name), str(value)) for name, value in json.loads(row[1])]
+            return CacheEntry(int(row[0]), headers, bytes(row[2]), float(row[3]), float(row[4]))
+
+        return self.read(query, None)
+
+    def _write(self, key: str, endpoint: str, entry: CacheEntry) -> None:
+        def update(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, endpoint, status, headers, body, stored, ttl) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, entry.status, json.dumps(entry.headers), entry.body, entry.stored, entry.ttl),
+            )
+            # Entries past their stale window are never served again
+            conn.execute("DELETE FROM entries WHERE stored + ttl + ? < ?", (self.stale_seconds, time.time()))
+
+        self.write(update)
+
+    async def lookup(self, key: str, endpoint: str, fetch: Callable[[], Awaitable[Optional[CacheEntry]]]) -> CacheEntry:
+        """
+        Cached entry for ``key``, calling ``fetch`` on a miss and refreshing expired entries in the background.
+        ``fetch`` returns None for answers that must not be cached, which are then passed on uncached.
+        """
+        entry = await asyncio.to_thread(self._read, key)
+        now = time.time()
+        if entry is not None:
+            age = now - entry.stored
+            if self.offline or age < entry.ttl:
+                self.hits += 1
+                return entry
+            if age < entry.ttl + self.stale_seconds:
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    refresh = asyncio.ensure_future(self._fetch(key, endpoint, fetch))
+                    # A failed refresh keeps serving the stale entry, it is not worth a traceback
+                    refresh.add_done_callback(lambda task: task.cancelled() or task.exception())
+                return entry
+
+        if self.offline:
+            raise MetadataCacheMiss(f"{endpoint} lookup is not cached (offline mode)")
+        self.misses += 1
+        return await self._fetch(key, endpoint, fetch)
+
+    async def _fetch(self, key: str, endpoint: str, fetch: Callable[[], Awaitable[Optional[CacheEntry]]]) -> CacheEntry:
+        # Identical lookups running at the same time share one request
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait([pending])
+            if not pending.cancelled():
+                return pending.result()
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            entry = await fetch()
+            if entry is None:
+                raise _Uncacheable()
+            await asyncio.to_thread(self._write, key, endpoint, entry)
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            # Waiters notice the cancelled future and fetch for themselves
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters get the exception, nobody else has to retrieve it
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def summary(self) -> str:
+        return f"Metadata cache: {self.hits} hits, {self.stale_hits} stale hits, {self.misses} misses{' (offline)' if self.offline else ''}"
+
+
+class _Uncacheable(Exception):
+    """Internal: the fetched result must not be stored."""
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """Serves requests to the metadata APIs from the cache, everything else goes straight to the shared pool."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport) -> None:
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        cache = metadata_cache
+        rule = match_rule(request.url) if cache is not None and request.method in ("GET", "POST") else None
+        if cache is None or rule is None:
+            return await self.inner.handle_async_request(request)
+
+        body = await request.aread() if request.method == "POST" else b""
+        key = _key(request.method, _public_url(request.url), hashlib.sha256(body).hexdigest())
+        uncached: list[httpx.Response] = []
+
+        async def fetch() -> Optional[CacheEntry]:
+            response = await self.inner.handle_async_request(request)
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+            await response.aclose()
+            headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in HOP_BY_HOP_HEADERS]
+            if response.status_code not in CACHEABLE_STATUS:
+                uncached.append(httpx.Response(response.status_code, headers=httpx.Headers(headers), stream=httpx.ByteStream(raw), request=request))
+                return None
+            ttl = NEGATIVE_TTL if response.status_code == 404 else rule.ttl
+            return CacheEntry(response.status_code, headers, raw, time.time(), ttl)
+
+        try:
+            entry = await cache.lookup(key, rule.endpoint, fetch)
+        except _Uncacheable:
+            if uncached:
+                return uncached[0]
+            # Another request sharing this lookup got an uncacheable answer, ask again
+            return await self.inner.handle_async_request(request)
+        except MetadataCacheMiss as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+        return httpx.Response(entry.status, headers=httpx.Headers(entry.headers), stream=httpx.ByteStream(entry.body), request=request)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+metadata_cache: Optional[MetadataCache] = None
+caching_transport = CachingTransport(shared_transport)
+
+
+def configure_metadata_cache(config: Mapping[str, Any], base_dir: str) -> None:
+    global metadata_cache
+    default_section = config.get('DEFAULT', {})
+    default_config: Mapping[str, Any] = default_section if isinstance(default_section, Mapping) else {}
+    offline = bool(default_config.get('metadata_cache_offline', False))
+    if not default_config.get('metadata_cache', True) and not offline:
+        metadata_cache = None
+        return
+    metadata_cache = MetadataCache(MetadataCache.default_path(base_dir), offline=offline)
+
+
+def metadata_cache_summary() -> str:
+    return metadata_cache.summary() if metadata_cache is not None else ""
+
+
+def metadata_client(**kwargs: Any) -> httpx.AsyncClient:
+    """``pooled_client()`` with the metadata API responses served from the persistent cache."""
+    return httpx.AsyncClient(transport=caching_transport, **kwargs)
+
+
+async def cached_call(endpoint: str, key_parts: Sequence[Any], call: Callable[[], Awaitable[T]]) -> T:
+    """Cache the JSON serialisable result of ``call()``. Falsy results are not cached."""
+    cache = metadata_cache
+    if cache is None:
+        return await call()
+
+    uncached: list[T] = []
+
+    async def fetch() -> Optional[CacheEntry]:
+        result = await call()
+        if not result:
+            uncached.append(result)
+            return None
+        return CacheEntry(200, [], json.dumps(result).encode("utf-8"), time.time(), CALL_TTLS.get(endpoint, DAY))
+
+    try:
+        entry = await cache.lookup(_key(endpoint, *key_parts), endpoint, fetch)
+    except _Uncacheable:
+        if uncached:
+            return uncached[0]
+        # Another caller sharing this lookup got an empty result, ask again
+        return await call()
+    result: T = json.loads(entry.body)
+    return result
@@ -0,0 +1,139 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Copy-on-write views of ``meta``.
+
+``meta`` carries MediaInfo JSON, BDInfo, image lists and TMDb payloads, so a
+``copy.deepcopy`` for every tracker that is checked in parallel allocates a
+lot of memory before any request goes out. A ``MetaView`` starts as a shallow
+copy of the top level and only copies a value when it is accessed: nested
+dicts become views of their own (again copied one level at a time), lists are
+copied with their elements wrapped the same way, and other mutable values are
+deep copied. Whatever a tracker changes lands in its own view, and nothing of
+the base is modified.
+
+The base must not be changed in place while views of it are alive. Replacing
+top level keys of the base is fine, views keep the values they started with.
+Changes are not written back by the view; callers copy the keys they need back
+into the shared ``meta`` explicitly.
+"""
+import copy
+from collections.abc import Iterator, Mapping
+from typing import Any, Optional
+
+# Values that can be shared between views as they are
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), frozenset, range)
+
+
+def _private_copy(value: Any) -> Any:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, dict):
+        return MetaView(value)  # pyright: ignore[reportUnknownArgumentType]
+    if isinstance(value, list):
+        return [_private_copy(item) for item in value]  # pyright: ignore[reportUnknownVariableType]
+    if isinstance(value, tuple) and all(isinstance(item, _IMMUTABLE_TYPES) for item in value):  # pyright: ignore[reportUnknownVariableType]
+        return value
+    return copy.deepcopy(value)
+
+
+class MetaView(dict[str, Any]):
+    """A dict that reads through to ``base`` and copies values the first time they are accessed."""
+
+    __slots__ = ("_owned",)
+
+    def __init__(self, base: Optional[Mapping[str, Any]] = None) -> None:
+        # The raw items of a view are taken as they are, not copied again
+        super().__init__(dict.items(base) if isinstance(base, dict) else (base or {}))
+        # Keys whose value belongs to this view (copied on access or assigned)
+        self._owned: set[str] = set()
+
+    def _own(self, key: str) -> Any:
+        value = dict.__getitem__(self, key)
+        if key not in self._owned:
+            value = _private_copy(value)
+            dict.__setitem__(self, key, value)
+            self._owned.add(key)
+        return value
+
+    def _own_all(self) -> None:
+        for key in list(dict.keys(self)):
+            if key not in self._owned:
+                self._own(key)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._own(key)
+
+    def __iter__(self) -> Iterator[str]:
+        # Defining __iter__ also keeps dict(view) and {**view} off the C fast path
+        # that would hand out the shared values without going through __getitem__
+        return iter(dict.keys(self))
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        dict.__setitem__(self, key, value)
+        self._owned.add(key)
+
+    def __delitem__(self, key: str) -> None:
+        dict.__delitem__(self, key)
+        self._owned.discard(key)
+
+    def get(self, key: str, default: Any = None, /) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if dict.__contains__(self, key):
+            return self._own(key)
+        return default
+
+    def setdefault(self, key: str, default: Any = None, /) -> Any:
+        if dict.__contains__(self, key):
+            return self._own(key)
+        self[key] = default
+        return default
+
+    def pop(self, key: str, *default: Any) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if dict.__contains__(self, key):
+            value = self._own(key)
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self) -> tuple[str, Any]:
+        key = next(reversed(dict.keys(self)))
+        return key, self.pop(key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def values(self) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        self._own_all()
+        return super().values()
+
+    def items(self) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        self._own_all()
+        return super().items()
+
+    def copy(self) -> "MetaView":
+        # A view of a view: values this view owns are shared until either side accesses them
+        return MetaView(self)
+
+    def __copy__(self) -> "MetaView":
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return copy.deepcopy(dict(dict.items(self)), memo)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle as a plain dict, views are only meaningful within one process
+        return (dict, (dict(dict.items(self)),))
+
+    def __ior__(self, other: Any) -> "MetaView":  # pyright: ignore[reportIncompatibleMethodOverride]
+        self.update(other)
+        return self
+
+    def __or__(self, other: Any) -> dict[str, Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        merged = dict(self.items())
+        merged.update(other)
+        return merged
+
+    def __repr__(self) -> str:
+        return f"MetaView({dict.__repr__(self)})"
@@ -0,0 +1,206 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Memoized guessit and anitopy parsing.
+
+The same release, folder and file names are parsed by prep, naming, tags,
+source, edition, region, season/episode detection and the TMDb/IMDb searches,
+often several times in one run, and a guessit call costs tens of
+milliseconds of CPU. Every module parses through here: results are kept in an
+LRU keyed by the string and the options, and callers get their own copy of
+the result so the cached one stays intact.
+
+``guessit_many`` parses a whole file list (the episodes of a season pack) in
+one go and ``guessit_batch`` does so off the event loop. Names that are not
+cached yet are spread over worker processes when there are enough of them and
+more than one CPU, and the results land in the same cache, so the per-file
+lookups that follow are free. The workers run ``src.name_parsing_worker``
+rather than a multiprocessing pool, whose spawn and forkserver workers would
+re-import upload.py and load the config.
+"""
+import asyncio
+import atexit
+import contextlib
+import json
+import os
+import pickle  # nosec B403 - results only come from our own worker processes
+import subprocess  # nosec B404 - runs the worker module with this interpreter
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import IO, Any, Optional, cast
+
+import anitopy
+import guessit
+
+guessit_module: Any = cast(Any, guessit)
+anitopy_module: Any = cast(Any, anitopy)
+
+CACHE_SIZE = 4096
+# Batches with fewer uncached names than this are parsed in this process, the workers would cost more than they save
+POOL_MIN_BATCH = 32
+MAX_POOL_WORKERS = 4
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ParseCache:
+    """Thread-safe LRU of parse results."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str, str]) -> Optional[dict[str, Any]]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: tuple[str, str, str], result: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+cache = ParseCache()
+
+
+def _options_key(options: Optional[dict[str, Any]]) -> str:
+    return json.dumps(options, sort_keys=True, default=str) if options else ""
+
+
+def _copy(result: dict[str, Any]) -> dict[str, Any]:
+    # Lists are the only values callers could change in place (language, other, episode, ...)
+    return {key: list(cast(list[Any], value)) if isinstance(value, list) else value for key, value in result.items()}
+
+
+def _guessit(value: str, options: Optional[dict[str, Any]]) -> dict[str, Any]:
+    return dict(guessit_module.guessit(value, dict(options) if options else None))
+
+
+def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    """guessit(value, options), from the cache when this string was parsed with the same options before."""
+    key = ("guessit", value, _options_key(options))
+    result = cache.get(key)
+    if result is None:
+        result = _guessit(value, options)
+        cache.put(key, result)
+    return _copy(result)
+
+
+def anitopy_parse(value: str) -> dict[str, Any]:
+    """anitopy.parse(value) as a dict (empty when anitopy finds nothing), cached like guessit_fn."""
+    key = ("anitopy", value, "")
+    result = cache.get(key)
+    if result is None:
+        result = dict(cast(Optional[dict[str, Any]], anitopy_module.parse(value)) or {})
+        cache.put(key, result)
+    return _copy(result)
+
+
+class ParseWorkers:
+    """
+    Worker processes for guessit_many, started on first use and kept warm for
+    the next batch. Batches are parsed one at a time, each spread over all workers.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._procs: list[subprocess.Popen[bytes]] = []
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen[bytes]:
+        return subprocess.Popen(  # nosec B603 - fixed command line
+            [sys.executable, "-m", "src.name_parsing_worker"],
+            cwd=ROOT_DIR,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def parse(self, values: list[str], options: Optional[dict[str, Any]]) -> Optional[list[Optional[dict[str, Any]]]]:
+        """
+        guessit results for ``values`` in order (``None`` where guessit failed),
+        or ``None`` when the workers could not be used.
+        """
+        chunk_size = -(-len(values) // self.size)
+        chunks = [values[start:start + chunk_size] for start in range(0, len(values), chunk_size)]
+        with self._lock:
+            try:
+                while len(self._procs) < self.size:
+                    self._procs.append(self._start())
+                workers = self._procs[:len(chunks)]
+                for proc, chunk in zip(workers, chunks):
+                    stdin = cast(IO[bytes], proc.stdin)
+                    pickle.dump((chunk, options), stdin)
+                    stdin.flush()
+                results: list[Optional[dict[str, Any]]] = []
+                for proc in workers:
+                    results.extend(pickle.load(cast(IO[bytes], proc.stdout)))  # nosec B301 - written by our own worker
+            except Exception:
+                # A dead or broken worker only costs the speed-up
+                self._close()
+                return None
+        return results if len(results) == len(values) else None
+
+    def _close(self) -> None:
+        procs, self._procs = self._procs, []
+        for proc in procs:
+            with contextlib.suppress(OSError):
+                cast(IO[bytes], proc.stdin).close()
+        for proc in procs:
+            self._wait(proc)
+
+    @staticmethod
+    def _wait(proc: subprocess.Popen[bytes]) -> None:
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+
+workers = ParseWorkers(min(MAX_POOL_WORKERS, os.cpu_count() or 1))
+atexit.register(workers.close)
+
+
+def guessit_many(values: Sequence[str], options: Optional[dict[str, Any]] = None, use_pool: bool = True) -> list[dict[str, Any]]:
+    """
+    guessit_fn for every value, in order, parsing each distinct uncached name once.
+    Uncached names are parsed by the worker processes when there are enough of
+    them and more than one CPU to spread them over.
+    """
+    options_key = _options_key(options)
+    pending = [value for value in dict.fromkeys(values) if cache.get(("guessit", value, options_key)) is None]
+    if use_pool and len(pending) >= POOL_MIN_BATCH and workers.size > 1:
+        parsed = workers.parse(pending, options)
+        for value, result in zip(pending, parsed or []):
+            if result is not None:
+                cache.put(("guessit", value, options_key), result)
+    return [guessit_fn(value, options) for value in values]
+
+
+async def guessit_batch(values: Sequence[str], options: Optional[dict[str, Any]] = None) -> list[dict[str, Any]]:
+    """guessit_many off the event loop."""
+    return await asyncio.to_thread(guessit_many, values, options)
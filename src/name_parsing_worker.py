@@ -0,0 +1,50 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Worker process of the guessit pool in src.name_parsing.
+
+    python -m src.name_parsing_worker
+
+Started by ``ParseWorkers`` instead of a multiprocessing pool: spawn and
+forkserver workers re-import the entry script (upload.py loads the config on
+import) and fork copies the running event loop and threads. This module only
+imports guessit. It reads pickled ``(names, options)`` jobs from stdin and
+writes one pickled list of results per job to stdout, with ``None`` for a name
+guessit fails on. It exits when stdin is closed.
+"""
+import os
+import pickle  # nosec B403 - jobs only come from the parent process
+import signal
+import sys
+from typing import Any, Optional, cast
+
+import guessit
+
+guessit_module: Any = cast(Any, guessit)
+
+
+def parse(value: str, options: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    # The parent parses a failed name again itself, where the error reaches the caller
+    try:
+        return dict(guessit_module.guessit(value, dict(options) if options else None))
+    except Exception:
+        return None
+
+
+def main() -> None:
+    # Ctrl+C is handled by the parent, which closes stdin
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    jobs = sys.stdin.buffer
+    results = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    # Anything else printed goes to stderr and can not corrupt the results
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    while True:
+        try:
+            values, options = pickle.load(jobs)  # nosec B301 - jobs only come from the parent process
+        except EOFError:
+            return
+        pickle.dump([parse(value, options) for value in values], results)
+        results.flush()
+
+
+if __name__ == "__main__":
+    main()
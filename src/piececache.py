@@ -0,0 +1,139 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Persistent cache of torrent piece hashes.
+
+Files are identified by (real path, size, mtime, inode). Two kinds of entries
+are kept in a small SQLite database under ``data/cache``:
+
+- content entries: every piece hash for an exact set of files and piece size,
+  so identical content can be written out again without reading any payload.
+- file entries: the hashes of the pieces lying entirely inside one file, for a
+  given piece size and alignment of the file inside the torrent, so a pack in
+  which one episode changed only has to read that episode plus the few pieces
+  straddling file boundaries.
+
+The database is capped in size and trimmed least recently used first.
+"""
+import hashlib
+import os
+import sqlite3
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional
+
+from src.sqlite_cache import SQLiteCache
+
+FileIdentity = tuple[str, int, int, int]
+
+DEFAULT_CACHE_SIZE_MB = 256
+
+
+def _key(*parts: Any) -> str:
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def interior_pieces(offset: int, size: int, piece_size: int) -> tuple[int, int]:
+    """Index range [first, end) of the pieces lying entirely inside a file starting at ``offset`` in the torrent."""
+    first = -(-offset // piece_size)
+    end = (offset + size) // piece_size
+    return first, max(first, end)
+
+
+class PieceHashCache(SQLiteCache):
+    file_name = "piece_hashes.sqlite3"
+    schema = (
+        "CREATE TABLE IF NOT EXISTS pieces ("
+        " key TEXT PRIMARY KEY, content_key TEXT, piece_size INTEGER NOT NULL,"
+        " hashes BLOB NOT NULL, last_used REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS pieces_content ON pieces (content_key)",
+        "CREATE INDEX IF NOT EXISTS pieces_last_used ON pieces (last_used)",
+    )
+    label = "piece hash cache"
+
+    def __init__(self, db_path: str, max_bytes: int) -> None:
+        super().__init__(db_path)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_meta(cls, meta: Mapping[str, Any]) -> Optional["PieceHashCache"]:
+        if not meta.get('piece_hash_cache', True):
+            return None
+        try:
+            size_mb = int(meta.get('piece_hash_cache_size_mb') or DEFAULT_CACHE_SIZE_MB)
+        except (TypeError, ValueError):
+            size_mb = DEFAULT_CACHE_SIZE_MB
+        if size_mb <= 0:
+            return None
+        return cls(cls.meta_path(meta), size_mb * 1024 * 1024)
+
+    @staticmethod
+    def identities(files: Sequence[tuple[str, int]]) -> Optional[list[FileIdentity]]:
+        """Identity of every file, or None if any of them is missing or no longer has the expected size."""
+        result: list[FileIdentity] = []
+        for path, size in files:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            if st.st_size != size:
+                return None
+            result.append((os.path.realpath(path), st.st_size, st.st_mtime_ns, st.st_ino))
+        return result
+
+    def _touch(self, conn: sqlite3.Connection, key: str) -> None:
+        conn.execute("UPDATE pieces SET last_used = ? WHERE key = ?", (time.time(), key))
+
+    def get_content(self, identities: Sequence[FileIdentity], piece_size: Optional[int] = None, max_piece_size: Optional[int] = None) -> Optional[tuple[int, bytes]]:
+        """
+        Cached (piece size, piece hashes) for exactly these files.
+        Without ``piece_size``, the most recently used entry with a piece size up to ``max_piece_size`` is returned.
+        """
+        content_key = _key(list(identities))
+
+        def query(conn: sqlite3.Connection) -> Optional[tuple[int, bytes]]:
+            if piece_size:
+                row = conn.execute(
+                    "SELECT key, piece_size, hashes FROM pieces WHERE key = ?", (_key(content_key, piece_size),)
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT key, piece_size, hashes FROM pieces WHERE content_key = ? AND piece_size <= ? ORDER BY last_used DESC LIMIT 1",
+                    (content_key, max_piece_size or 2**62),
+                ).fetchone()
+            if row is None:
+                return None
+            self._touch(conn, row[0])
+            return int(row[1]), bytes(row[2])
+
+        return self.read(query, None)
+
+    def get_file(self, identity: FileIdentity, piece_size: int, offset: int) -> Optional[bytes]:
+        key = _key(identity, piece_size, offset % piece_size)
+
+        def query(conn: sqlite3.Connection) -> Optional[bytes]:
+            row = conn.execute("SELECT hashes FROM pieces WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._touch(conn, key)
+            return bytes(row[0])
+
+        return self.read(query, None)
+
+    def store(self, identities: Sequence[FileIdentity], piece_size: int, pieces: bytes) -> None:
+        """Record the piece hashes of a complete torrent, both as a content entry and per file."""
+        now = time.time()
+        content_key = _key(list(identities))
+        rows: list[tuple[str, Optional[str], int, bytes, float]] = [(_key(content_key, piece_size), content_key, piece_size, pieces, now)]
+        offset = 0
+        for identity in identities:
+            size = identity[1]
+            first, end = interior_pieces(offset, size, piece_size)
+            if end > first:
+                rows.append((_key(identity, piece_size, offset % piece_size), None, piece_size, pieces[first * 20:end * 20], now))
+            offset += size
+
+        def update(conn: sqlite3.Connection) -> None:
+            conn.executemany("INSERT OR REPLACE INTO pieces (key, content_key, piece_size, hashes, last_used) VALUES (?, ?, ?, ?, ?)", rows)
+            self.trim_to_bytes(conn, "pieces", "LENGTH(hashes)", self.max_bytes)
+
+        self.write(update)
@@ -0,0 +1,206 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Threaded SHA-1 piece hashing.
+
+A single reader thread walks the payload front to back in large sequential
+reads, treating all files as one continuous stream so pieces that straddle a
+file boundary are assembled naturally. Every read buffer holds a whole number
+of pieces and is hashed on a thread pool (hashlib releases the GIL), and the
+digests are collected back in piece order. Pieces found in the piece hash
+cache are skipped, so only the uncached ranges of the stream are read.
+"""
+import concurrent.futures
+import hashlib
+import os
+import queue
+import time
+from collections import deque
+from collections.abc import Sequence
+from typing import Callable, Optional
+
+from src.piececache import PieceHashCache, interior_pieces
+
+# Target size of one read, rounded to whole pieces. Large enough that small
+# pieces do not drown in per-job overhead, small enough to keep memory low.
+READ_CHUNK_SIZE = 16 * 1024 * 1024
+# Upper bound for read buffers alive at once (being filled or hashed)
+MAX_BUFFERED_BYTES = 512 * 1024 * 1024
+
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def default_hash_threads() -> int:
+    return max(1, min(os.cpu_count() or 1, 8))
+
+
+class PieceHasher:
+    def __init__(self, piece_size: int, threads: int = 0) -> None:
+        if piece_size <= 0:
+            raise ValueError(f"Invalid piece size: {piece_size}")
+        self.piece_size = piece_size
+        self.threads = threads if threads > 0 else default_hash_threads()
+        self.chunk_pieces = max(1, READ_CHUNK_SIZE // piece_size)
+        chunk_size = self.chunk_pieces * piece_size
+        self.max_buffers = max(2, min(self.threads * 2, MAX_BUFFERED_BYTES // chunk_size))
+
+    @staticmethod
+    def _hash_chunk(buffer: bytearray, length: int, piece_size: int, free_buffers: "queue.SimpleQueue[bytearray]") -> bytes:
+        try:
+            view = memoryview(buffer)[:length]
+            return b"".join(hashlib.sha1(view[offset:offset + piece_size]).digest() for offset in range(0, length, piece_size))  # nosec B324 - BitTorrent v1 piece hashes are SHA-1
+        finally:
+            free_buffers.put(buffer)
+
+    def hash_files(
+        self,
+        files: Sequence[tuple[str, int]],
+        callback: Optional[ProgressCallback] = None,
+        interval: float = 5.0,
+        cache: Optional[PieceHashCache] = None,
+    ) -> bytes:
+        """
+        Hash ``files`` (path, expected size) as one continuous stream and return the concatenated piece hashes.
+        ``callback(filepath, pieces_done, pieces_total)`` is called at most every ``interval`` seconds and once at the end.
+        With a ``cache``, pieces already known for these files are taken from it and only the rest is read.
+        """
+        piece_size = self.piece_size
+        total_size = sum(size for _, size in files)
+        pieces_total = -(-total_size // piece_size)
+        offsets: list[int] = []
+        offset = 0
+        for _, size in files:
+            offsets.append(offset)
+            offset += size
+
+        identities = cache.identities(files) if cache is not None else None
+        pieces: list[Optional[bytes]] = [None] * pieces_total
+        if cache is not None and identities is not None:
+            content = cache.get_content(identities, piece_size)
+            if content is not None and len(content[1]) == pieces_total * 20:
+                if callback is not None:
+                    callback(files[-1][0], pieces_total, pieces_total)
+                return content[1]
+            for (_, size), file_offset, identity in zip(files, offsets, identities):
+                first, end = interior_pieces(file_offset, size, piece_size)
+                if end <= first:
+                    continue
+                cached = cache.get_file(identity, piece_size, file_offset)
+                if cached is not None and len(cached) == (end - first) * 20:
+                    for index in range(first, end):
+                        pieces[index] = cached[(index - first) * 20:(index - first + 1) * 20]
+
+        # Contiguous runs of pieces that still have to be read
+        runs: list[tuple[int, int]] = []
+        index = 0
+        while index < pieces_total:
+            if pieces[index] is not None:
+                index += 1
+                continue
+            run_start = index
+            while index < pieces_total and pieces[index] is None:
+                index += 1
+            runs.append((run_start, index))
+
+        progress = _Progress(callback, interval, pieces_total, pieces_total - sum(end - start for start, end in runs))
+        progress.report(files[0][0] if files else "", force=True)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="piecehash") as pool:
+            for run_start, run_end in runs:
+                digests = self._hash_range(pool, files, offsets, run_start * piece_size, min(run_end * piece_size, total_size), progress)
+                for index in range(run_start, run_end):
+                    pieces[index] = digests[(index - run_start) * 20:(index - run_start + 1) * 20]
+
+        result = b"".join(piece or b"" for piece in pieces)
+        if cache is not None and identities is not None and runs:
+            cache.store(identities, piece_size, result)
+        progress.report(progress.filepath, force=True)
+        return result
+
+    def _hash_range(
+        self,
+        pool: concurrent.futures.ThreadPoolExecutor,
+        files: Sequence[tuple[str, int]],
+        offsets: Sequence[int],
+        start: int,
+        end: int,
+        progress: "_Progress",
+    ) -> bytes:
+        """Hash the stream bytes [start, end), where ``start`` is on a piece boundary."""
+        chunk_size = self.chunk_pieces * self.piece_size
+        free_buffers: queue.SimpleQueue[bytearray] = queue.SimpleQueue()
+        for _ in range(self.max_buffers):
+            free_buffers.put(bytearray(chunk_size))
+
+        digests: list[bytes] = []
+        pending: deque[concurrent.futures.Future[bytes]] = deque()
+
+        def collect(block: bool) -> None:
+            while pending and (block or pending[0].done()):
+                digest = pending.popleft().result()
+                digests.append(digest)
+                progress.advance(len(digest) // 20)
+                block = False
+            progress.report(progress.filepath)
+
+        buffer = free_buffers.get()
+        filled = 0
+        try:
+            for (filepath, size), file_offset in zip(files, offsets):
+                read_from = max(start, file_offset)
+                read_to = min(end, file_offset + size)
+                if read_to <= read_from:
+                    continue
+                progress.filepath = filepath
+                remaining = read_to - read_from
+                with open(filepath, "rb", buffering=0) as f:
+                    if read_from > file_offset:
+                        f.seek(read_from - file_offset)
+                    if hasattr(os, "posix_fadvise"):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    while remaining > 0:
+                        view = memoryview(buffer)[filled:filled + min(chunk_size - filled, remaining)]
+                        read = f.readinto(view)
+                        if not read:
+                            raise OSError(f"{filepath} is shorter than expected ({size} bytes)")
+                        filled += read
+                        remaining -= read
+                        if filled == chunk_size:
+                            pending.append(pool.submit(self._hash_chunk, buffer, filled, self.piece_size, free_buffers))
+                            # Waiting on the oldest job only happens when every buffer is in use
+                            while True:
+                                try:
+                                    buffer = free_buffers.get_nowait()
+                                    break
+                                except queue.Empty:
+                                    collect(block=True)
+                            filled = 0
+                            collect(block=False)
+
+            if filled:
+                pending.append(pool.submit(self._hash_chunk, buffer, filled, self.piece_size, free_buffers))
+            while pending:
+                collect(block=True)
+        finally:
+            for future in pending:
+                future.cancel()
+        return b"".join(digests)
+
+
+class _Progress:
+    def __init__(self, callback: Optional[ProgressCallback], interval: float, pieces_total: int, pieces_done: int) -> None:
+        self.callback = callback
+        self.interval = interval
+        self.pieces_total = pieces_total
+        self.pieces_done = pieces_done
+        self.filepath = ""
+        self._last_report = time.monotonic()
+
+    def advance(self, pieces: int) -> None:
+        self.pieces_done += pieces
+
+    def report(self, filepath: str, force: bool = False) -> None:
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if force or (self.interval > 0 and now - self._last_report >= self.interval):
+            self._last_report = now
+            self.callback(filepath, self.pieces_done, self.pieces_total)
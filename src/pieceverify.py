@@ -0,0 +1,124 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Sampled piece verification for reused torrents.
+
+Rather than re-hashing a whole release to prove that a .torrent taken from a
+client matches the files on disk, a handful of pieces is hashed: the first and
+last piece of every file plus a random or stratified sample across the whole
+torrent. Any mismatch rejects the torrent.
+"""
+import concurrent.futures
+import contextlib
+import hashlib
+import mmap
+import os
+import random
+from collections.abc import Sequence
+from typing import NamedTuple, Optional
+
+from src.piecehasher import default_hash_threads
+
+SAMPLE_MODES = ("stratified", "random")
+
+
+class VerifyResult(NamedTuple):
+    ok: bool
+    checked: int
+    reason: str = ""
+
+
+def select_pieces(sizes: Sequence[int], piece_size: int, sample_count: int, mode: str = "stratified", rng: Optional[random.Random] = None) -> list[int]:
+    """Piece indexes to check: first and last piece of every file plus ``sample_count`` spread over the torrent."""
+    rng = rng or random.Random()  # nosec B311 - sampling, not security
+    total_size = sum(sizes)
+    pieces_total = -(-total_size // piece_size)
+    if pieces_total == 0:
+        return []
+
+    selected: set[int] = set()
+    offset = 0
+    for size in sizes:
+        if size > 0:
+            selected.add(offset // piece_size)
+            selected.add((offset + size - 1) // piece_size)
+        offset += size
+
+    sample_count = min(sample_count, pieces_total)
+    if sample_count > 0:
+        if mode == "random":
+            selected.update(rng.sample(range(pieces_total), sample_count))
+        else:
+            # One piece from each of sample_count equally sized strata
+            for stratum in range(sample_count):
+                start = stratum * pieces_total // sample_count
+                end = max(start + 1, (stratum + 1) * pieces_total // sample_count)
+                selected.add(rng.randrange(start, end))
+    return sorted(selected)
+
+
+def verify_pieces(
+    files: Sequence[tuple[str, int]],
+    piece_size: int,
+    piece_hashes: bytes,
+    sample_count: int,
+    mode: str = "stratified",
+    threads: int = 0,
+) -> VerifyResult:
+    """Hash a sample of pieces of ``files`` (path, size in the torrent) and compare them with ``piece_hashes``."""
+    for path, size in files:
+        try:
+            actual_size = os.path.getsize(path)
+        except OSError:
+            return VerifyResult(False, 0, f"missing file {path}")
+        if actual_size != size:
+            return VerifyResult(False, 0, f"size mismatch for {path}: {actual_size} != {size}")
+
+    sizes = [size for _, size in files]
+    offsets: list[int] = []
+    offset = 0
+    for size in sizes:
+        offsets.append(offset)
+        offset += size
+    total_size = offset
+    if len(piece_hashes) != -(-total_size // piece_size) * 20:
+        return VerifyResult(False, 0, "piece count does not match the file sizes")
+
+    pieces = select_pieces(sizes, piece_size, sample_count, mode)
+
+    with contextlib.ExitStack() as stack:
+        maps: dict[int, mmap.mmap] = {}
+
+        def get_map(file_index: int) -> mmap.mmap:
+            mapped = maps.get(file_index)
+            if mapped is None:
+                f = stack.enter_context(open(files[file_index][0], "rb"))
+                mapped = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                maps[file_index] = mapped
+            return mapped
+
+        # Map every file up front from this thread, the workers only slice the maps
+        piece_spans: list[list[tuple[int, int, int]]] = []
+        for index in pieces:
+            start = index * piece_size
+            end = min(start + piece_size, total_size)
+            spans: list[tuple[int, int, int]] = []
+            for file_index, (file_offset, size) in enumerate(zip(offsets, sizes)):
+                if size == 0 or file_offset + size <= start or file_offset >= end:
+                    continue
+                get_map(file_index)
+                spans.append((file_index, max(start, file_offset) - file_offset, min(end, file_offset + size) - file_offset))
+            piece_spans.append(spans)
+
+        def check(position: int) -> Optional[int]:
+            digest = hashlib.sha1()  # nosec B324 - BitTorrent v1 piece hashes are SHA-1
+            for file_index, span_start, span_end in piece_spans[position]:
+                digest.update(maps[file_index][span_start:span_end])
+            index = pieces[position]
+            return None if digest.digest() == piece_hashes[index * 20:(index + 1) * 20] else index
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads or default_hash_threads(), thread_name_prefix="pieceverify") as pool:
+            for mismatch in pool.map(check, range(len(pieces))):
+                if mismatch is not None:
+                    return VerifyResult(False, len(pieces), f"piece {mismatch} does not match")
+
+    return VerifyResult(True, len(pieces))
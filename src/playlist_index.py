@@ -0,0 +1,186 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Cached index of the playlists of a Blu-ray disc.
+
+Playlist selection needs the duration, clip list and clip sizes of every
+``.mpls`` on the disc, and discs with hundreds of obfuscation playlists take a
+while to parse. The index of a disc is built once, parsing the playlists in a
+thread pool against a single listing of ``BDMV/STREAM``, and stored in a small
+SQLite database under ``data/cache``. It is keyed by the disc path, the mtimes
+of its PLAYLIST and STREAM directories, which change whenever a file is added,
+removed or renamed in them, and the number and total size of the stream files,
+which catch a clip replaced in place. Later runs on the same disc get the
+index back from two ``stat`` calls and the STREAM listing.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from bin.get_playlist import MplsParser
+from src.console import console
+from src.sqlite_cache import SQLiteCache
+
+# Indexes of this many discs are kept, least recently used are dropped first
+MAX_DISCS = 500
+PARSE_WORKERS = 8
+# MPLS timestamps are in 45 kHz ticks
+TICKS_PER_SECOND = 45000.0
+
+
+def _parse_mpls(mpls_path: str) -> Any:
+    with open(mpls_path, "rb") as mpls_file:
+        parser = MplsParser(mpls_file)
+        header = parser.load_movie_playlist()
+        mpls_file.seek(header.playlist_start_address, os.SEEK_SET)
+        return parser.load_playlist()
+
+
+def stream_files(disc_path: str) -> dict[str, tuple[str, int]]:
+    """Clip name -> (file name, size) of every ``.m2ts`` in the STREAM folder, whatever the case of the extension."""
+    streams: dict[str, tuple[str, int]] = {}
+    with contextlib.suppress(OSError), os.scandir(os.path.join(disc_path, "STREAM")) as it:
+        for entry in it:
+            clip, extension = os.path.splitext(entry.name)
+            if extension.lower() == ".m2ts":
+                with contextlib.suppress(OSError):
+                    streams[clip] = (entry.name, entry.stat().st_size)
+    return streams
+
+
+def _index_playlist(mpls_path: str, streams: Mapping[str, tuple[str, int]]) -> Optional[dict[str, Any]]:
+    """Duration and clips of one playlist, or None for playlists without play items or without any clip on disc."""
+    playlist_data = _parse_mpls(mpls_path)
+    play_items = getattr(playlist_data, "play_items", None)
+    if not play_items:
+        return None
+    duration = 0.0
+    clip_counts: Counter[str] = Counter()
+    for item in play_items:
+        intime = getattr(item, "intime", None)
+        outtime = getattr(item, "outtime", None)
+        if intime is None or outtime is None:
+            continue
+        duration += (outtime - intime) / TICKS_PER_SECOND
+        clip_name = getattr(item, "clip_information_filename", None)
+        if not isinstance(clip_name, str) or not clip_name.strip():
+            continue
+        clip_name = clip_name.strip()
+        if clip_name in streams:
+            clip_counts[clip_name] += 1
+    if not clip_counts:
+        return None
+    return {
+        "file": os.path.basename(mpls_path),
+        "duration": duration,
+        # Clips in order of first use, with their size, how often the playlist plays them and their file name
+        "clips": [[clip, streams[clip][1], count, streams[clip][0]] for clip, count in clip_counts.items()],
+    }
+
+
+def build_index(disc_path: str, streams: Optional[Mapping[str, tuple[str, int]]] = None) -> list[dict[str, Any]]:
+    """Index every playlist of the disc at ``disc_path`` (the BDMV folder), against ``streams`` when already listed."""
+    playlists_path = os.path.join(disc_path, "PLAYLIST")
+    if streams is None:
+        streams = stream_files(disc_path)
+    mpls_paths = sorted(os.path.join(playlists_path, name) for name in os.listdir(playlists_path) if name.lower().endswith(".mpls"))
+
+    def index_one(mpls_path: str) -> Optional[dict[str, Any]]:
+        try:
+            return _index_playlist(mpls_path, streams)
+        except Exception as e:
+            console.print(f"[bold red]Error parsing playlist {mpls_path}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as pool:
+        return [entry for entry in pool.map(index_one, mpls_paths) if entry is not None]
+
+
+def to_playlist_info(disc_path: str, entry: Mapping[str, Any]) -> dict[str, Any]:
+    """The playlist dict used for scoring and selection, with paths under ``disc_path``."""
+    stream_directory = os.path.join(disc_path, "STREAM")
+    clips: list[list[Any]] = entry["clips"]
+    return {
+        "file": entry["file"],
+        "duration": float(entry["duration"]),
+        "path": os.path.join(disc_path, "PLAYLIST", entry["file"]),
+        "items": [{"file": os.path.join(stream_directory, file_name), "size": int(size)} for _clip, size, _count, file_name in clips],
+        "total_play_items": sum(int(count) for _clip, _size, count, _file_name in clips),
+    }
+
+
+class PlaylistIndex(SQLiteCache):
+    file_name = "bd_playlists.sqlite3"
+    schema = ("CREATE TABLE IF NOT EXISTS discs (key TEXT PRIMARY KEY, playlists TEXT NOT NULL, last_used REAL NOT NULL)",)
+    label = "Blu-ray playlist cache"
+
+    def __init__(self, db_path: str, max_discs: int = MAX_DISCS) -> None:
+        super().__init__(db_path)
+        self.max_discs = max_discs
+
+    @classmethod
+    def from_meta(cls, meta: Mapping[str, Any]) -> Optional["PlaylistIndex"]:
+        if not meta.get('playlist_index_cache', True):
+            return None
+        return cls(cls.meta_path(meta))
+
+    @staticmethod
+    def key(disc_path: str, streams: Mapping[str, tuple[str, int]]) -> Optional[str]:
+        """Cache key of the disc at ``disc_path``, or None if its PLAYLIST or STREAM directory can not be read."""
+        try:
+            mtimes = [os.stat(os.path.join(disc_path, name)).st_mtime_ns for name in ("PLAYLIST", "STREAM")]
+        except OSError:
+            return None
+        # A clip copied over in place leaves the directory mtimes alone but not the sizes
+        stream_total = sum(size for _name, size in streams.values())
+        return hashlib.sha256(repr((os.path.realpath(disc_path), mtimes, len(streams), stream_total)).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[list[dict[str, Any]]]:
+        def query(conn: sqlite3.Connection) -> Optional[list[dict[str, Any]]]:
+            row = conn.execute("SELECT playlists FROM discs WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE discs SET last_used = ? WHERE key = ?", (time.time(), key))
+            try:
+                return json.loads(row[0])
+            except ValueError as e:
+                console.print(f"[yellow]Could not read {self.label}: {e}")
+                return None
+
+        return self.read(query, None)
+
+    def store(self, key: str, playlists: list[dict[str, Any]]) -> None:
+        def update(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "INSERT OR REPLACE INTO discs (key, playlists, last_used) VALUES (?, ?, ?)",
+                (key, json.dumps(playlists), time.time()),
+            )
+            self.trim_to_rows(conn, "discs", self.max_discs)
+
+        self.write(update)
+
+
+def disc_playlists(disc_path: str, index: Optional[PlaylistIndex] = None, debug: bool = False) -> list[dict[str, Any]]:
+    """
+    The playlists of the disc at ``disc_path`` as playlist dicts, from ``index`` when
+    the disc is unchanged. Without an index (cache turned off) they are always parsed.
+    """
+    started = time.perf_counter()
+    streams = stream_files(disc_path)
+    key = index.key(disc_path, streams) if index is not None else None
+    entries = index.get(key) if index is not None and key is not None else None
+    cached = entries is not None
+    if entries is None:
+        entries = build_index(disc_path, streams)
+        if index is not None and key is not None:
+            index.store(key, entries)
+    if debug:
+        source = "cached index" if cached else "parsed playlists"
+        console.print(f"[cyan]{len(entries)} usable playlists from {source} of {disc_path} in {time.perf_counter() - started:.2f}s")
+    return [to_playlist_info(disc_path, entry) for entry in entries]
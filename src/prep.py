@@ -14,7 +14,6 @@ try:
 
     import aiofiles
     import cli_ui
-    import guessit
 
     from src.apply_overrides import ApplyOverrides
     from src.audio import AudioManager
@@ -32,7 +31,9 @@ try:
     from src.imdb import imdb_manager
     from src.is_scene import SceneManager
     from src.languages import languages_manager
+    from src.mediainfo_cache import MediaInfoCache
     from src.metadata_searching import MetadataSearchingManager
+    from src.name_parsing import guessit_fn
     from src.radarr import RadarrManager
     from src.region import get_distributor, get_region, get_service
     from src.rehostimages import RehostImagesManager
@@ -43,12 +44,8 @@ try:
     from src.tvmaze import tvmaze_manager
     from src.video import video_manager
 
-    guessit_module: Any = cast(Any, guessit)
     GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
 
-    def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-        return cast(dict[str, Any], guessit_module.guessit(value, options))
-
 except ModuleNotFoundError:
     if console is not None:
         console.print('Missing Module Found. Please reinstall required dependencies from requirements.txt.', markup=False)
@@ -133,6 +130,14 @@ class Prep:
         meta['keep_images'] = bool(self.config['DEFAULT'].get('keep_images', True) if not meta.get('keep_images') else True)
         mkbrr_threads = self.config['DEFAULT'].get('mkbrr_threads', "0")
         meta['mkbrr_threads'] = mkbrr_threads
+        meta['threaded_hashing'] = bool(self.config['DEFAULT'].get('threaded_hashing', True))
+        meta['hash_threads'] = self.config['DEFAULT'].get('hash_threads', "0")
+        meta['piece_hash_cache'] = bool(self.config['DEFAULT'].get('piece_hash_cache', True))
+        meta['piece_hash_cache_size_mb'] = self.config['DEFAULT'].get('piece_hash_cache_size_mb', "256")
+        meta['mediainfo_cache'] = bool(self.config['DEFAULT'].get('mediainfo_cache', True))
+        meta['playlist_index_cache'] = bool(self.config['DEFAULT'].get('playlist_index_cache', True))
+        meta['image_url_cache'] = bool(self.config['DEFAULT'].get('image_url_cache', True))
+        meta['image_url_cache_days'] = self.config['DEFAULT'].get('image_url_cache_days', "90")
 
         # make sure these are set in meta
         meta['we_checked_tvdb'] = False
@@ -282,7 +287,7 @@ class Prep:
                 except Exception:
                     meta['search_year'] = ""
                 if not meta.get('edit', False):
-                    mi = await exportInfo(f"{meta['discs'][0]['path']}/VTS_{meta['discs'][0]['main_set'][0][:2]}_0.IFO", False, meta['uuid'], meta['base_dir'], is_dvd=True, debug=meta.get('debug', False))
+                    mi = await exportInfo(f"{meta['discs'][0]['path']}/VTS_{meta['discs'][0]['main_set'][0][:2]}_0.IFO", meta['uuid'], meta['base_dir'], is_dvd=True, debug=meta.get('debug', False), cache=MediaInfoCache.from_meta(meta))
                     meta['mediainfo'] = mi
                 else:
                     mi = meta['mediainfo']
@@ -305,7 +310,7 @@ class Prep:
             except Exception:
                 meta['search_year'] = ""
             if not meta.get('edit', False):
-                mi = await exportInfo(meta['discs'][0]['largest_evo'], False, meta['uuid'], meta['base_dir'], debug=meta['debug'])
+                mi = await exportInfo(meta['discs'][0]['largest_evo'], meta['uuid'], meta['base_dir'], debug=meta['debug'], cache=MediaInfoCache.from_meta(meta))
                 meta['mediainfo'] = mi
             else:
                 mi = meta['mediainfo']
@@ -375,7 +380,7 @@ class Prep:
                         meta['search_year'] = ""
 
                     if not meta.get('edit', False):
-                        mi = await exportInfo(videopath, meta['isdir'], meta['uuid'], base_dir, is_dvd=meta.get('is_disc', False), debug=meta.get('debug', False))
+                        mi = await exportInfo(videopath, meta['uuid'], base_dir, is_dvd=meta.get('is_disc', False), debug=meta.get('debug', False), cache=MediaInfoCache.from_meta(meta))
                         meta['mediainfo'] = mi
                     else:
                         mi = meta['mediainfo']
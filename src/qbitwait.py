@@ -8,15 +8,16 @@ import aiohttp
 import qbittorrentapi
 
 from src.console import console
+from src.torrent_clients.qbit_watcher import CHECKING_STATES, COMPLETED_STATES, QbitWatcher, get_qbit_watcher
 
 
 class Wait:
 
     def __init__(self, config: dict[str, Any]):
         self.config = config
+        self.client_name = ''
         self.proxy_url: Optional[str] = None
         self.qbt_proxy_url: Optional[str] = None
-        self.qbt_session: Optional[aiohttp.ClientSession] = None
         self.qbt_client: Optional[qbittorrentapi.Client] = None
         self.qbt_client = self._connect_qbittorrent()
 
@@ -33,10 +34,10 @@ class Wait:
         if not isinstance(client_obj, dict):
             raise ValueError(f"No torrent client configuration for '{default_torrent_client}'")
         client = cast(dict[str, Any], client_obj)
+        self.client_name = default_torrent_client
 
         proxy_value = client.get('qui_proxy_url')
         self.proxy_url = proxy_value if isinstance(proxy_value, str) and proxy_value else None
-        self.qbt_session = None
         self.qbt_client = None
 
         if self.proxy_url:
@@ -82,56 +83,32 @@ class Wait:
             except qbittorrentapi.LoginFailed as e:
                 raise RuntimeError(f"qBittorrent login failed: {e}") from e
 
+    def _watcher(self, check_interval: float) -> QbitWatcher:
+        return get_qbit_watcher(self.client_name, qbt_client=self.qbt_client, proxy_url=self.qbt_proxy_url, interval=check_interval)
+
     async def wait_for_completion(self, infohash: str, check_interval: int = 3) -> None:
         if not self.proxy_url and not self.qbt_client:
             raise Exception("[ERROR] qBittorrent is not configured.")
 
         console.print(f"Waiting for torrent {infohash} to complete...", markup=False)
 
-        if self.proxy_url:
-            self.qbt_session = aiohttp.ClientSession()
+        def report_state(torrent: dict[str, Any]) -> None:
+            console.print(f"[DEBUG] Torrent {infohash} state: {torrent.get('state', 'unknown')}", markup=False)
 
         try:
-            while True:
-                if self.proxy_url:
-                    if self.qbt_session is None:
-                        raise RuntimeError("qbt_session is not initialized")
-                    async with self.qbt_session.get(
-                        f"{self.qbt_proxy_url}/api/v2/torrents/info",
-                        params={'hashes': infohash}
-                    ) as response:
-                        if response.status == 200:
-                            torrents_data = cast(list[dict[str, Any]], await response.json())
-                            target_torrent = torrents_data[0] if torrents_data else None
-                        else:
-                            console.print(f"[ERROR] Failed to get torrent info via proxy: {response.status}", markup=False)
-                            break
-                else:
-                    if self.qbt_client is None:
-                        raise RuntimeError("qbt_client is not initialized")
-                    torrents = self.qbt_client.torrents_info(hashes=infohash)
-                    target_torrent = next((t for t in torrents if t.hash == infohash), None)
-
-                if target_torrent:
-                    if self.proxy_url:
-                        target_dict = cast(dict[str, Any], target_torrent)
-                        state_value = target_dict.get('state')
-                    else:
-                        state_value = getattr(target_torrent, 'state', None)
-                    state_str = str(state_value) if state_value is not None else 'unknown'
-                    console.print(f"[DEBUG] Torrent {infohash} state: {state_str}", markup=False)
-
-                    if state_str in {'pausedUP', 'seeding', 'completed', 'stalledUP', 'uploading'}:
-                        console.print(f"[INFO] Torrent {infohash} has completed!", markup=False)
-                        return
-                else:
-                    console.print(f"[ERROR] Torrent with hash {infohash} not found!", markup=False)
-                    break
-
-                await asyncio.sleep(check_interval)
-        finally:
-            if self.qbt_session:
-                await self.qbt_session.close()
+            torrent = await self._watcher(check_interval).wait(
+                infohash,
+                lambda torrent: torrent.get('state') in COMPLETED_STATES,
+                on_update=report_state,
+            )
+        except RuntimeError as e:
+            console.print(f"[ERROR] {e}", markup=False)
+            return
+
+        if torrent is None:
+            console.print(f"[ERROR] Torrent with hash {infohash} not found!", markup=False)
+        else:
+            console.print(f"[INFO] Torrent {infohash} has completed!", markup=False)
 
     async def select_and_recheck_best_torrent(self, meta: dict[str, Any], path: str, check_interval: int = 5) -> bool:
         if not self.proxy_url and not self.qbt_client:
@@ -188,19 +165,13 @@ class Wait:
                 f"[yellow] Tracker: {str(best_torrent.get('trackers', 'unknown'))[:20]}[/yellow]"
             )
 
-        if self.proxy_url:
-            self.qbt_session = aiohttp.ClientSession()
-
         try:
             # Recheck the torrent
             if self.proxy_url:
-                if self.qbt_session is None:
-                    console.print("[bold red]qbt_session is not initialized")
-                    return False
                 if self.qbt_proxy_url is None:
                     console.print("[bold red]Proxy URL is not configured correctly")
                     return False
-                async with self.qbt_session.post(
+                async with aiohttp.ClientSession() as session, session.post(
                     f"{self.qbt_proxy_url}/api/v2/torrents/recheck",
                     data={'hashes': torrent_hash}
                 ) as response:
@@ -211,117 +182,38 @@ class Wait:
                 if self.qbt_client is None:
                     console.print("[bold red]qbt_client is not initialized")
                     return False
-                self.qbt_client.torrents_recheck(torrent_hashes=torrent_hash)
+                await asyncio.to_thread(self.qbt_client.torrents_recheck, torrent_hashes=torrent_hash)
 
+            # Give the client time to queue the check before its state is trusted
             await asyncio.sleep(3)
         except Exception as e:
             console.print(f"[bold red]Failed to recheck torrent: {e}")
             return False
 
+        def report_progress(torrent: dict[str, Any]) -> None:
+            progress = torrent.get('progress', 0)
+            try:
+                progress_float = float(progress or 0)
+            except (TypeError, ValueError):
+                progress_float = 0.0
+            console.print(f"\r[INFO] Torrent is at {progress_float * 100:.2f}% progress of {torrent.get('state', 'unknown')}...", end='', markup=False)
+
         try:
-            while True:
-                if self.proxy_url:
-                    if self.qbt_session is None:
-                        console.print("[bold red]qbt_session is not initialized")
-                        return False
-                    if self.qbt_proxy_url is None:
-                        console.print("[bold red]Proxy URL is not configured correctly")
-                        return False
-                    async with self.qbt_session.get(
-                        f"{self.qbt_proxy_url}/api/v2/torrents/info",
-                        params={'hashes': torrent_hash}
-                    ) as response:
-                        if response.status == 200:
-                            torrents_data = cast(list[dict[str, Any]], await response.json())
-                            if torrents_data:
-                                torrent = torrents_data[0]
-                                state = torrent.get('state')
-                                progress = torrent.get('progress', 0)
-                                state_str = str(state) if state is not None else 'unknown'
-                                try:
-                                    progress_float = float(progress or 0)
-                                except (TypeError, ValueError):
-                                    progress_float = 0.0
-                            else:
-                                raise Exception("No torrents found in response")
-                        else:
-                            console.print(f"[bold red]Failed to get torrent info via proxy: {response.status}")
-                            return False
-                else:
-                    if self.qbt_client is None:
-                        console.print("[bold red]qbt_client is not initialized")
-                        return False
-                    torrent_list_raw = cast(Any, self.qbt_client.torrents_info(hashes=torrent_hash))
-                    if torrent_list_raw is None:
-                        raise Exception("qBittorrent returned no torrent info")
-                    if isinstance(torrent_list_raw, list):
-                        torrent_candidates = cast(list[Any], torrent_list_raw)
-                    elif isinstance(torrent_list_raw, tuple):
-                        torrent_candidates = list(cast(tuple[Any, ...], torrent_list_raw))
-                    else:
-                        torrent_candidates = [torrent_list_raw]
-                    if not torrent_candidates:
-                        raise Exception("No torrents found in TorrentInfoList")
-                    torrent = torrent_candidates[0]
-                    state = getattr(torrent, 'state', None)
-                    progress = getattr(torrent, 'progress', 0)
-                    state_str = str(state) if state is not None else 'unknown'
-                    progress_float = float(progress or 0)
-
-                console.print(f"\r[INFO] Torrent is at {progress_float * 100:.2f}% progress of {state_str}...", end='', markup=False)
-
-                if state_str not in ('checkingUP', 'checkingDL', 'checkingResumeData'):
-                    console.print("", markup=False)
-                    break
-
-                await asyncio.sleep(check_interval)
-
-            # Get final torrent info
-            if self.proxy_url:
-                if self.qbt_session is None:
-                    console.print("[bold red]qbt_session is not initialized")
-                    return False
-                if self.qbt_proxy_url is None:
-                    console.print("[bold red]Proxy URL is not configured correctly")
-                    return False
-                async with self.qbt_session.get(
-                    f"{self.qbt_proxy_url}/api/v2/torrents/info",
-                    params={'hashes': torrent_hash}
-                ) as response:
-                    if response.status == 200:
-                        torrents_data = cast(list[dict[str, Any]], await response.json())
-                        if torrents_data:
-                            torrent = torrents_data[0]
-                            final_state = torrent.get('state')
-                            final_progress = torrent.get('progress', 0)
-                        else:
-                            raise Exception("No torrents found in response")
-                    else:
-                        console.print(f"[bold red]Failed to get final torrent info via proxy: {response.status}")
-                        return False
-            else:
-                if self.qbt_client is None:
-                    console.print("[bold red]qbt_client is not initialized")
-                    return False
-                torrent_list_raw = cast(Any, self.qbt_client.torrents_info(hashes=torrent_hash))
-                if torrent_list_raw is None:
-                    raise Exception("qBittorrent returned no torrent info")
-                if isinstance(torrent_list_raw, list):
-                    torrent_candidates = cast(list[Any], torrent_list_raw)
-                elif isinstance(torrent_list_raw, tuple):
-                    torrent_candidates = list(cast(tuple[Any, ...], torrent_list_raw))
-                else:
-                    torrent_candidates = [torrent_list_raw]
-                if not torrent_candidates:
-                    raise Exception("No torrents found in TorrentInfoList")
-                torrent = torrent_candidates[0]
-                final_state = getattr(torrent, 'state', 'unknown')
-                final_progress = float(getattr(torrent, 'progress', 0) or 0)
+            torrent = await self._watcher(check_interval).wait(
+                torrent_hash,
+                lambda torrent: torrent.get('state') not in CHECKING_STATES,
+                on_update=report_progress,
+            )
+            console.print("", markup=False)
+            if torrent is None:
+                raise Exception("No torrents found in response")
 
+            final_state = torrent.get('state', 'unknown')
+            final_progress = float(torrent.get('progress', 0) or 0)
             console.print(f"[green]Recheck completed. State: {final_state}, Progress: {final_progress*100:.2f}%[/green]")
             meta['we_rechecked_torrent'] = True
 
-            if final_state not in {'pausedUP', 'seeding', 'completed', 'stalledUP', 'uploading'}:
+            if final_state not in COMPLETED_STATES:
                 console.print("[yellow]Torrent needs to download missing data. Waiting for completion...[/yellow]")
                 await self.wait_for_completion(torrent_hash, check_interval)
 
@@ -331,6 +223,3 @@ class Wait:
             console.print(f"[bold red]Error while waiting for recheck: {e}")
             traceback.print_exc()
             return False
-        finally:
-            if self.qbt_session:
-                await self.qbt_session.close()
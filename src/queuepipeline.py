@@ -0,0 +1,191 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Pipelined queue execution.
+
+Runs several queue items at once, while capping how many items may be inside
+each heavy stage (prep, screenshots, torrent hashing, tracker uploads) at the
+same time. Outside of a pipelined run every stage gate is a no-op, so the
+classic one-item-at-a-time queue behaves exactly as before.
+"""
+import asyncio
+import contextlib
+import contextvars
+import time
+from collections.abc import AsyncIterator, Awaitable, Mapping, Sequence
+from typing import Any, Callable, Optional
+
+from src.cleanup import cleanup_manager
+from src.console import console
+
+PIPELINE_STAGES: tuple[str, ...] = ("prep", "screens", "torrent", "trackers")
+
+# No stage changes the working directory, every item works on absolute paths in
+# its own tmp folder. Screenshots (ffmpeg) and torrent hashing saturate the CPU
+# and disk on their own, so both default to a single slot.
+DEFAULT_STAGE_LIMITS: dict[str, int] = {
+    "prep": 2,
+    "screens": 1,
+    "torrent": 1,
+    "trackers": 2,
+}
+
+_active_pipeline: contextvars.ContextVar[Optional["QueuePipeline"]] = contextvars.ContextVar("ua_queue_pipeline", default=None)
+
+
+def _as_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class ProcessedLog:
+    """Holds processed-file log writes back until every earlier queue item has finished, so the log stays in queue order."""
+
+    def __init__(self) -> None:
+        self._pending: dict[int, list[Callable[[], Awaitable[None]]]] = {}
+        self._finished: set[int] = set()
+        self._next_index = 0
+        self._lock = asyncio.Lock()
+
+    def record(self, index: int, write: Callable[[], Awaitable[None]]) -> None:
+        self._pending.setdefault(index, []).append(write)
+
+    async def finish(self, index: int) -> None:
+        async with self._lock:
+            self._finished.add(index)
+            while self._next_index in self._finished:
+                for write in self._pending.pop(self._next_index, []):
+                    try:
+                        await write()
+                    except Exception as e:  # noqa: PERF203 - one failed write must not drop the rest
+                        console.print(f"[red]Error writing processed files log: {e}[/red]")
+                self._finished.discard(self._next_index)
+                self._next_index += 1
+
+
+class QueuePipeline:
+    def __init__(self, items_in_flight: int, stage_limits: Optional[Mapping[str, int]] = None, debug: bool = False) -> None:
+        self.items_in_flight = max(1, items_in_flight)
+        self.debug = debug
+        limits = dict(DEFAULT_STAGE_LIMITS)
+        limits.update(stage_limits or {})
+        self.stage_limits = {name: max(1, limit) for name, limit in limits.items()}
+        self._stage_semaphores = {name: asyncio.Semaphore(limit) for name, limit in self.stage_limits.items()}
+        self.stage_busy_time: dict[str, float] = dict.fromkeys(self.stage_limits, 0.0)
+        self.stage_wait_time: dict[str, float] = dict.fromkeys(self.stage_limits, 0.0)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any], meta: Mapping[str, Any], total_items: int) -> Optional["QueuePipeline"]:
+        """Build a pipeline for this run, or return None when the queue should run sequentially."""
+        default_cfg: Mapping[str, Any] = config.get('DEFAULT', {})
+        items_in_flight = _as_int(meta.get('queue_pipeline') or default_cfg.get('queue_pipeline_items', 0), 0)
+        if items_in_flight <= 1 or total_items <= 1:
+            return None
+        if meta.get('queue') is None and not meta.get('site_upload_queue'):
+            return None
+
+        unattended = meta.get('unattended', False) or str(default_cfg.get('auto_mode', False)).lower() == "true"
+        if not unattended:
+            console.print("[yellow]Queue pipeline requires unattended mode, processing the queue one item at a time.[/yellow]")
+            return None
+
+        stage_limits = {
+            stage: _as_int(default_cfg.get(f'queue_pipeline_{stage}'), DEFAULT_STAGE_LIMITS[stage])
+            for stage in PIPELINE_STAGES
+        }
+        return cls(items_in_flight, stage_limits, debug=bool(meta.get('debug', False)))
+
+    @contextlib.asynccontextmanager
+    async def stage(self, name: str) -> AsyncIterator[None]:
+        semaphore = self._stage_semaphores.get(name)
+        if semaphore is None:
+            yield
+            return
+
+        wait_started = time.perf_counter()
+        async with semaphore:
+            started = time.perf_counter()
+            self.stage_wait_time[name] += started - wait_started
+            try:
+                yield
+            finally:
+                self.stage_busy_time[name] += time.perf_counter() - started
+
+    async def run(
+        self,
+        items: Sequence[Any],
+        worker: Callable[[int, Any], Awaitable[bool]],
+        processed_log: ProcessedLog,
+        admit: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """
+        Run ``worker(index, item)`` for every queue item with at most ``items_in_flight`` running.
+        A worker returning True (limit_queue reached) stops any further items from starting.
+        While ``admit()`` returns False (every limit_queue slot is taken by a running item)
+        the next item waits for a running one to finish, and is dropped if none is left.
+        """
+        console.print(
+            f"[cyan]Queue pipeline: {self.items_in_flight} items in flight | "
+            + ", ".join(f"{name}={limit}" for name, limit in self.stage_limits.items())
+            + "[/cyan]"
+        )
+        slots = asyncio.Semaphore(self.items_in_flight)
+        stop = asyncio.Event()
+        started = time.perf_counter()
+
+        async def run_item(index: int, item: Any) -> None:
+            try:
+                if await worker(index, item):
+                    stop.set()
+            except Exception as e:
+                console.print(f"[bold red]Queue item {index + 1} failed: {e}[/bold red]")
+            finally:
+                slots.release()
+                await processed_log.finish(index)
+
+        token = _active_pipeline.set(self)
+        tasks: list[asyncio.Task[None]] = []
+        try:
+            # Per-item cleanup would cancel the other items' tasks and kill their ffmpeg processes,
+            # so it is held off until the whole queue has drained.
+            with cleanup_manager.deferred():
+                for index, item in enumerate(items):
+                    await slots.acquire()
+                    while admit is not None and not stop.is_set() and not admit():
+                        running = [task for task in tasks if not task.done()]
+                        if not running:
+                            stop.set()
+                            break
+                        await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    if stop.is_set():
+                        slots.release()
+                        break
+                    tasks.append(asyncio.create_task(run_item(index, item)))
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            _active_pipeline.reset(token)
+
+        await cleanup_manager.cleanup()
+
+        if self.debug:
+            elapsed = time.perf_counter() - started
+            console.print(f"[cyan]Queue pipeline finished {len(tasks)} items in {elapsed:.2f}s[/cyan]")
+            for name in self.stage_limits:
+                console.print(
+                    f"[cyan]  {name}: busy {self.stage_busy_time[name]:.2f}s, waiting {self.stage_wait_time[name]:.2f}s[/cyan]"
+                )
+
+
+@contextlib.asynccontextmanager
+async def pipeline_stage(name: str) -> AsyncIterator[None]:
+    """Gate a pipeline stage. Does nothing unless a pipelined queue run is active."""
+    pipeline = _active_pipeline.get()
+    if pipeline is None:
+        yield
+        return
+    async with pipeline.stage(name):
+        yield
@@ -386,11 +386,12 @@ async def _handle_image_upload(
 
     # Fallback: glob for indexed screenshots if still not enough
     if len(all_screenshots) < multi_screens:
-        os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
+        # Queue items run side by side, so screenshots are found by absolute path rather than through the working directory
+        screens_dir = glob.escape(os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}"))
         image_patterns = ["*.png", ".[!.]*.png"]
         image_glob: list[str] = []
         for pattern in image_patterns:
-            glob_results = await asyncio.to_thread(glob.glob, pattern)
+            glob_results = await asyncio.to_thread(glob.glob, os.path.join(screens_dir, pattern))
             image_glob.extend(glob_results)
             if meta['debug']:
                 console.print(f"[cyan]Found {len(image_glob)} files matching pattern: {pattern}")
@@ -398,11 +399,11 @@ async def _handle_image_upload(
         unwanted_patterns = ["FILE*", "PLAYLIST*", "POSTER*"]
         unwanted_files: set[str] = set()
         for pattern in unwanted_patterns:
-            glob_results = await asyncio.to_thread(glob.glob, pattern)
+            glob_results = await asyncio.to_thread(glob.glob, os.path.join(screens_dir, pattern))
             unwanted_files.update(glob_results)
             if pattern.startswith("FILE") or pattern.startswith("PLAYLIST") or pattern.startswith("POSTER"):
                 hidden_pattern = "." + pattern
-                hidden_glob_results = await asyncio.to_thread(glob.glob, hidden_pattern)
+                hidden_glob_results = await asyncio.to_thread(glob.glob, os.path.join(screens_dir, hidden_pattern))
                 unwanted_files.update(hidden_glob_results)
 
         # Remove unwanted files
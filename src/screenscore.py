@@ -0,0 +1,114 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Content based screenshot scoring.
+
+Candidate timestamps are decoded once as small greyscale thumbnails and scored
+from their pixel statistics, so black, fading, flat and credit frames can be
+skipped before any full resolution screenshot is taken. All the arithmetic
+runs inside Pillow (histogram, ImageStat, edge filter), no per pixel Python.
+"""
+from collections.abc import Sequence
+from typing import NamedTuple, Optional
+
+from PIL import Image, ImageFilter, ImageStat
+
+# Size of the thumbnails decoded for scoring
+SCORE_WIDTH = 160
+SCORE_HEIGHT = 90
+
+# Luma levels on an 8 bit scale. Limited range black sits at 16
+DARK_LEVEL = 28
+BRIGHT_LEVEL = 170
+
+
+class FrameScore(NamedTuple):
+    score: float
+    mean: float
+    contrast: float
+    detail: float
+    dark_fraction: float
+    reason: str = ""
+
+    @property
+    def rejected(self) -> bool:
+        return bool(self.reason)
+
+
+def score_image(image: Image.Image) -> FrameScore:
+    """Score a frame, higher is better. Frames that should never be used get a zero score and a reason."""
+    gray = image.convert("L")
+    if gray.size != (SCORE_WIDTH, SCORE_HEIGHT):
+        gray = gray.resize((SCORE_WIDTH, SCORE_HEIGHT), Image.Resampling.BILINEAR)
+
+    stat = ImageStat.Stat(gray)
+    mean = float(stat.mean[0])
+    contrast = float(stat.stddev[0])
+    # The edge filter lights up the image border, so the outermost pixels are left out
+    edges = gray.filter(ImageFilter.FIND_EDGES).crop((1, 1, SCORE_WIDTH - 1, SCORE_HEIGHT - 1))
+    detail = float(ImageStat.Stat(edges).mean[0])
+
+    histogram = gray.histogram()
+    pixels = float(sum(histogram)) or 1.0
+    dark_fraction = sum(histogram[:DARK_LEVEL]) / pixels
+    bright_fraction = sum(histogram[BRIGHT_LEVEL:]) / pixels
+
+    reason = ""
+    if mean < DARK_LEVEL and contrast < 8:
+        reason = "black"
+    elif contrast < 10 and detail < 3:
+        reason = "flat"
+    elif mean < 48 and contrast < 16:
+        reason = "fade"
+    elif dark_fraction > 0.85 and bright_fraction < 0.08:
+        # Mostly black with some lighter text: credits and title cards
+        reason = "credits"
+
+    if reason:
+        return FrameScore(0.0, mean, contrast, detail, dark_fraction, reason)
+
+    # Reward contrast and texture, penalise frames that are largely dark beyond typical letterboxing
+    score = (contrast + 2.0 * detail) * (1.0 - max(0.0, dark_fraction - 0.3))
+    return FrameScore(score, mean, contrast, detail, dark_fraction)
+
+
+def score_image_file(path: str) -> Optional[FrameScore]:
+    try:
+        with Image.open(path) as image:
+            return score_image(image)
+    except (OSError, ValueError):
+        return None
+
+
+def pick_best(times: Sequence[str], scores: Sequence[Optional[FrameScore]], count: int) -> tuple[list[str], list[str]]:
+    """
+    Pick ``count`` timestamps from chronologically ordered candidates.
+
+    The candidates are split into ``count`` consecutive windows and the best frame
+    of each window is taken, which keeps the screenshots spread over the runtime.
+    Returns the chosen timestamps and the remaining usable candidates, best first,
+    to be used as retake times.
+    """
+    if count <= 0 or not times:
+        return [], []
+
+    def rank(position: int) -> tuple[int, float]:
+        score = scores[position]
+        if score is None:
+            # Unscored candidates rank above rejected ones but below anything scored as usable
+            return (1, 0.0)
+        return (0 if score.rejected else 2, score.score)
+
+    chosen: list[int] = []
+    total = len(times)
+    for window in range(min(count, total)):
+        start = window * total // count
+        end = max(start + 1, (window + 1) * total // count)
+        chosen.append(max(range(start, end), key=rank))
+
+    chosen_set = set(chosen)
+    spares = sorted(
+        (position for position in range(total) if position not in chosen_set and rank(position)[0] > 0),
+        key=rank,
+        reverse=True,
+    )
+    return [times[position] for position in chosen], [times[position] for position in spares]
@@ -0,0 +1,91 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Common plumbing of the SQLite caches under ``data/cache``.
+
+Each cache subclasses ``SQLiteCache`` with its file name, schema and a label
+for warnings, and only writes its own queries. A connection is opened per
+operation (the database is shared by threads, queue items and concurrent
+runs) and the tables are created on first use. Queries are passed to
+``read`` and ``write`` as functions of the connection. A SQLite error never
+fails the caller: it is printed as a warning, ``read`` returns its default
+and ``write`` skips the update, so the caller carries on uncached.
+
+All methods are synchronous, async callers run them through
+``asyncio.to_thread``.
+"""
+import contextlib
+import os
+import sqlite3
+from collections.abc import Mapping
+from typing import Any, Callable, ClassVar, TypeVar
+
+from src.console import console
+
+T = TypeVar("T")
+
+
+class SQLiteCache:
+    # Database file under data/cache
+    file_name: ClassVar[str] = ""
+    # CREATE TABLE / CREATE INDEX statements, run on every connection
+    schema: ClassVar[tuple[str, ...]] = ()
+    # Name of the cache in warnings, such as "MediaInfo cache"
+    label: ClassVar[str] = "cache"
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+
+    @classmethod
+    def default_path(cls, base_dir: str) -> str:
+        return os.path.join(base_dir, "data", "cache", cls.file_name)
+
+    @classmethod
+    def meta_path(cls, meta: Mapping[str, Any]) -> str:
+        return cls.default_path(str(meta['base_dir']))
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            for statement in self.schema:
+                conn.execute(statement)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _run(self, operation: Callable[[sqlite3.Connection], T], default: T, action: str) -> T:
+        try:
+            with contextlib.closing(self._connect()) as conn, conn:
+                return operation(conn)
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Could not {action} {self.label}: {e}")
+            return default
+
+    def read(self, query: Callable[[sqlite3.Connection], T], default: T) -> T:
+        """``query(conn)`` in a transaction, or ``default`` when the database can not be read."""
+        return self._run(query, default, "read")
+
+    def write(self, update: Callable[[sqlite3.Connection], None]) -> None:
+        """``update(conn)`` in a transaction that is committed when it returns."""
+        self._run(update, None, "update")
+
+    @staticmethod
+    def trim_to_rows(conn: sqlite3.Connection, table: str, max_rows: int) -> None:
+        """Keep the ``max_rows`` most recently used rows of ``table`` (a ``key`` and ``last_used`` column)."""
+        conn.execute(
+            f"DELETE FROM {table} WHERE key NOT IN (SELECT key FROM {table} ORDER BY last_used DESC LIMIT ?)",  # nosec B608 - table and column names are constants
+            (max_rows,),
+        )
+
+    @staticmethod
+    def trim_to_bytes(conn: sqlite3.Connection, table: str, size_sql: str, max_bytes: int) -> None:
+        """Drop least recently used rows of ``table`` until the rows' ``size_sql`` adds up to at most ``max_bytes``."""
+        total = int(conn.execute(f"SELECT COALESCE(SUM({size_sql}), 0) FROM {table}").fetchone()[0])  # nosec B608 - table and column names are constants
+        if total <= max_bytes:
+            return
+        for key, length in conn.execute(f"SELECT key, {size_sql} FROM {table} ORDER BY last_used ASC").fetchall():  # nosec B608 - table and column names are constants
+            conn.execute(f"DELETE FROM {table} WHERE key = ?", (key,))  # nosec B608 - table and column names are constants
+            total -= int(length)
+            if total <= max_bytes:
+                break
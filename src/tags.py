@@ -6,18 +6,12 @@ import re
 from pathlib import Path
 from typing import Any, Callable, Optional, cast
 
-import guessit
-
 from src.console import console
+from src.name_parsing import guessit_fn
 
-guessit_module: Any = cast(Any, guessit)
 GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
 
 
-def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-    return cast(dict[str, Any], guessit_module.guessit(value, options))
-
-
 async def get_tag(video: str, meta: dict[str, Any], season_pack_check: bool = False) -> str:
     # Using regex from cross-seed (https://github.com/cross-seed/cross-seed/tree/master?tab=Apache-2.0-1-ov-file)
     release_group = None
@@ -60,7 +54,7 @@ async def get_tag(video: str, meta: dict[str, Any], season_pack_check: bool = Fa
     # If regex patterns didn't work, fall back to guessit
     if not release_group and meta.get('is_disc'):
         try:
-            parsed = guessit_fn(video)
+            parsed = await asyncio.to_thread(guessit_fn, video)
             release_group = cast(Optional[str], parsed.get('release_group'))
             if meta['debug']:
                 console.print(f"Guessit match: {release_group}")
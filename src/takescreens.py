@@ -20,11 +20,15 @@ from pymediainfo import MediaInfo
 
 from src.cleanup import cleanup_manager
 from src.console import console
+from src.screenscore import SCORE_HEIGHT, SCORE_WIDTH, FrameScore, pick_best, score_image_file
 
 default_config: dict[str, Any] = {}
 task_limit = 1
 cutoff = 1
 ffmpeg_limit = False
+batch_screenshots = True
+screenshot_scoring = True
+screenshot_candidates = 3
 ffmpeg_is_good = False
 use_libplacebo = True
 tone_map = False
@@ -35,7 +39,8 @@ desat = 10.0
 
 def _apply_config(config: Mapping[str, Any]) -> None:
     global default_config, task_limit, cutoff
-    global ffmpeg_limit, ffmpeg_is_good, use_libplacebo
+    global ffmpeg_limit, batch_screenshots, ffmpeg_is_good, use_libplacebo
+    global screenshot_scoring, screenshot_candidates
     global tone_map, ffmpeg_compression, algorithm, desat
 
     default_section = config.get('DEFAULT', {})
@@ -52,6 +57,12 @@ def _apply_config(config: Mapping[str, Any]) -> None:
         cutoff = 1
 
     ffmpeg_limit = default_config.get('ffmpeg_limit', False)
+    batch_screenshots = default_config.get('batch_screenshots', True)
+    screenshot_scoring = default_config.get('screenshot_scoring', True)
+    try:
+        screenshot_candidates = max(1, int(default_config.get('screenshot_candidates', 3) or 3))
+    except (TypeError, ValueError):
+        screenshot_candidates = 3
     ffmpeg_is_good = default_config.get('ffmpeg_is_good', False)
     use_libplacebo = default_config.get('use_libplacebo', True)
     tone_map = default_config.get('tone_map', False)
@@ -171,8 +182,7 @@ async def disc_screenshots(
     keyframe = 'nokey' if "VC-1" in bdinfo['video'][0]['codec'] or bdinfo['video'][0]['hdr_dv'] != "" else 'none'
     if meta['debug']:
         console.print(f"File: {file_path}, Length: {length}, Frame Rate: {frame_rate}", markup=False)
-    os.chdir(f"{base_dir}/tmp/{folder_id}")
-    existing_screens = glob.glob(f"{sanitized_filename}-*.png")
+    existing_screens = glob.glob(os.path.join(glob.escape(f"{base_dir}/tmp/{folder_id}"), f"{glob.escape(sanitized_filename)}-*.png"))
     total_existing = len(existing_screens) + len(existing_images)
     num_screens = max(0, screens - total_existing) if not force_screenshots else num_screens
 
@@ -576,7 +586,6 @@ async def dvd_screenshots(
         return fallback_duration, 0.0
 
     main_set = meta['discs'][disc_num]['main_set'][1:] if len(meta['discs'][disc_num]['main_set']) > 1 else meta['discs'][disc_num]['main_set']
-    os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
     voblength, _vob_index = await _is_vob_good(0, 0, num_screens)
     ss_times = await valid_ss_time([], num_screens, voblength, frame_rate, meta, retake=retry_cap)
     capture_tasks: list[Awaitable[tuple[int, Optional[str]]]] = []
@@ -932,7 +941,6 @@ async def screenshots(
         return None
     meta['frame_rate'] = frame_rate
     loglevel = 'verbose' if meta.get('ffdebug', False) else 'quiet'
-    os.chdir(f"{base_dir}/tmp/{folder_id}")
 
     if manual_frames and meta['debug']:
         console.print(f"[yellow]Using manual frames: {manual_frames}")
@@ -974,8 +982,22 @@ async def screenshots(
 
     num_capture = num_screens - existing_images_count
 
+    # Candidate times not used for the screenshots, best first, tried before blind offsets on a retake
+    spare_times: list[str] = []
     if not ss_times:
-        ss_times = await valid_ss_time([], num_capture, length, frame_rate, meta, retake=force_screenshots)
+        if screenshot_scoring and screenshot_candidates > 1:
+            candidate_times = await valid_ss_time([], num_capture * screenshot_candidates, length, frame_rate, meta, retake=force_screenshots)
+            candidate_times.sort(key=float)
+            candidate_scores = await score_candidate_times(path, candidate_times, f"{base_dir}/tmp/{folder_id}/score", loglevel, meta)
+            # Without any scores this still spreads the picks evenly over the candidates
+            ss_times, spare_times = pick_best(candidate_times, candidate_scores, num_capture)
+            if meta['debug']:
+                rejected = [f"{float(t):.1f}s ({score.reason})" for t, score in zip(candidate_times, candidate_scores) if score is not None and score.rejected]
+                console.print(f"[cyan]Scored {len(candidate_times)} candidate frames, picked {[f'{float(t):.1f}s' for t in ss_times]}[/cyan]")
+                if rejected:
+                    console.print(f"[cyan]Rejected candidates: {', '.join(rejected)}[/cyan]")
+        else:
+            ss_times = await valid_ss_time([], num_capture, length, frame_rate, meta, retake=force_screenshots)
 
     if meta.get('frame_overlay', False):
         if meta['debug']:
@@ -1045,19 +1067,31 @@ async def screenshots(
         async with semaphore:
             return await capture_screenshot(args)
 
-    capture_tasks: list[Awaitable[Optional[tuple[int, Optional[str]]]]] = []
+    pending_captures: list[tuple[int, float, str]] = []
     for i in range(num_capture):
         image_index = existing_images_count + i
         image_path = os.path.abspath(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{image_index}.png")
         if not os.path.exists(image_path) or meta.get('retake', False):
-            capture_tasks.append(
-                capture_with_semaphore(
-                    (i, path, float(ss_times[i]), image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
-                )
-            )
+            pending_captures.append((i, float(ss_times[i]), image_path))
 
     try:
-        results = cast(list[object], await asyncio.gather(*capture_tasks, return_exceptions=True))
+        results: list[object] = []
+        # Frame overlays need per-frame drawtext filters, so they always go through the per-frame path
+        if batch_screenshots and len(pending_captures) > 1 and not meta.get('frame_overlay', False):
+            batch_results = await capture_screenshots_batch(path, pending_captures, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
+            captured_indexes = {index for index, image_path in batch_results if image_path is not None}
+            results.extend(result for result in batch_results if result[0] in captured_indexes)
+            if len(captured_indexes) < len(pending_captures):
+                console.print(f"[yellow]Batch capture missed {len(pending_captures) - len(captured_indexes)} screenshot(s), retrying them one by one.[/yellow]")
+            pending_captures = [capture for capture in pending_captures if capture[0] not in captured_indexes]
+
+        capture_tasks: list[Awaitable[Optional[tuple[int, Optional[str]]]]] = [
+            capture_with_semaphore(
+                (i, path, ss_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
+            )
+            for i, ss_time, image_path in pending_captures
+        ]
+        results.extend(cast(list[object], await asyncio.gather(*capture_tasks, return_exceptions=True)))
         # Log any error strings that were returned (these indicate exceptions in capture_screenshot)
         for r in results:
             if isinstance(r, Exception):
@@ -1099,6 +1133,15 @@ async def screenshots(
     if not force_screenshots and meta['debug']:
         console.print(f"[green]Successfully captured {len(capture_results)} screenshots.")
 
+    def retake_size_ok(size: int) -> bool:
+        if img_host and "imgbb" in img_host:
+            return 75000 < size <= 31000000
+        if img_host and img_host in ["imgbox", "pixhost"]:
+            return 75000 < size <= 10000000
+        if img_host and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"]:
+            return size > 75000
+        return False
+
     valid_results: list[str] = []
     remaining_retakes: list[str] = []
     for image_path in capture_results:
@@ -1135,91 +1178,41 @@ async def screenshots(
         if retake:
             retry_attempts = 5
             retry_offsets = [5.0, 10.0, -10.0, 100.0, -100.0]
-            frame_rate = meta.get('frame_rate', 24.0)
             original_index = int(image_path.rsplit('-', 1)[-1].split('.')[0])
             original_time = ss_times[original_index] if original_index < len(ss_times) else None
 
-            for attempt in range(1, retry_attempts + 1):
-                if original_time is not None:
-                    for offset in retry_offsets:
-                        adjusted_time = max(0, float(original_time) + offset)
-                        console.print(f"[yellow]Retaking screenshot for: {image_path} (Attempt {attempt}/{retry_attempts}) at {adjusted_time:.2f}s (offset {offset:+.2f}s)[/yellow]")
-                        try:
-                            if os.path.exists(image_path):
-                                os.remove(image_path)
-
-                            screenshot_response = await capture_screenshot((
-                                original_index, path, adjusted_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta
-                            ))
-
-                            if not isinstance(screenshot_response, tuple) or len(screenshot_response) != 2:
-                                continue
-
-                            _, screenshot_path = screenshot_response
-
-                            if not screenshot_path or not os.path.exists(screenshot_path):
-                                continue
-
-                            new_size = os.path.getsize(screenshot_path)
-                            valid_image = False
-
-                            if img_host and "imgbb" in img_host:
-                                if 75000 < new_size <= 31000000:
-                                    console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
-                                    valid_image = True
-                            elif img_host and img_host in ["imgbox", "pixhost"]:
-                                if 75000 < new_size <= 10000000:
-                                    console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
-                                    valid_image = True
-                            elif img_host and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"] and new_size > 75000:
-                                console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
-                                valid_image = True
-
-                            if valid_image:
-                                valid_results.append(screenshot_path)
-                                break
-                        except Exception as e:
-                            console.print(f"[red]Error retaking screenshot for {image_path} at {adjusted_time:.2f}s: {e}[/red]")
-                    else:
-                        continue
-                    break
-                else:
-                    # Fallback: use random time if original_time is not available
-                    random_time = random.uniform(0, length)  # nosec B311 - Random screenshot timing, not cryptographic
-                    console.print(f"[yellow]Retaking screenshot for: {image_path} (Attempt {attempt}/{retry_attempts}) at random time {random_time:.2f}s[/yellow]")
-                    try:
-                        if os.path.exists(image_path):
-                            os.remove(image_path)
-
-                        screenshot_response = await capture_screenshot((
-                            original_index, path, random_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta
-                        ))
+            # Best unused scored candidates first, then fixed offsets around the original time
+            retry_times: list[float] = [float(spare_times.pop(0)) for _ in range(min(retry_attempts, len(spare_times)))]
+            if original_time is not None:
+                retry_times.extend(max(0.0, float(original_time) + offset) for offset in retry_offsets)
+            else:
+                retry_times.extend(random.uniform(0, length) for _ in range(retry_attempts))  # nosec B311 - Random screenshot timing, not cryptographic
 
-                        if not isinstance(screenshot_response, tuple) or len(screenshot_response) != 2:
-                            continue
+            for attempt, retry_time in enumerate(retry_times, start=1):
+                console.print(f"[yellow]Retaking screenshot for: {image_path} (Attempt {attempt}/{len(retry_times)}) at {retry_time:.2f}s[/yellow]")
+                try:
+                    if os.path.exists(image_path):
+                        os.remove(image_path)
 
-                        _, screenshot_path = screenshot_response
+                    screenshot_response = await capture_screenshot((
+                        original_index, path, retry_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta
+                    ))
 
-                        if not screenshot_path or not os.path.exists(screenshot_path):
-                            continue
+                    if not isinstance(screenshot_response, tuple) or len(screenshot_response) != 2:
+                        continue
 
-                        new_size = os.path.getsize(screenshot_path)
-                        valid_image = False
+                    _, screenshot_path = screenshot_response
 
-                        if img_host and "imgbb" in img_host:
-                            if 75000 < new_size <= 31000000:
-                                valid_image = True
-                        elif img_host and img_host in ["imgbox", "pixhost"]:
-                            if 75000 < new_size <= 10000000:
-                                valid_image = True
-                        elif img_host and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"] and new_size > 75000:
-                            valid_image = True
+                    if not screenshot_path or not os.path.exists(screenshot_path):
+                        continue
 
-                        if valid_image:
-                            valid_results.append(screenshot_path)
-                            break
-                    except Exception as e:
-                        console.print(f"[red]Error retaking screenshot for {image_path} at random time {random_time:.2f}s: {e}[/red]")
+                    new_size = os.path.getsize(screenshot_path)
+                    if retake_size_ok(new_size):
+                        console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
+                        valid_results.append(screenshot_path)
+                        break
+                except Exception as e:  # noqa: PERF203 - keep trying the remaining retake times
+                    console.print(f"[red]Error retaking screenshot for {image_path} at {retry_time:.2f}s: {e}[/red]")
             else:
                 console.print(f"[red]All retry attempts failed for {image_path}. Skipping.[/red]")
                 remaining_retakes.append(image_path)
@@ -1537,6 +1530,124 @@ async def capture_screenshot(args: tuple[int, str, float, str, float, float, flo
         return None
 
 
+async def capture_screenshots_batch(
+        path: str,
+        captures: list[tuple[int, float, str]],
+        width: float,
+        height: float,
+        w_sar: float,
+        h_sar: float,
+        loglevel: str,
+        hdr_tonemap: bool,
+        meta: dict[str, Any],
+) -> list[tuple[int, Optional[str]]]:
+    """
+    Capture several screenshots (index, ss_time, image_path) with a single ffmpeg process.
+
+    Every timestamp is opened as its own input with input seeking, so each one
+    seeks to the nearest keyframe and decodes forward to the exact frame, and is
+    mapped through the same filter chain to its own PNG. Process startup, hardware
+    device and tonemap setup are paid once instead of once per screenshot.
+    Entries that could not be captured are returned with a None path so the
+    caller can retry them one by one.
+    """
+    debug = loglevel == 'verbose' or bool(meta.get('debug', False))
+    if not captures or width <= 0 or height <= 0:
+        return [(index, None) for index, _, _ in captures]
+
+    vf_filters: list[str] = []
+    if w_sar != 1 or h_sar != 1:
+        vf_filters.append(f"scale={int(round(width * w_sar))}:{int(round(height * h_sar))}")
+    if hdr_tonemap:
+        if meta.get('libplacebo', False):
+            vf_filters.append(
+                "libplacebo=tonemapping=hable:colorspace=bt709:"
+                "color_primaries=bt709:color_trc=bt709:range=tv"
+            )
+        else:
+            vf_filters.extend([
+                "zscale=transfer=linear",
+                f"tonemap=tonemap={algorithm}:desat={desat}",
+                "zscale=transfer=bt709",
+            ])
+    vf_filters.append("format=rgb24")
+    vf_chain = ",".join(vf_filters)
+
+    outputs: list[Any] = []
+    for _, ss_time, image_path in captures:
+        if os.path.exists(image_path):
+            os.remove(image_path)
+        inp = cast(Any, ffmpeg).input(path, ss=str(max(0.0, ss_time)))
+        outputs.append(inp['v:0'].output(
+            image_path,
+            vframes=1,
+            vf=vf_chain,
+            compression_level=ffmpeg_compression,
+            pred='mixed'
+        ))
+
+    global_args = ['-y', '-loglevel', loglevel, '-hide_banner', '-an', '-sn']
+    if hdr_tonemap and meta.get('libplacebo', False):
+        global_args += ['-init_hw_device', 'vulkan']
+    if ffmpeg_limit:
+        global_args += ['-threads', '1']
+    info_cmd: Any = cast(Any, ffmpeg).merge_outputs(*outputs).global_args(*global_args)
+
+    if debug:
+        console.print(f"[cyan]Batch FFmpeg command: {' '.join(info_cmd.compile())}[/cyan]", emoji=False)
+
+    # Generous timeout: all inputs are decoded by one process
+    timeout_sec = 60.0 + 30.0 * len(captures)
+    try:
+        returncode, _, stderr = await asyncio.wait_for(run_ffmpeg(info_cmd), timeout=timeout_sec)
+    except asyncio.TimeoutError:
+        returncode, stderr = -1, b"Timeout"
+
+    results: list[tuple[int, Optional[str]]] = []
+    for index, _, image_path in captures:
+        captured = returncode == 0 and os.path.exists(image_path) and os.path.getsize(image_path) > 0
+        if not captured and os.path.exists(image_path):
+            # A failed run can leave truncated images behind
+            os.remove(image_path)
+        results.append((index, image_path if captured else None))
+
+    if debug:
+        captured_count = sum(1 for _, image_path in results if image_path)
+        console.print(f"[cyan]Batch capture produced {captured_count}/{len(captures)} screenshot(s)[/cyan]")
+        if returncode != 0:
+            console.print(f"[yellow]Batch FFmpeg failed: {(stderr or b'').decode(errors='replace').strip()}[/yellow]")
+    return results
+
+
+async def score_candidate_times(path: str, times: list[str], score_dir: str, loglevel: str, meta: dict[str, Any]) -> list[Optional[FrameScore]]:
+    """Decode a small greyscale thumbnail for every candidate time with one ffmpeg process and score it."""
+    os.makedirs(score_dir, exist_ok=True)
+    thumb_paths = [os.path.join(score_dir, f"candidate-{i}.pgm") for i in range(len(times))]
+    outputs: list[Any] = []
+    for ss_time, thumb_path in zip(times, thumb_paths):
+        inp = cast(Any, ffmpeg).input(path, ss=str(max(0.0, float(ss_time))))
+        outputs.append(inp['v:0'].output(thumb_path, vframes=1, vf=f"scale={SCORE_WIDTH}:{SCORE_HEIGHT},format=gray"))
+    info_cmd: Any = cast(Any, ffmpeg).merge_outputs(*outputs).global_args('-y', '-loglevel', loglevel, '-hide_banner', '-an', '-sn')
+    if ffmpeg_limit:
+        info_cmd = info_cmd.global_args('-threads', '1')
+
+    try:
+        returncode, _, stderr = await asyncio.wait_for(run_ffmpeg(info_cmd), timeout=60.0 + 5.0 * len(times))
+    except asyncio.TimeoutError:
+        returncode, stderr = -1, b"Timeout"
+    if returncode != 0 and meta.get('debug', False):
+        console.print(f"[yellow]Screenshot scoring ffmpeg failed: {(stderr or b'').decode(errors='replace').strip()}[/yellow]")
+
+    def _score_all() -> list[Optional[FrameScore]]:
+        scores = [score_image_file(thumb_path) if os.path.exists(thumb_path) else None for thumb_path in thumb_paths]
+        for thumb_path in thumb_paths:
+            if os.path.exists(thumb_path):
+                os.remove(thumb_path)
+        return scores
+
+    return await asyncio.to_thread(_score_all)
+
+
 async def valid_ss_time(ss_times: list[str], num_screens: int, length: float, frame_rate: float, meta: dict[str, Any], retake: bool = False) -> list[str]:
     total_screens = num_screens + 1 if meta['is_disc'] else num_screens
     total_frames = int(length * frame_rate)
@@ -1883,6 +1994,20 @@ class TakeScreensManager:
     ) -> Optional[tuple[int, Optional[str]]]:
         return await capture_screenshot(args)
 
+    async def capture_screenshots_batch(
+            self,
+            path: str,
+            captures: list[tuple[int, float, str]],
+            width: float,
+            height: float,
+            w_sar: float,
+            h_sar: float,
+            loglevel: str,
+            hdr_tonemap: bool,
+            meta: dict[str, Any],
+    ) -> list[tuple[int, Optional[str]]]:
+        return await capture_screenshots_batch(path, captures, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
+
     async def valid_ss_time(
             self,
             ss_times: list[str],
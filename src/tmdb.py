@@ -11,15 +11,15 @@ from typing import Any, Callable, Optional, Union
 from typing import cast as typing_cast
 
 import aiofiles
-import anitopy
 import cli_ui
-import guessit
 import httpx
 
 from src.args import Args
 from src.cleanup import cleanup_manager
 from src.console import console
 from src.imdb import imdb_manager
+from src.metadata_cache import metadata_client
+from src.name_parsing import anitopy_parse, guessit_fn
 
 default_config: dict[str, Any] = {}
 tmdb_api_key: Optional[str] = None
@@ -43,14 +43,9 @@ def _get_parser() -> Args:
         raise RuntimeError("TMDb parser is not initialized. Create TmdbManager with config first.")
     return parser
 
-anitopy_parse_fn: Any = typing_cast(Any, anitopy).parse
-guessit_module: Any = typing_cast(Any, guessit)
 GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
 
 
-def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-    return typing_cast(dict[str, Any], guessit_module.guessit(value, options))
-
 # Module-level dict to store async locks for cache keys to prevent race conditions
 _cache_locks: dict[str, asyncio.Lock] = {}
 
@@ -312,7 +307,7 @@ async def get_tmdb_from_imdb(
         url = f"{TMDB_BASE_URL}/find/{external_id}"
         params = {"api_key": tmdb_api_key, "external_source": source}
 
-        async with httpx.AsyncClient() as client:
+        async with metadata_client() as client:
             response: Optional[httpx.Response] = None
             try:
                 response = await client.get(url, params=params, timeout=10)
@@ -454,7 +449,7 @@ async def get_tmdb_id(
             final_attempt = False
         if attempted:
             await asyncio.sleep(1)  # Whoa baby, slow down
-        async with httpx.AsyncClient() as client:
+        async with metadata_client() as client:
             try:
                 # Primary search attempt with year
                 if category == "MOVIE":
@@ -894,7 +889,7 @@ async def get_tmdb_id(
     if not search_results.get('results'):
         try:
             parsed_guess = guessit_fn(untouched_filename or "", {"excludes": ["country", "language"]})
-            parsed_title_data = typing_cast(dict[str, Any], anitopy_parse_fn(parsed_guess.get('title', '')) or {})
+            parsed_title_data = typing_cast(dict[str, Any], anitopy_parse(parsed_guess.get('title', '')) or {})
             parsed_title = str(parsed_title_data.get('anime_title', ''))
             if debug:
                 console.print(f"[bold yellow]Trying parsed anime title: {parsed_title}[/bold yellow]")
@@ -1066,7 +1061,7 @@ async def tmdb_other_meta(
     year = None
     original_imdb_id = imdb_id
 
-    async with httpx.AsyncClient() as client:
+    async with metadata_client() as client:
         # Get main media details first (movie or TV show)
         main_url = f"{TMDB_BASE_URL}/{('movie' if category == 'MOVIE' else 'tv')}/{tmdb_id}"
 
@@ -1362,7 +1357,7 @@ async def get_keywords(tmdb_id: int, category: str) -> str:
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/keywords"
 
-    async with httpx.AsyncClient() as client:
+    async with metadata_client() as client:
         try:
             response = await client.get(url, params={"api_key": tmdb_api_key})
             try:
@@ -1411,7 +1406,7 @@ async def get_directors(tmdb_id: int, category: str) -> list[str]:
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/credits"
 
-    async with httpx.AsyncClient() as client:
+    async with metadata_client() as client:
         try:
             response = await client.get(url, params={"api_key": tmdb_api_key})
             try:
@@ -1528,7 +1523,7 @@ async def get_romaji(tmdb_name: str, mal: Optional[int], meta: dict[str, Any]) -
         url = 'https://graphql.anilist.co'
         for attempt in range(3):
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with metadata_client(timeout=30.0) as client:
                     response = await client.post(url, json={'query': query, 'variables': variables})
                 json_data = typing_cast(dict[str, Any], response.json())
 
@@ -1567,7 +1562,7 @@ async def get_romaji(tmdb_name: str, mal: Optional[int], meta: dict[str, Any]) -
     # Try parsing the filename with anitopy
     if expected_season is None and meta.get('filename'):
         try:
-            parsed = typing_cast(dict[str, Any], anitopy_parse_fn(meta['filename']) or {})
+            parsed = typing_cast(dict[str, Any], anitopy_parse(meta['filename']) or {})
             if parsed.get('anime_season'):
                 expected_season = int(parsed['anime_season'])
         except Exception:
@@ -1696,7 +1691,7 @@ def extract_imdb_id(value: str) -> Optional[int]:
 async def daily_to_tmdb_season_episode(tmdbid: int, date: Union[str, datetime]) -> tuple[int, int]:
     date = datetime.fromisoformat(str(date))
 
-    async with httpx.AsyncClient() as client:
+    async with metadata_client() as client:
         # Get TV show information to get seasons
         response = await client.get(
             f"{TMDB_BASE_URL}/tv/{tmdbid}",
@@ -1753,7 +1748,7 @@ async def get_episode_details(
 ) -> dict[str, Any]:
     if debug:
         console.print(f"[cyan]Fetching episode details for TMDb ID: {tmdb_id}, Season: {season_number}, Episode: {episode_number}[/cyan]")
-    async with httpx.AsyncClient() as client:
+    async with metadata_client() as client:
         try:
             # Get episode details
             response = await client.get(
@@ -1832,7 +1827,7 @@ async def get_season_details(
 ) -> dict[str, Any]:
     if debug:
         console.print(f"[cyan]Fetching season details for TMDb ID: {tmdb_id}, Season: {season_number}[/cyan]")
-    async with httpx.AsyncClient() as client:
+    async with metadata_client() as client:
         try:
             # Get season details
             response = await client.get(
@@ -1938,7 +1933,7 @@ async def get_logo(
                 console.print("[cyan]Using provided logo_json data instead of making an HTTP request[/cyan]")
         else:
             # Make HTTP request only if logo_json is not provided
-            async with httpx.AsyncClient() as client:
+            async with metadata_client() as client:
                 endpoint = "tv" if category == "TV" else "movie"
                 image_response = await client.get(
                     f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/images",
@@ -1993,7 +1988,7 @@ async def get_tmdb_translations(
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/translations"
 
-    async with httpx.AsyncClient() as client:
+    async with metadata_client() as client:
         try:
             response = await client.get(url, params={"api_key": tmdb_api_key})
             response.raise_for_status()
@@ -2150,7 +2145,7 @@ async def get_tmdb_localized_data(meta: dict[str, Any], data_type: str, language
 
         # Fetch from API if not in cache
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with metadata_client(timeout=10.0) as client:
                 response = await client.get(url, params=params)
                 if response.status_code == 200:
                     tmdb_data = response.json()
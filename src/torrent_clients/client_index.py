@@ -0,0 +1,289 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Persistent index of torrent client contents.
+
+Searching a client for an existing torrent used to pull the full torrent list
+on every run. The index keeps a copy of each client's torrents on disk under
+``data/client_index`` and only asks the client for what changed since the last
+look: qBittorrent through the rid based ``/sync/maindata`` API, rTorrent through
+a ``d.multicall2`` snapshot taken at most once per refresh interval.
+
+A qBittorrent rid only means something to the WebUI session that received
+it, so it is kept in memory with the client it came from and never saved:
+incremental sync applies within one process and one login, the first refresh
+of a process (or after a new login) is a full update.
+"""
+import asyncio
+import collections
+import json
+import os
+import ssl
+import time
+import urllib.parse
+import xmlrpc.client  # nosec B411 - Secured with defusedxml.xmlrpc.monkey_patch() in rtorrent.py
+from typing import Any, Optional, cast
+
+import qbittorrentapi
+
+from src.console import console
+
+INDEX_VERSION = 1
+DEFAULT_RTORRENT_REFRESH = 300
+
+# Torrent fields kept from qBittorrent's sync data, everything else is dropped to keep the index small
+QBIT_FIELDS = ("name", "save_path", "content_path", "size", "total_size", "category", "tracker", "comment", "num_complete")
+
+# ruTorrent stores the torrent comment url-encoded in custom2 behind this marker
+RUTORRENT_COMMENT_MARKER = "VRS24mrker"
+
+client_indexes: dict[str, "ClientTorrentIndex"] = {}
+client_index_locks: collections.defaultdict[str, asyncio.Lock] = collections.defaultdict(asyncio.Lock)
+
+
+def _path_key(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path)) if path else ""
+
+
+class ClientTorrentIndex:
+    """On-disk index of one client's torrents, keyed by infohash with name, content path and size lookups."""
+
+    def __init__(self, client_name: str, index_path: str) -> None:
+        self.client_name = client_name
+        self.index_path = index_path
+        self.rid = 0
+        # The logged in client the rid was received on
+        self.rid_client: Optional[qbittorrentapi.Client] = None
+        self.updated = 0.0
+        self.torrents: dict[str, dict[str, Any]] = {}
+        self.trackers: dict[str, list[str]] = {}
+        self._by_name: dict[str, set[str]] = {}
+        self._by_path: dict[str, set[str]] = {}
+        self._by_size: dict[int, set[str]] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, client_name: str, base_dir: str) -> "ClientTorrentIndex":
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in client_name)
+        index = cls(client_name, os.path.join(base_dir, "data", "client_index", f"{safe_name}.json"))
+        try:
+            with open(index.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+                data_dict = cast(dict[str, Any], data)
+                index.updated = float(data_dict.get("updated", 0.0))
+                index.torrents = cast(dict[str, dict[str, Any]], data_dict.get("torrents", {}))
+                index.trackers = cast(dict[str, list[str]], data_dict.get("trackers", {}))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            console.print(f"[yellow]Ignoring unreadable client index {index.index_path}: {e}")
+        index._rebuild_lookups()
+        return index
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "updated": self.updated, "torrents": self.torrents, "trackers": self.trackers}, f, separators=(",", ":"))
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    def _rebuild_lookups(self) -> None:
+        self._by_name.clear()
+        self._by_path.clear()
+        self._by_size.clear()
+        for infohash, entry in self.torrents.items():
+            self._add_lookups(infohash, entry)
+
+    def _add_lookups(self, infohash: str, entry: dict[str, Any]) -> None:
+        name = str(entry.get("name") or "").lower()
+        if name:
+            self._by_name.setdefault(name, set()).add(infohash)
+        content_path = _path_key(str(entry.get("content_path") or ""))
+        if content_path:
+            self._by_path.setdefault(content_path, set()).add(infohash)
+        size = entry.get("total_size") or entry.get("size")
+        if isinstance(size, int) and size > 0:
+            self._by_size.setdefault(size, set()).add(infohash)
+
+    def _remove_lookups(self, infohash: str, entry: dict[str, Any]) -> None:
+        keyed: list[tuple[dict[Any, set[str]], Any]] = [
+            (cast(dict[Any, set[str]], self._by_name), str(entry.get("name") or "").lower()),
+            (cast(dict[Any, set[str]], self._by_path), _path_key(str(entry.get("content_path") or ""))),
+            (cast(dict[Any, set[str]], self._by_size), entry.get("total_size") or entry.get("size")),
+        ]
+        for lookup, key in keyed:
+            hashes = lookup.get(key)
+            if hashes is not None:
+                hashes.discard(infohash)
+                if not hashes:
+                    del lookup[key]
+
+    def _put(self, infohash: str, fields: dict[str, Any], replace: bool = False) -> None:
+        old = self.torrents.get(infohash)
+        if old is not None:
+            self._remove_lookups(infohash, old)
+        entry = {} if replace or old is None else dict(old)
+        entry.update(fields)
+        entry["hash"] = infohash
+        if not entry.get("content_path") and entry.get("save_path") and entry.get("name"):
+            entry["content_path"] = os.path.join(str(entry["save_path"]), str(entry["name"]))
+        self.torrents[infohash] = entry
+        self._add_lookups(infohash, entry)
+        self._dirty = True
+
+    def _drop(self, infohash: str) -> None:
+        old = self.torrents.pop(infohash, None)
+        if old is not None:
+            self._remove_lookups(infohash, old)
+            self._dirty = True
+
+    def _with_trackers(self, entry: dict[str, Any]) -> dict[str, Any]:
+        infohash = entry["hash"]
+        return {**entry, "trackers": [url for url, url_hashes in self.trackers.items() if infohash in url_hashes]}
+
+    def get(self, infohash: str) -> Optional[dict[str, Any]]:
+        entry = self.torrents.get(infohash.lower()) or self.torrents.get(infohash.upper())
+        return self._with_trackers(entry) if entry is not None else None
+
+    def find(self, names: Optional[list[str]] = None, content_path: Optional[str] = None, size: Optional[int] = None) -> list[dict[str, Any]]:
+        """Return the entries matching any of the given names or the content path, optionally narrowed down by total size."""
+        hashes: set[str] = set()
+        for name in names or []:
+            hashes.update(self._by_name.get(name.lower(), ()))
+        if content_path:
+            hashes.update(self._by_path.get(_path_key(content_path), ()))
+        if size:
+            hashes &= self._by_size.get(size, set())
+        return [self._with_trackers(self.torrents[infohash]) for infohash in sorted(hashes)]
+
+    def apply_qbit_maindata(self, maindata: dict[str, Any]) -> None:
+        if maindata.get("full_update"):
+            self.torrents = {}
+            self.trackers = {}
+            self._rebuild_lookups()
+            self._dirty = True
+
+        torrents = cast(dict[str, dict[str, Any]], maindata.get("torrents") or {})
+        for infohash, data in torrents.items():
+            fields = {key: data[key] for key in QBIT_FIELDS if key in data}
+            if fields or infohash not in self.torrents:
+                self._put(infohash, fields)
+
+        for infohash in cast(list[str], maindata.get("torrents_removed") or []):
+            self._drop(infohash)
+
+        # Only the announce urls that changed are sent, each with the full list of torrents using it
+        trackers = cast(dict[str, list[str]], maindata.get("trackers") or {})
+        if trackers:
+            self.trackers.update(trackers)
+            self._dirty = True
+        for url in cast(list[str], maindata.get("trackers_removed") or []):
+            if self.trackers.pop(url, None) is not None:
+                self._dirty = True
+
+        self.rid = int(maindata.get("rid", self.rid))
+        self.updated = time.time()
+
+    def apply_rtorrent_snapshot(self, rows: list[list[Any]]) -> None:
+        seen: set[str] = set()
+        for row in rows:
+            infohash, name, directory, size, is_multi_file, label, custom2, complete = row
+            comment = ""
+            if isinstance(custom2, str) and custom2.startswith(RUTORRENT_COMMENT_MARKER):
+                comment = urllib.parse.unquote(custom2[len(RUTORRENT_COMMENT_MARKER):])
+            content_path = str(directory) if is_multi_file else os.path.join(str(directory), str(name))
+            fields = {
+                "name": str(name),
+                "save_path": os.path.dirname(content_path),
+                "content_path": content_path,
+                "size": int(size),
+                "total_size": int(size),
+                "category": urllib.parse.unquote(str(label or "")),
+                "comment": comment,
+                "complete": bool(complete),
+            }
+            old = self.torrents.get(infohash)
+            if old is None or any(old.get(key) != value for key, value in fields.items()):
+                self._put(infohash, fields, replace=True)
+            seen.add(infohash)
+
+        for infohash in set(self.torrents) - seen:
+            self._drop(infohash)
+        self.updated = time.time()
+
+    async def refresh_qbit(self, qbt_client: qbittorrentapi.Client, debug: bool = False) -> bool:
+        started = time.perf_counter()
+        try:
+            if qbt_client is not self.rid_client:
+                self.rid = 0
+            maindata = await asyncio.wait_for(asyncio.to_thread(qbt_client.sync_maindata, rid=self.rid), timeout=30.0)
+            self.apply_qbit_maindata(cast(dict[str, Any], maindata))
+            self.rid_client = qbt_client
+            await asyncio.to_thread(self.save)
+        except Exception as e:
+            console.print(f"[yellow]Could not refresh torrent index for client '{self.client_name}': {e}")
+            return False
+        if debug:
+            console.print(f"[cyan]Client index '{self.client_name}': {len(self.torrents)} torrents, rid {self.rid}, refreshed in {time.perf_counter() - started:.2f}s")
+        return True
+
+    async def refresh_rtorrent(self, client: dict[str, Any], debug: bool = False) -> bool:
+        refresh_interval = int(client.get('client_index_refresh', DEFAULT_RTORRENT_REFRESH) or 0)
+        if self.torrents and time.time() - self.updated < refresh_interval:
+            return True
+
+        def _snapshot() -> list[list[Any]]:
+            server = xmlrpc.client.Server(client['rtorrent_url'], context=ssl.create_default_context())
+            return cast(list[list[Any]], server.d.multicall2(
+                "", "main",
+                "d.hash=", "d.name=", "d.directory=", "d.size_bytes=", "d.is_multi_file=",
+                "d.custom1=", "d.custom2=", "d.complete=",
+            ))
+
+        started = time.perf_counter()
+        try:
+            rows = await asyncio.wait_for(asyncio.to_thread(_snapshot), timeout=60.0)
+            self.apply_rtorrent_snapshot(rows)
+            await asyncio.to_thread(self.save)
+        except Exception as e:
+            console.print(f"[yellow]Could not refresh torrent index for client '{self.client_name}': {e}")
+            return False
+        if debug:
+            console.print(f"[cyan]Client index '{self.client_name}': {len(self.torrents)} torrents, snapshot taken in {time.perf_counter() - started:.2f}s")
+        return True
+
+
+def client_index_enabled(client: dict[str, Any]) -> bool:
+    # The qui proxy has its own server side search, so it never goes through the index
+    return bool(client.get('client_index', True)) and not client.get('qui_proxy_url')
+
+
+async def get_client_index(
+    client_name: str,
+    client: dict[str, Any],
+    base_dir: str,
+    qbt_client: Optional[qbittorrentapi.Client] = None,
+    debug: bool = False,
+) -> Optional[ClientTorrentIndex]:
+    """Load (once per process) and refresh the index for a client. Returns None if it cannot be brought up to date."""
+    if not client_index_enabled(client):
+        return None
+
+    async with client_index_locks[client_name]:
+        index = client_indexes.get(client_name)
+        if index is None:
+            index = await asyncio.to_thread(ClientTorrentIndex.load, client_name, base_dir)
+            client_indexes[client_name] = index
+
+        torrent_client = client.get('torrent_client')
+        if torrent_client == 'qbit' and qbt_client is not None:
+            refreshed = await index.refresh_qbit(qbt_client, debug)
+        elif torrent_client == 'rtorrent' and client.get('rtorrent_url'):
+            refreshed = await index.refresh_rtorrent(client, debug)
+        else:
+            return None
+
+    return index if refreshed else None
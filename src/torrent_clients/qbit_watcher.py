@@ -0,0 +1,201 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Event driven torrent state watcher for qBittorrent.
+
+Waiting for a recheck or a download used to poll ``torrents/info`` for one
+hash every few seconds, with the synchronous API client called straight on
+the event loop. A watcher follows the whole client through the rid based
+``/sync/maindata`` API instead: one incremental request per interval, made in
+a worker thread (direct API) or on aiohttp (qui proxy), no matter how many
+torrents are being waited on. Every wait gets a future that is resolved as
+soon as an update shows its torrent in the wanted state, or with None when
+the torrent is not (or no longer) in the client. The poll task only runs
+while someone is waiting.
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, cast
+
+import aiohttp
+import qbittorrentapi
+
+from src.console import console
+
+DEFAULT_INTERVAL = 2.0
+REQUEST_TIMEOUT = 30.0
+# Consecutive failed updates after which every pending wait fails
+MAX_FAILURES = 3
+
+COMPLETED_STATES = frozenset({'pausedUP', 'stoppedUP', 'seeding', 'completed', 'stalledUP', 'uploading', 'queuedUP', 'forcedUP'})
+CHECKING_STATES = frozenset({'checkingUP', 'checkingDL', 'checkingResumeData'})
+
+TorrentPredicate = Callable[[dict[str, Any]], bool]
+TorrentCallback = Callable[[dict[str, Any]], None]
+
+qbit_watchers: dict[str, "QbitWatcher"] = {}
+
+
+@dataclass
+class _Waiter:
+    future: "asyncio.Future[Optional[dict[str, Any]]]"
+    done: TorrentPredicate
+    on_update: Optional[TorrentCallback] = None
+    # Waits are first checked against an update fetched after they were registered, never against older state
+    seen: bool = False
+
+
+class QbitWatcher:
+    """Shared ``/sync/maindata`` follower of one qBittorrent client, resolving per-hash waits."""
+
+    def __init__(
+        self,
+        name: str,
+        qbt_client: Optional[qbittorrentapi.Client] = None,
+        proxy_url: Optional[str] = None,
+        interval: float = DEFAULT_INTERVAL,
+    ) -> None:
+        if qbt_client is None and not proxy_url:
+            raise ValueError("A qBittorrent client or a qui proxy url is required")
+        self.name = name
+        self.qbt_client = qbt_client
+        self.proxy_url = proxy_url.rstrip('/') if proxy_url else None
+        self.interval = interval
+        self.rid = 0
+        self.torrents: dict[str, dict[str, Any]] = {}
+        self.requests = 0
+        self._waiters: dict[str, list[_Waiter]] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def watch(
+        self,
+        infohash: str,
+        done: TorrentPredicate,
+        on_update: Optional[TorrentCallback] = None,
+    ) -> "asyncio.Future[Optional[dict[str, Any]]]":
+        """
+        Future resolved with the torrent's fields once ``done`` accepts them, or with
+        None when the torrent is not in the client. ``on_update`` is called with the
+        fields of every update of the torrent. Cancel the future to stop waiting.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(loop.create_future(), done, on_update)
+        self._waiters.setdefault(infohash.lower(), []).append(waiter)
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run(), name=f"qbit-watcher-{self.name}")
+        return waiter.future
+
+    async def wait(
+        self,
+        infohash: str,
+        done: TorrentPredicate,
+        on_update: Optional[TorrentCallback] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[dict[str, Any]]:
+        return await asyncio.wait_for(self.watch(infohash, done, on_update), timeout=timeout)
+
+    def apply(self, maindata: dict[str, Any]) -> set[str]:
+        """Merge an update into the torrent table and return the hashes whose fields changed."""
+        full_update = bool(maindata.get("full_update"))
+        if full_update:
+            self.torrents = {}
+
+        changed: set[str] = set()
+        torrents = cast(dict[str, dict[str, Any]], maindata.get("torrents") or {})
+        for infohash, fields in torrents.items():
+            self.torrents.setdefault(infohash, {}).update(fields)
+            changed.add(infohash)
+
+        for infohash in cast(list[str], maindata.get("torrents_removed") or []):
+            self.torrents.pop(infohash, None)
+            changed.add(infohash)
+
+        self.rid = int(maindata.get("rid", self.rid))
+        return changed
+
+    def _resolve(self, changed: set[str]) -> None:
+        for infohash, waiters in list(self._waiters.items()):
+            torrent = self.torrents.get(infohash)
+            for waiter in list(waiters):
+                if waiter.future.done():
+                    waiters.remove(waiter)
+                    continue
+                if torrent is None:
+                    waiter.future.set_result(None)
+                    waiters.remove(waiter)
+                    continue
+                if waiter.seen and infohash not in changed:
+                    continue
+                waiter.seen = True
+                if waiter.on_update is not None:
+                    waiter.on_update(torrent)
+                if waiter.done(torrent):
+                    waiter.future.set_result(dict(torrent))
+                    waiters.remove(waiter)
+            if not waiters:
+                del self._waiters[infohash]
+
+    def _fail(self, error: Exception) -> None:
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                if not waiter.future.done():
+                    waiter.future.set_exception(error)
+        self._waiters.clear()
+
+    def _pending(self) -> bool:
+        for infohash, waiters in list(self._waiters.items()):
+            waiters[:] = [waiter for waiter in waiters if not waiter.future.done()]
+            if not waiters:
+                del self._waiters[infohash]
+        return bool(self._waiters)
+
+    async def _fetch(self, session: Optional[aiohttp.ClientSession]) -> dict[str, Any]:
+        self.requests += 1
+        if session is not None:
+            async with session.get(f"{self.proxy_url}/api/v2/sync/maindata", params={'rid': str(self.rid)}) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"sync/maindata via proxy returned {response.status}")
+                return cast(dict[str, Any], await response.json())
+        if self.qbt_client is None:
+            raise RuntimeError("qbt_client is not initialized")
+        maindata = await asyncio.wait_for(asyncio.to_thread(self.qbt_client.sync_maindata, rid=self.rid), timeout=REQUEST_TIMEOUT)
+        return cast(dict[str, Any], maindata)
+
+    async def _run(self) -> None:
+        session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) if self.proxy_url else None
+        failures = 0
+        try:
+            while self._pending():
+                try:
+                    maindata = await self._fetch(session)
+                except (asyncio.TimeoutError, aiohttp.ClientError, qbittorrentapi.APIError, RuntimeError, ValueError) as e:
+                    failures += 1
+                    console.print(f"[yellow]Could not update torrent states of client '{self.name}' ({failures}/{MAX_FAILURES}): {e}")
+                    if failures >= MAX_FAILURES:
+                        self._fail(RuntimeError(f"Could not follow torrent states of client '{self.name}': {e}"))
+                        break
+                else:
+                    failures = 0
+                    self._resolve(self.apply(maindata))
+                    if not self._pending():
+                        break
+                await asyncio.sleep(self.interval)
+        finally:
+            # A wait registered from here on starts a new task
+            if self._task is asyncio.current_task():
+                self._task = None
+            if session is not None:
+                await session.close()
+
+
+def get_qbit_watcher(
+    name: str,
+    qbt_client: Optional[qbittorrentapi.Client] = None,
+    proxy_url: Optional[str] = None,
+    interval: float = DEFAULT_INTERVAL,
+) -> QbitWatcher:
+    """The watcher of a client (once per process), so every wait on it shares one stream of updates."""
+    watcher = qbit_watchers.get(name)
+    if watcher is None:
+        watcher = QbitWatcher(name, qbt_client=qbt_client, proxy_url=proxy_url, interval=interval)
+        qbit_watchers[name] = watcher
+    return watcher
@@ -18,6 +18,7 @@ from torf import Torrent
 
 from cogs.redaction import Redaction
 from src.console import console
+from src.torrent_clients.client_index import get_client_index
 from src.torrentcreate import TorrentCreator
 
 # These have to be global variables to be shared across all instances since a new instance is made every time
@@ -293,7 +294,21 @@ class QbittorrentClientMixin:
                 qbittorrent_cached_clients[client_key] = qbt_client
                 return qbt_client
 
-    async def search_qbit_for_torrent(self, meta: dict[str, Any], client: dict[str, Any], qbt_client: Optional[qbittorrentapi.Client] = None, qbt_session: Optional[aiohttp.ClientSession] = None, proxy_url: Optional[str] = None) -> Optional[str]:
+    async def _indexed_qbit_torrents(self, meta: dict[str, Any], client_name: Optional[str], client: dict[str, Any], qbt_client: qbittorrentapi.Client) -> Optional[list[Any]]:
+        """Name candidates from the persistent client index, or None when the full torrent list has to be fetched instead."""
+        if not client_name:
+            return None
+        index = await get_client_index(client_name, client, str(meta.get('base_dir', '')), qbt_client=qbt_client, debug=bool(meta.get('debug')))
+        if index is None:
+            return None
+
+        names = [str(meta.get('uuid', ''))]
+        filelist = self._coerce_str_list(meta.get('filelist', []))
+        if meta.get('is_disc') in ("", None) and len(filelist) == 1:
+            names.append(os.path.basename(filelist[0]))
+        return self._build_mock_torrents(index.find(names=names))
+
+    async def search_qbit_for_torrent(self, meta: dict[str, Any], client: dict[str, Any], qbt_client: Optional[qbittorrentapi.Client] = None, qbt_session: Optional[aiohttp.ClientSession] = None, proxy_url: Optional[str] = None, client_name: Optional[str] = None) -> Optional[str]:
         trackers_config = cast(dict[str, Any], self.config.get('TRACKERS', {}))
         mtv_config_value = trackers_config.get('MTV', {})
         mtv_config = cast(dict[str, Any], mtv_config_value) if isinstance(mtv_config_value, dict) else {}
@@ -400,11 +415,15 @@ class QbittorrentClientMixin:
                     if qbt_client is None:
                         console.print("[bold red]qBittorrent client not initialized")
                         return None
-                    torrents = await self.retry_qbt_operation(
-                        lambda: asyncio.to_thread(qbt_client.torrents_info),
-                        "Get torrents list",
-                        initial_timeout=14.0
-                    )
+                    indexed_torrents = await self._indexed_qbit_torrents(meta, client_name, client, qbt_client)
+                    if indexed_torrents is not None:
+                        torrents = indexed_torrents
+                    else:
+                        torrents = await self.retry_qbt_operation(
+                            lambda: asyncio.to_thread(qbt_client.torrents_info),
+                            "Get torrents list",
+                            initial_timeout=14.0
+                        )
             except asyncio.TimeoutError:
                 console.print("[bold red]Getting torrents list timed out after retries")
                 return None
@@ -1336,11 +1355,15 @@ class QbittorrentClientMixin:
                 else:
                     if qbt_client is None:
                         return []
-                    torrents = await self.retry_qbt_operation(
-                        lambda: asyncio.to_thread(qbt_client.torrents_info),
-                        "Get torrents list",
-                        initial_timeout=14.0
-                    )
+                    indexed_torrents = await self._indexed_qbit_torrents(meta, client_name, client_config, qbt_client)
+                    if indexed_torrents is not None:
+                        torrents = indexed_torrents
+                    else:
+                        torrents = await self.retry_qbt_operation(
+                            lambda: asyncio.to_thread(qbt_client.torrents_info),
+                            "Get torrents list",
+                            initial_timeout=14.0
+                        )
             except asyncio.TimeoutError:
                 console.print("[bold red]Getting torrents list timed out after retries")
                 if qbt_session:
@@ -22,6 +22,8 @@ from torf import Torrent
 from typing_extensions import TypeAlias
 
 from src.console import console
+from src.piececache import PieceHashCache
+from src.piecehasher import PieceHasher
 
 PIECE_SIZE_MIN = 32 * 1024  # 32 KiB
 PIECE_SIZE_MAX = 134_217_728  # 128 MiB
@@ -244,7 +246,6 @@ class TorrentCreator:
                         exclude = []
                     elif not meta.get('tv_pack', False):
                         path_dir = os.fspath(path)
-                        os.chdir(path_dir)
                         globs = [os.path.basename(f) for f in glob.glob(os.path.join(path_dir, "*.mkv"))] + [
                             os.path.basename(f) for f in glob.glob(os.path.join(path_dir, "*.mp4"))
                         ] + [os.path.basename(f) for f in glob.glob(os.path.join(path_dir, "*.ts"))]
@@ -267,8 +268,44 @@ class TorrentCreator:
                     exclude = ["*.*", "*sample.mkv", "!sample*.*"] if not meta['is_disc'] else []
                     include = ["*.mkv", "*.mp4", "*.ts"] if not meta['is_disc'] else []
 
+                piece_cache = PieceHashCache.from_meta(meta)
+
                 # If using mkbrr, run the external application
                 if meta.get('mkbrr'):
+                    # mkbrr's tracker presets (-t) and entropy (-e, the randomized torrents) can not be rebuilt from cached
+                    # pieces, so those torrents always go through mkbrr
+                    if piece_cache is not None and not tracker_url and int(meta.get('randomized', 0)) < 1:
+                        # Same files hashed before: write the torrent from cached pieces instead of running mkbrr
+                        if piece_size:
+                            cache_piece_limit = 2 ** min(27, max(16, math.floor(math.log2(int(piece_size) * 1024 * 1024))))
+                        elif not any(tracker in meta.get('trackers', []) for tracker in ['HDB', 'PTP', 'MTV']):
+                            cache_piece_limit = 2 ** 27
+                        else:
+                            cache_piece_limit = 2 ** 24
+
+                        def build_from_cache() -> Optional[Torrent]:
+                            try:
+                                # mkbrr picks its own piece size, so accept whichever cached size is within its limit
+                                probe = cls.new_custom_torrent(meta, path, include, exclude, PIECE_SIZE_MIN)
+                                identities = piece_cache.identities(cls.torrent_files(probe))
+                                cached = piece_cache.get_content(identities, None, cache_piece_limit) if identities else None
+                                if cached is None:
+                                    return None
+                                cached_torrent = cls.new_custom_torrent(meta, path, include, exclude, cached[0])
+                                if not cls.apply_cached_pieces(cached_torrent, piece_cache):
+                                    return None
+                                cached_torrent.write(f"{meta['base_dir']}/tmp/{meta['uuid']}/{output_filename}.torrent", overwrite=True)
+                                return cached_torrent
+                            except Exception as e:
+                                if meta['debug']:
+                                    console.print(f"[yellow]Could not build torrent from piece hash cache: {e}")
+                                return None
+
+                        cached_torrent = await asyncio.to_thread(build_from_cache)
+                        if cached_torrent is not None:
+                            console.print("[green]Reusing cached piece hashes, skipping mkbrr")
+                            return cached_torrent
+
                     try:
                         # Validate input path to prevent potential command injection
                         if not os.path.exists(path):
@@ -374,6 +411,14 @@ class TorrentCreator:
                             console.print("[bold red]mkbrr did not create a torrent file!")
                             raise FileNotFoundError(f"Expected torrent file {output_path} was not created")
                         else:
+                            if piece_cache is not None:
+                                try:
+                                    await asyncio.to_thread(
+                                        cls.store_cached_pieces, Torrent.read(output_path), piece_cache, os.path.dirname(os.fspath(path))
+                                    )
+                                except Exception as e:
+                                    if meta['debug']:
+                                        console.print(f"[yellow]Could not cache mkbrr piece hashes: {e}")
                             return output_path
 
                     except subprocess.CalledProcessError as e:
@@ -401,23 +446,17 @@ class TorrentCreator:
                 piece_size = cls.calculate_piece_size(initial_size, 32768, 134217728, meta, piece_size=piece_size)
 
                 # Fallback to CustomTorrent if mkbrr is not used
-                torrent = CustomTorrent(
-                    meta=meta,
-                    path=path,
-                    trackers=["https://fake.tracker"],
-                    source="UA",
-                    private=True,
-                    exclude_globs=exclude or [],
-                    include_globs=include or [],
-                    creation_date=datetime.now(timezone.utc),
-                    comment="Created by Upload Assistant",
-                    created_by="Upload Assistant",
-                    piece_size=piece_size
-                )
+                torrent = cls.new_custom_torrent(meta, path, include, exclude, piece_size)
 
                 # Run torrent generation in thread to avoid blocking the event loop
                 def generate_torrent() -> None:
-                    torrent.generate(callback=cls.torf_cb, interval=5)
+                    if meta.get('threaded_hashing', True):
+                        cls.generate_threaded(torrent, int(meta.get('hash_threads') or 0), piece_cache)
+                    elif cls.apply_cached_pieces(torrent, piece_cache):
+                        console.print("[green]Reusing cached piece hashes")
+                    else:
+                        torrent.generate(callback=cls.torf_cb, interval=5)
+                        cls.store_cached_pieces(torrent, piece_cache)
                     torrent.write(f"{meta['base_dir']}/tmp/{meta['uuid']}/{output_filename}.torrent", overwrite=True)
                     torrent.verify_filesize(path)
 
@@ -438,6 +477,73 @@ class TorrentCreator:
                 if meta.get('debug', False):
                     console.print(f"[cyan]create_torrent end | in-flight={cls._create_torrent_inflight}[/cyan]")
 
+    @staticmethod
+    def new_custom_torrent(meta: Meta, path: Union[str, os.PathLike[str]], include: list[str], exclude: list[str], piece_size: Optional[int]) -> CustomTorrent:
+        return CustomTorrent(
+            meta=meta,
+            path=path,
+            trackers=["https://fake.tracker"],
+            source="UA",
+            private=True,
+            exclude_globs=exclude or [],
+            include_globs=include or [],
+            creation_date=datetime.now(timezone.utc),
+            comment="Created by Upload Assistant",
+            created_by="Upload Assistant",
+            piece_size=piece_size
+        )
+
+    @staticmethod
+    def torrent_files(torrent: Torrent, content_root: Optional[str] = None) -> list[tuple[str, int]]:
+        """(path on disk, size) of every file in the torrent, in piece order."""
+        if content_root is None:
+            if torrent.path is None:
+                raise RuntimeError('Torrent has no path to resolve files against')
+            content_root = os.path.dirname(os.fspath(torrent.path))
+        return [(os.path.join(content_root, os.fspath(file)), int(file.size)) for file in torrent.files]
+
+    @classmethod
+    def generate_threaded(cls, torrent: Torrent, threads: int = 0, piece_cache: Optional[PieceHashCache] = None) -> None:
+        """Hash the torrent payload with the threaded PieceHasher instead of torf's generate()."""
+        if torrent.path is None:
+            raise RuntimeError('generate_threaded() called with no path specified')
+        files = cls.torrent_files(torrent)
+        if sum(size for _, size in files) < 1:
+            raise torf.PathError(torrent.path, msg='Empty or all files excluded')
+
+        hasher = PieceHasher(torrent.piece_size, threads)
+        pieces = hasher.hash_files(
+            files,
+            callback=lambda filepath, pieces_done, pieces_total: cls.torf_cb(torrent, filepath, pieces_done, pieces_total),
+            interval=5,
+            cache=piece_cache,
+        )
+        if len(pieces) // 20 != torrent.pieces:
+            raise RuntimeError(f"Unexpected number of hashes generated: {len(pieces) // 20} instead of {torrent.pieces}")
+        torrent.metainfo['info']['pieces'] = pieces
+
+    @classmethod
+    def apply_cached_pieces(cls, torrent: Torrent, piece_cache: Optional[PieceHashCache]) -> bool:
+        """Fill in the piece hashes from the cache when these exact files were hashed before with the same piece size."""
+        if piece_cache is None:
+            return False
+        identities = piece_cache.identities(cls.torrent_files(torrent))
+        if identities is None:
+            return False
+        cached = piece_cache.get_content(identities, torrent.piece_size)
+        if cached is None or len(cached[1]) // 20 != torrent.pieces:
+            return False
+        torrent.metainfo['info']['pieces'] = cached[1]
+        return True
+
+    @classmethod
+    def store_cached_pieces(cls, torrent: Torrent, piece_cache: Optional[PieceHashCache], content_root: Optional[str] = None) -> None:
+        if piece_cache is None or not torrent.hashes:
+            return
+        identities = piece_cache.identities(cls.torrent_files(torrent, content_root))
+        if identities is not None:
+            piece_cache.store(identities, torrent.piece_size, bytes(torrent.metainfo['info']['pieces']))
+
     @staticmethod
     def torf_cb(torrent: Torrent, _filepath: str, pieces_done: int, pieces_total: int) -> None:
         if pieces_done == 0:
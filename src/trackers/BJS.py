@@ -12,7 +12,6 @@ from urllib.parse import urlparse
 
 import aiofiles
 import cli_ui
-import httpx
 import langcodes
 import pycountry
 from bs4 import BeautifulSoup, Tag
@@ -22,6 +21,7 @@ from src.bbcode import BBCODE
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.http_pool import pooled_client
 from src.languages import languages_manager
 from src.tmdb import TmdbManager
 from src.trackers.COMMON import COMMON
@@ -45,7 +45,7 @@ class BJS:
         self.torrent_url = 'https://bj-share.info/torrents.php?torrentid='
         self.requests_url = f'{self.base_url}/requests.php?'
         self.auth_token = None
-        self.session = httpx.AsyncClient(headers={
+        self.session = pooled_client(headers={
             'User-Agent': f'Upload Assistant ({platform.system()} {platform.release()})'
         }, timeout=60.0)
         self.main_tmdb_data: dict[str, Any] = {}
@@ -21,7 +21,9 @@ from torf import Torrent
 from src.bbcode import BBCODE
 from src.console import console
 from src.exportmi import exportInfo
+from src.http_pool import pooled_client
 from src.languages import languages_manager
+from src.mediainfo_cache import MediaInfoCache
 
 
 class COMMON:
@@ -189,7 +191,7 @@ class COMMON:
         path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}_cross].torrent" if cross else f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}].torrent"
         if downurl:
             try:
-                async with httpx.AsyncClient(headers=headers, params=params, timeout=30.0) as session, session.stream("GET", downurl) as r:
+                async with pooled_client(headers=headers, params=params, timeout=30.0) as session, session.stream("GET", downurl) as r:
                     r.raise_for_status()
                     async with aiofiles.open(path, "wb") as f:
                         async for chunk in r.aiter_bytes():
@@ -507,7 +509,7 @@ class COMMON:
         params: dict[str, str] = {'api_token': api_key}
         url = f"{torrent_url}{id}"
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.get(url=url, params=params)
                 json_response = response.json()
         except (httpx.RequestError, httpx.TimeoutException) as e:
@@ -621,7 +623,7 @@ class COMMON:
 
         # Make the GET request with proper encoding handled by 'params'
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.get(url=url, params=params)
                 json_response = response.json()
         except (httpx.RequestError, httpx.TimeoutException) as e:
@@ -775,7 +777,7 @@ class COMMON:
                 return None
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # get douban url
                 if int(meta.get('imdb_id', 0)) != 0:
                     data['search'] = f"tt{meta['imdb_id']}"
@@ -1100,11 +1102,11 @@ class COMMON:
                 path = meta['discs'][0]['playlists'][0]['path']
                 await exportInfo(
                     path,
-                    False,
                     meta['uuid'],
                     meta['base_dir'],
                     is_dvd=False,
-                    debug=meta.get('debug', False)
+                    debug=meta.get('debug', False),
+                    cache=MediaInfoCache.from_meta(meta),
                 )
 
             # Helper to read and filter lines from the export file
@@ -1142,11 +1144,11 @@ class COMMON:
 
                         await exportInfo(
                             largest_m2ts,
-                            False,
                             meta['uuid'],
                             meta['base_dir'],
                             is_dvd=False,
-                            debug=meta.get('debug', False)
+                            debug=meta.get('debug', False),
+                            cache=MediaInfoCache.from_meta(meta),
                         )
 
                         mediainfo = await read_and_clean()
@@ -17,6 +17,7 @@ from unidecode import unidecode
 
 from src.bbcode import BBCODE
 from src.console import console
+from src.http_pool import pooled_client
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -109,7 +110,7 @@ class THR:
                 if cookies:
                     console.print("[green]Using authenticated session for upload")
 
-                    async with httpx.AsyncClient(cookies=cookies, follow_redirects=True) as session:
+                    async with pooled_client(cookies=cookies, follow_redirects=True) as session:
                         response = await session.post(url=url, files=files, data=payload, headers=headers)
 
                         if meta.get('debug'):
@@ -296,7 +297,7 @@ class THR:
             response: Optional[httpx.Response] = None
             response_data: dict[str, Any] = {}
             try:
-                async with httpx.AsyncClient(timeout=30.0) as image_client:
+                async with pooled_client(timeout=30.0) as image_client:
                     response = await image_client.post(
                         url,
                         data=data,
@@ -340,7 +341,7 @@ class THR:
                     'theme': self.config['TRACKERS']['THR'].get('pronfo_theme', 'gray'),
                     'rapi': self.config['TRACKERS']['THR'].get('pronfo_rapi_id')
                 }
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.post(pronfo_url, data=data)
             try:
                 response_data = response.json()
@@ -391,7 +392,7 @@ class THR:
                 console.print("[red]Failed to log in to THR for search")
                 return dupes
 
-            async with httpx.AsyncClient(**client_args) as client:
+            async with pooled_client(**client_args) as client:
                 # Start with first page (page 0 in THR's system)
                 current_page = 0
                 more_pages = True
@@ -542,7 +543,7 @@ class THR:
             'Referer': 'https://www.torrenthr.org/login.php'
         }
 
-        async with httpx.AsyncClient(follow_redirects=True) as session:
+        async with pooled_client(follow_redirects=True) as session:
             try:
                 login_page = await session.get('https://www.torrenthr.org/login.php')
                 login_soup = BeautifulSoup(login_page.text, 'html.parser')
@@ -13,6 +13,7 @@ from typing_extensions import TypeAlias
 
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import open_for_upload, pooled_client
 from src.trackers.COMMON import COMMON
 
 QueryValue: TypeAlias = Union[str, int, float, bool, None]
@@ -108,7 +109,7 @@ class UNIT3D:
         request_params = params_list if params_list is not None else list(params_dict.items())
 
         try:
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
+            async with pooled_client(timeout=10.0, follow_redirects=True) as client:
                 response = await client.get(url=self.search_url, headers=headers, params=request_params)
                 response.raise_for_status()
                 if response.status_code == 200:
@@ -454,10 +455,7 @@ class UNIT3D:
     async def upload(self, meta: dict[str, Any], _: Any) -> bool:
         data = await self.get_data(meta)
         torrent_file_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent"
-        async with aiofiles.open(torrent_file_path, "rb") as f:
-            torrent_bytes = await f.read()
-        files = {"torrent": ("torrent.torrent", torrent_bytes, "application/x-bittorrent")}
-        files.update(await self.get_additional_files(meta))
+        additional_files = await self.get_additional_files(meta)
         headers = {
             "User-Agent": f'{meta["ua_name"]} {meta.get("current_version", "")} ({platform.system()} {platform.release()})',
             "authorization": f"Bearer {self.api_key}",
@@ -472,7 +470,9 @@ class UNIT3D:
 
             for attempt in range(max_retries):
                 try:  # noqa: PERF203
-                    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+                    # The torrent is streamed from disk on every attempt rather than kept in memory
+                    async with pooled_client(timeout=timeout, follow_redirects=True) as client, open_for_upload(torrent_file_path) as torrent_file:
+                        files: dict[str, Any] = {"torrent": ("torrent.torrent", torrent_file, "application/x-bittorrent"), **additional_files}
                         response = await client.post(
                             url=self.upload_url, files=files, data=data, headers=headers
                         )
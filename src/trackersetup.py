@@ -1,9 +1,11 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import importlib
 import json
 import os
 import re
 import sys
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional, Union, cast
@@ -14,75 +16,8 @@ import httpx
 
 from src.cleanup import cleanup_manager
 from src.console import console
-from src.trackers.A4K import A4K
-from src.trackers.ACM import ACM
-from src.trackers.AITHER import AITHER
-from src.trackers.ANT import ANT
-from src.trackers.AR import AR
-from src.trackers.ASC import ASC
-from src.trackers.AZ import AZ
-from src.trackers.BHD import BHD
-from src.trackers.BHDTV import BHDTV
-from src.trackers.BJS import BJS
-from src.trackers.BLU import BLU
-from src.trackers.BT import BT
-from src.trackers.CBR import CBR
+from src.http_pool import pooled_client
 from src.trackers.COMMON import COMMON
-from src.trackers.CZ import CZ
-from src.trackers.DC import DC
-from src.trackers.DP import DP
-from src.trackers.DT import DT
-from src.trackers.EMUW import EMUW
-from src.trackers.FF import FF
-from src.trackers.FL import FL
-from src.trackers.FNP import FNP
-from src.trackers.FRIKI import FRIKI
-from src.trackers.GPW import GPW
-from src.trackers.HDB import HDB
-from src.trackers.HDS import HDS
-from src.trackers.HDT import HDT
-from src.trackers.HHD import HHD
-from src.trackers.HUNO import HUNO
-from src.trackers.IHD import IHD
-from src.trackers.IS import IS
-from src.trackers.ITT import ITT
-from src.trackers.LCD import LCD
-from src.trackers.LDU import LDU
-from src.trackers.LST import LST
-from src.trackers.LT import LT
-from src.trackers.LUME import LUME
-from src.trackers.MTV import MTV
-from src.trackers.NBL import NBL
-from src.trackers.OE import OE
-from src.trackers.OTW import OTW
-from src.trackers.PHD import PHD
-from src.trackers.PT import PT
-from src.trackers.PTER import PTER
-from src.trackers.PTP import PTP
-from src.trackers.PTS import PTS
-from src.trackers.PTT import PTT
-from src.trackers.R4E import R4E
-from src.trackers.RAS import RAS
-from src.trackers.RF import RF
-from src.trackers.RTF import RTF
-from src.trackers.SAM import SAM
-from src.trackers.SHRI import SHRI
-from src.trackers.SN import SN
-from src.trackers.SP import SP
-from src.trackers.SPD import SPD
-from src.trackers.STC import STC
-from src.trackers.THR import THR
-from src.trackers.TIK import TIK
-from src.trackers.TL import TL
-from src.trackers.TLZ import TLZ
-from src.trackers.TOS import TOS
-from src.trackers.TTG import TTG
-from src.trackers.TTR import TTR
-from src.trackers.TVC import TVC
-from src.trackers.ULCX import ULCX
-from src.trackers.UTP import UTP
-from src.trackers.YOINK import YOINK
-from src.trackers.YUS import YUS
 
 JsonDict = dict[str, Any]
 Meta = dict[str, Any]
@@ -149,7 +84,7 @@ class TRACKER_SETUP:
         all_data: list[JsonDict] = []
         next_cursor: Optional[str] = None
 
-        async with httpx.AsyncClient() as client:
+        async with pooled_client() as client:
             while True:
                 try:
                     # Add query parameters for pagination
@@ -241,7 +176,7 @@ class TRACKER_SETUP:
             "https://raw.githubusercontent.com/TRaSH-Guides/Guides/refs/heads/master/docs/json/radarr/cf/lq.json"
         )
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 response = await client.get(url)
                 if response.status_code != 200:
                     console.print(f"[red]Failed to fetch TRaSH groups: HTTP {response.status_code}[/red]")
@@ -445,7 +380,7 @@ class TRACKER_SETUP:
         all_data: list[JsonDict] = []
         next_cursor: Optional[str] = None
 
-        async with httpx.AsyncClient() as client:
+        async with pooled_client() as client:
             while True:
                 try:
                     # Add query parameters for pagination
@@ -584,7 +519,7 @@ class TRACKER_SETUP:
             'tmdb': meta['tmdb'],
         }
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 response = await client.get(url=url, headers=headers, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -644,7 +579,7 @@ class TRACKER_SETUP:
             'tmdb_id': f"{meta['category'].lower()}/{meta['tmdb_id']}",
         }
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 response = await client.post(url=url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -1128,7 +1063,7 @@ class TRACKER_SETUP:
         next_cursor: Optional[str] = None
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 while True:
                     try:
                         # Add pagination cursor to params if we have one
@@ -1311,7 +1246,7 @@ class TRACKER_SETUP:
 
         if not meta.get('debug', False):
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
+                async with pooled_client(timeout=10.0) as client:
                     response = await client.post(url=create_url, headers=headers, json=payload)
                     if response.status_code in (200, 201):
                         console.print(f"[bold green]Successfully created trump report on {tracker}[/bold green]")
@@ -1336,13 +1271,44 @@ class TRACKER_SETUP:
             return True
 
 
-tracker_class_map: dict[str, type[Any]] = {
-    'A4K': A4K, 'ACM': ACM, 'AITHER': AITHER, 'ANT': ANT, 'AR': AR, 'ASC': ASC, 'AZ': AZ, 'BHD': BHD, 'BHDTV': BHDTV, 'BJS': BJS, 'BLU': BLU, 'BT': BT, 'CBR': CBR,
-    'CZ': CZ, 'DC': DC, 'DP': DP, 'DT': DT, 'EMUW': EMUW, 'FNP': FNP, 'FF': FF, 'FL': FL, 'FRIKI': FRIKI, 'GPW': GPW, 'HDB': HDB, 'HDS': HDS, 'HDT': HDT, 'HHD': HHD, 'HUNO': HUNO, 'ITT': ITT,
-    'IHD': IHD, 'IS': IS, 'LCD': LCD, 'LDU': LDU, 'LST': LST, 'LT': LT, 'LUME': LUME, 'MTV': MTV, 'NBL': NBL, 'OE': OE, 'OTW': OTW, 'PHD': PHD, 'PT': PT, 'PTP': PTP, 'PTER': PTER, 'PTS': PTS, 'PTT': PTT,
-    'R4E': R4E, 'RAS': RAS, 'RF': RF, 'RTF': RTF, 'SAM': SAM, 'SHRI': SHRI, 'SN': SN, 'SP': SP, 'SPD': SPD, 'STC': STC, 'THR': THR,
-    'TIK': TIK, 'TL': TL, 'TLZ': TLZ, 'TOS': TOS, 'TVC': TVC, 'TTG': TTG, 'TTR': TTR, 'ULCX': ULCX, 'UTP': UTP, 'YOINK': YOINK, 'YUS': YUS
-}
+class TrackerRegistry(Mapping[str, type[Any]]):
+    """
+    Tracker name -> tracker class, importing ``src.trackers.<NAME>`` the first time a class is looked up.
+    Membership tests and iteration only use the names, so a run only pays for the trackers it touches.
+    """
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self._names = tuple(names)
+        self._known = frozenset(self._names)
+        self._classes: dict[str, type[Any]] = {}
+
+    def __getitem__(self, name: str) -> type[Any]:
+        tracker_class = self._classes.get(name)
+        if tracker_class is None:
+            if name not in self._known:
+                raise KeyError(name)
+            module = importlib.import_module(f"src.trackers.{name}")
+            tracker_class = cast(type[Any], getattr(module, name))
+            self._classes[name] = tracker_class
+        return tracker_class
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._known
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+tracker_class_map = TrackerRegistry((
+    'A4K', 'ACM', 'AITHER', 'ANT', 'AR', 'ASC', 'AZ', 'BHD', 'BHDTV', 'BJS', 'BLU', 'BT', 'CBR',
+    'CZ', 'DC', 'DP', 'DT', 'EMUW', 'FNP', 'FF', 'FL', 'FRIKI', 'GPW', 'HDB', 'HDS', 'HDT', 'HHD', 'HUNO', 'ITT',
+    'IHD', 'IS', 'LCD', 'LDU', 'LST', 'LT', 'LUME', 'MTV', 'NBL', 'OE', 'OTW', 'PHD', 'PT', 'PTP', 'PTER', 'PTS', 'PTT',
+    'R4E', 'RAS', 'RF', 'RTF', 'SAM', 'SHRI', 'SN', 'SP', 'SPD', 'STC', 'THR',
+    'TIK', 'TL', 'TLZ', 'TOS', 'TVC', 'TTG', 'TTR', 'ULCX', 'UTP', 'YOINK', 'YUS'
+))
 
 api_trackers = {
     'A4K', 'ACM', 'AITHER', 'BHD', 'BLU', 'CBR', 'DP', 'DT', 'EMUW', 'FNP', 'FRIKI', 'HHD', 'HUNO', 'IHD', 'ITT', 'LCD', 'LDU', 'LST', 'LT', 'LUME',
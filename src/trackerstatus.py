@@ -1,6 +1,5 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
-import copy
 import os
 import sys
 from collections.abc import Mapping, MutableMapping
@@ -15,8 +14,8 @@ from src.clients import Clients
 from src.console import console
 from src.dupe_checking import DupeChecker
 from src.imdb import imdb_manager
+from src.metaview import MetaView
 from src.torrentcreate import TorrentCreator
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, tracker_class_map
 from src.uphelper import UploadHelper
 
@@ -44,7 +43,8 @@ class TrackerStatusManager:
 
         async def process_single_tracker(tracker_name: str, shared_meta: Meta) -> tuple[str, dict[str, bool]]:
             nonlocal successful_trackers
-            local_meta = copy.deepcopy(shared_meta)  # Ensure each task gets its own copy of meta
+            # Each task reads through a copy-on-write view, shared_meta itself is never modified
+            local_meta: Meta = MetaView(shared_meta)
             local_tracker_status = {'banned': False, 'skipped': False, 'dupe': False, 'upload': False, 'other': False}
             disctype = local_meta.get('disctype', None)
             we_already_asked = False
@@ -111,6 +111,7 @@ class TrackerStatusManager:
                         if local_meta['tracker_status'][tracker_name].get('other', False):
                             local_tracker_status['other'] = True
                     elif tracker_name == "PTP":
+                        from src.trackers.PTP import PTP
                         ptp: Any = PTP(config=self.config)
                         groupID = await ptp.get_group_by_imdb(local_meta['imdb'])
                         async with meta_lock:
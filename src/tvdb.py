@@ -3,6 +3,7 @@
 import asyncio
 import base64
 import contextlib
+import functools
 import json
 import os
 import re
@@ -14,6 +15,7 @@ from urllib.error import URLError
 from tvdb_v4_official import TVDB
 
 from src.console import console
+from src.metadata_cache import cached_call
 
 
 def _get_tvdb_k() -> str:
@@ -142,7 +144,10 @@ class tvdb_data:
         if client is None:
             return None, None
 
-        results = _as_dict_list(cast(Any, client).search({filename}, year=year, type="series", lang="eng"))
+        results = _as_dict_list(await cached_call(
+            "tvdb_search", ("series", filename, year),
+            functools.partial(asyncio.to_thread, cast(Any, client).search, {filename}, year=year, type="series", lang="eng"),
+        ))
         await asyncio.sleep(0.1)
         try:
             if results and len(results) > 0:
@@ -317,11 +322,16 @@ class tvdb_data:
                     console.print(f"[cyan]Fetching TVDB episodes page {page + 1}[/cyan]")
 
                 try:
-                    episodes_response = cast(Any, client).get_series_episodes(
-                        series_id_int,
-                        season_type="default",
-                        page=page,
-                        lang="eng"
+                    episodes_response = await cached_call(
+                        "tvdb_episodes", (series_id_int, page),
+                        functools.partial(
+                            asyncio.to_thread,
+                            cast(Any, client).get_series_episodes,
+                            series_id_int,
+                            season_type="default",
+                            page=page,
+                            lang="eng"
+                        ),
                     )
 
                     # Handle both dict response and direct episodes list
@@ -379,7 +389,10 @@ class tvdb_data:
             try:
                 if all_episodes:
                     # Get series details for aliases
-                    series_info = cast(dict[str, Any], cast(Any, client).get_series_extended(series_id_int))
+                    series_info = cast(dict[str, Any], await cached_call(
+                        "tvdb_series", (series_id_int,),
+                        functools.partial(asyncio.to_thread, cast(Any, client).get_series_extended, series_id_int),
+                    ))
                     if 'aliases' in series_info:
                         episodes_data['aliases'] = series_info['aliases']
             except Exception as alias_error:
@@ -453,7 +466,10 @@ class tvdb_data:
                 if debug:
                     console.print(f"[cyan]Trying TVDB lookup with IMDB ID: {imdb_formatted}[/cyan]")
 
-                results = _as_dict_list(cast(Any, client).search_by_remote_id(imdb_formatted))
+                results = _as_dict_list(await cached_call(
+                    "tvdb_search", ("remote", imdb_formatted),
+                    functools.partial(asyncio.to_thread, cast(Any, client).search_by_remote_id, imdb_formatted),
+                ))
                 await asyncio.sleep(0.1)
 
                 if results and len(results) > 0:
@@ -506,7 +522,10 @@ class tvdb_data:
                 if debug:
                     console.print(f"[cyan]Trying TVDB lookup with TMDB ID: {tmdb_str}[/cyan]")
 
-                results = _as_dict_list(cast(Any, client).search_by_remote_id(tmdb_str))
+                results = _as_dict_list(await cached_call(
+                    "tvdb_search", ("remote", tmdb_str),
+                    functools.partial(asyncio.to_thread, cast(Any, client).search_by_remote_id, tmdb_str),
+                ))
                 await asyncio.sleep(0.1)
 
                 if results and len(results) > 0:
@@ -572,7 +591,10 @@ class tvdb_data:
                     console.print(f"[yellow]Invalid TVDB episode ID: {episode_id}[/yellow]")
                 return None
 
-            episode_data = cast(dict[str, Any], cast(Any, client).get_episode_extended(episode_id_int))
+            episode_data = cast(dict[str, Any], await cached_call(
+                "tvdb_episode", (episode_id_int,),
+                functools.partial(asyncio.to_thread, cast(Any, client).get_episode_extended, episode_id_int),
+            ))
             if debug:
                 console.print(f"[yellow]Episode data retrieved for episode ID {episode_id}[/yellow]")
 
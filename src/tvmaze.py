@@ -6,6 +6,7 @@ import cli_ui
 import httpx
 
 from src.console import console
+from src.metadata_cache import metadata_client
 
 
 class TvmazeManager:
@@ -155,7 +156,7 @@ class TvmazeManager:
     ) -> Optional[Union[dict[str, Any], list[dict[str, Any]]]]:
         """Sync function to make the request inside ThreadPoolExecutor."""
         try:
-            async with httpx.AsyncClient(follow_redirects=True) as client:
+            async with metadata_client(follow_redirects=True) as client:
                 resp = await client.get(url, params=params, timeout=10)
                 if resp.status_code == 200:
                     data: Any = resp.json()
@@ -189,7 +190,7 @@ class TvmazeManager:
         }
 
         try:
-            async with httpx.AsyncClient(follow_redirects=True) as client:
+            async with metadata_client(follow_redirects=True) as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 response.raise_for_status()
                 data = response.json()
@@ -294,7 +295,7 @@ class TvmazeManager:
         params = {"date": airdate}
 
         try:
-            async with httpx.AsyncClient(follow_redirects=True) as client:
+            async with metadata_client(follow_redirects=True) as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 response.raise_for_status()
                 data = response.json()
@@ -8,19 +8,26 @@ import json
 import os
 import re
 import time
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, Optional, Union, cast
 
 import aiofiles
 import httpx
-import pyimgbox
 from typing_extensions import TypeAlias
 
 from src.console import console
+from src.host_limiter import THROTTLE_STATUS, host_limiters, parse_retry_after
+from src.http_pool import open_for_upload, pooled_client, track_responses, upload_slot
+from src.image_url_cache import ImageUrlCache, file_sha256
 
 Meta: TypeAlias = dict[str, Any]
 ImageDict: TypeAlias = dict[str, Any]
 
+# Hosts that take the image as a base64 encoded form field instead of a streamed multipart file
+BASE64_HOSTS = frozenset({"imgbb", "dalexni", "utppm", "onlyimage", "lensdump"})
+SEEDPOOL_CDN_UPLOAD_URL = "https://i.seedpool.org/upload"
+SHAREX_DEFAULT_URL = "https://img.digitalcore.club/api/upload"
+
 
 class UploadScreensManager:
     def __init__(self, config: dict[str, Any]) -> None:
@@ -54,7 +61,47 @@ class UploadScreensManager:
         )
 
 
+def image_cache_host(img_host: str, config: Mapping[str, Any]) -> str:
+    """Image URL cache key of a host. Self-hosted hosts are told apart by the server they upload to."""
+    default_config = config.get('DEFAULT', {})
+    if img_host == "zipline":
+        return f"{img_host}:{default_config.get('zipline_url')}"
+    if img_host == "sharex":
+        return f"{img_host}:{default_config.get('sharex_url', SHAREX_DEFAULT_URL)}"
+    if img_host == "seedpool_cdn":
+        return f"{img_host}:{SEEDPOOL_CDN_UPLOAD_URL}"
+    return img_host
+
+
 async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
+    image, img_host, config, meta = args
+    cache = ImageUrlCache.from_meta(meta)
+    content_hash: Optional[str] = None
+    if cache is not None:
+        try:
+            content_hash = await asyncio.to_thread(file_sha256, image)
+        except OSError:
+            content_hash = None
+        if content_hash is not None:
+            cached = await cache.lookup(content_hash, image_cache_host(img_host, config), debug=bool(meta.get('debug')))
+            if cached is not None:
+                if meta.get('debug'):
+                    console.print(f"[green]Reusing earlier {img_host} upload of {os.path.basename(image)}: {cached['raw_url']}[/green]")
+                return {'status': 'success', **cached, 'local_file_path': image}
+
+    try:
+        size = os.path.getsize(image)
+    except OSError:
+        size = 0
+    # Hosts taking a base64 form field need the file and its encoding in memory at once
+    async with upload_slot(size * 7 // 3 if img_host in BASE64_HOSTS else size):
+        result = await _upload_to_host(args)
+    if cache is not None and content_hash is not None and result.get('status') == 'success':
+        await cache.store(content_hash, image_cache_host(img_host, config), result['img_url'], result['raw_url'], result['web_url'])
+    return result
+
+
+async def _upload_to_host(args: Sequence[Any]) -> dict[str, Any]:
     image, img_host, config, meta = args
     try:
         timeout = 60  # Default timeout
@@ -62,7 +109,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
 
         if img_host == "imgbox":
             try:
-                image_list = await imgbox_upload(os.getcwd(), [image], return_dict={})
+                image_list = await imgbox_upload([image], return_dict={})
                 if image_list and all(
                     'img_url' in img and 'raw_url' in img and 'web_url' in img for img in image_list
                 ):
@@ -90,10 +137,9 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 return {'status': 'failed', 'reason': 'Missing ptpimg API key in config'}
 
             try:
-                async with httpx.AsyncClient() as client:
-                    async with aiofiles.open(image, 'rb') as file:
-                        files = {'file-upload[0]': (os.path.basename(image), await file.read())}
-                        headers = {'referer': 'https://ptpimg.me/index.php'}
+                async with pooled_client() as client, open_for_upload(image) as file:
+                    files = {'file-upload[0]': (os.path.basename(image), file)}
+                    headers = {'referer': 'https://ptpimg.me/index.php'}
 
                     try:
                         response = await client.post(
@@ -140,7 +186,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'image': encoded_image,
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with pooled_client() as client:
                     response = await client.post(url, data=data, timeout=timeout)
                     response_data = response.json()
                     if response.status_code != 200 or not response_data.get('success'):
@@ -178,7 +224,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'key': config['DEFAULT']['dalexni_api'],
                     'image': encoded_image,
                 }
-                async with httpx.AsyncClient() as client:
+                async with pooled_client() as client:
                     response = await client.post(url, data=data, timeout=timeout)
                     response_data = response.json()
                     if response.status_code != 200 or not response_data.get('success'):
@@ -213,9 +259,9 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': config['DEFAULT']['ptscreens_api']
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as file:
+                async with pooled_client() as client, open_for_upload(image) as file:
                     files = {
-                        'source': ('file-upload[0]', await file.read())
+                        'source': ('file-upload[0]', file)
                     }
 
                     response = await client.post(url, headers=headers, files=files, timeout=timeout)
@@ -255,7 +301,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': config['DEFAULT']['utppm_api'],
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with pooled_client() as client:
                     response = await client.post(url, data=data, headers=headers, timeout=timeout)
                     response_data = response.json()
 
@@ -293,7 +339,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': config['DEFAULT']['onlyimage_api'],
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with pooled_client() as client:
                     response = await client.post(url, data=data, headers=headers, timeout=timeout)
                     response_data = response.json()
 
@@ -326,9 +372,9 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'max_th_size': 350
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as file:
+                async with pooled_client() as client, open_for_upload(image) as file:
                     files = {
-                        'img': ('file-upload[0]', await file.read())
+                        'img': ('file-upload[0]', file)
                     }
 
                     response = await client.post(url, data=data, files=files, timeout=timeout)
@@ -372,7 +418,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 headers = {
                     'X-API-Key': config['DEFAULT']['lensdump_api']
                 }
-                async with httpx.AsyncClient() as client:
+                async with pooled_client() as client:
                     response = await client.post(url, data=data, headers=headers, timeout=timeout)
                     response_data = response.json()
                     if response_data.get('status_code') == 200:
@@ -398,15 +444,13 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 return {'status': 'failed', 'reason': 'Missing Zipline URL or API key'}
 
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    filename = os.path.basename(image)
-                    file_bytes = await img_file.read()
+                filename = os.path.basename(image)
                 headers = {
                     'Authorization': f'{api_key}',
                 }
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(url, files={'file': (filename, file_bytes)}, headers=headers, timeout=timeout)
+                async with pooled_client() as client, open_for_upload(image) as img_file:
+                    response = await client.post(url, files={'file': (filename, img_file)}, headers=headers, timeout=timeout)
                     if response.status_code == 200:
                         response_data = response.json()
                         if 'files' in response_data:
@@ -448,8 +492,8 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': pass_api_key
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
-                    files = {'source': (os.path.basename(image), await img_file.read())}
+                async with pooled_client() as client, open_for_upload(image) as img_file:
+                    files = {'source': (os.path.basename(image), img_file)}
                     response = await client.post(url, headers=headers, files=files, timeout=timeout)
 
                     if 'application/json' in response.headers.get('Content-Type', ''):
@@ -489,7 +533,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 return {'status': 'failed', 'reason': f'Unexpected error: {str(e)}'}
 
         elif img_host == "seedpool_cdn":
-            url = "https://i.seedpool.org/upload"
+            url = SEEDPOOL_CDN_UPLOAD_URL
             api_key = config['DEFAULT'].get('seedpool_cdn_api')
 
             if not api_key:
@@ -499,8 +543,8 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
             try:
                 headers = {'Authorization': f'Bearer {api_key}'}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
-                    files = {'files[]': (os.path.basename(image), await img_file.read())}
+                async with pooled_client() as client, open_for_upload(image) as img_file:
+                    files = {'files[]': (os.path.basename(image), img_file)}
 
                     response = await client.post(url, headers=headers, files=files, timeout=timeout)
 
@@ -548,7 +592,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
 
         elif img_host == "sharex":
             # Generic "ShareX-style" image host (IMageHosting and similar).
-            url = config['DEFAULT'].get('sharex_url', 'https://img.digitalcore.club/api/upload')
+            url = config['DEFAULT'].get('sharex_url', SHAREX_DEFAULT_URL)
             api_key = config['DEFAULT'].get('sharex_api_key')
 
             if not api_key:
@@ -559,8 +603,8 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 headers = {'Authorization': f'{api_key}'}
                 data = {'title': 'Upload-Assistant screenshot'}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
-                    files = {'file': (os.path.basename(image), await img_file.read())}
+                async with pooled_client() as client, open_for_upload(image) as img_file:
+                    files = {'file': (os.path.basename(image), img_file)}
                     response = await client.post(url, headers=headers, data=data, files=files, timeout=timeout)
 
                     content_type = response.headers.get('Content-Type', '')
@@ -643,7 +687,8 @@ async def _upload_screens(
     if meta.get('debug'):
         upload_start_time = time.time()
 
-    os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
+    # Queue items run side by side, so screenshots are found by absolute path rather than through the working directory
+    screens_dir = glob.escape(os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}"))
 
     initial_img_host = default_config[f'img_host_{img_host_num}']
     img_host = str(meta.get('imghost', ''))
@@ -693,17 +738,17 @@ async def _upload_screens(
         image_patterns = ["*.png", ".[!.]*.png"]
         image_glob: list[str] = []
         for pattern in image_patterns:
-            glob_results = await asyncio.to_thread(glob.glob, pattern)
+            glob_results = await asyncio.to_thread(glob.glob, os.path.join(screens_dir, pattern))
             image_glob.extend(glob_results)
 
         unwanted_patterns = ["FILE*", "PLAYLIST*", "POSTER*"]
         unwanted_files: set[str] = set()
         for pattern in unwanted_patterns:
-            glob_results = await asyncio.to_thread(glob.glob, pattern)
+            glob_results = await asyncio.to_thread(glob.glob, os.path.join(screens_dir, pattern))
             unwanted_files.update(glob_results)
             if pattern.startswith("FILE") or pattern.startswith("PLAYLIST") or pattern.startswith("POSTER"):
                 hidden_pattern = "." + pattern
-                hidden_glob_results = await asyncio.to_thread(glob.glob, hidden_pattern)
+                hidden_glob_results = await asyncio.to_thread(glob.glob, os.path.join(screens_dir, hidden_pattern))
                 unwanted_files.update(hidden_glob_results)
 
         image_glob = [file for file in image_glob if file not in unwanted_files]
@@ -736,12 +781,9 @@ async def _upload_screens(
         for index, image in enumerate(image_glob[:images_needed])
     ]
 
-    # Concurrency Control
-    default_pool_size = len(upload_tasks)
-    host_limits = {"onlyimage": 6, "ptscreens": 6, "lensdump": 1, "passtheimage": 6}
-    pool_size = host_limits.get(img_host, default_pool_size)
-    max_workers = min(len(upload_tasks), pool_size)
-    semaphore = asyncio.Semaphore(max_workers)
+    # Concurrency Control: the limiter adapts the number of parallel uploads to how the host responds
+    host_limiters.configure(config, str(meta['base_dir']))
+    limiter = host_limiters.get(img_host)
 
     # Track running tasks for cancellation
     running_tasks: set[asyncio.Task[dict[str, Any]]] = set()
@@ -754,66 +796,84 @@ async def _upload_screens(
         index, *task_args = task
         retry_count = 0
 
-        async with semaphore:
-            while retry_count <= max_retries:
-                future: Optional[asyncio.Task[dict[str, Any]]] = None
-                try:
-                    future = asyncio.create_task(upload_image_task(task_args))
+        while retry_count <= max_retries:
+            future: Optional[asyncio.Task[dict[str, Any]]] = None
+            try:
+                async with limiter.slot():
+                    started = time.monotonic()
+                    with track_responses() as responses:
+                        future = asyncio.create_task(upload_image_task(task_args))
                     running_tasks.add(future)
 
                     try:
                         result = await asyncio.wait_for(future, timeout=60.0)
                         running_tasks.discard(future)
-
-                        if result.get('status') == 'success':
-                            return (index, result)
-                        else:
-                            reason = result.get('reason', 'Unknown error')
-                            if "duplicate" in reason.lower():
-                                console.print(f"[yellow]Skipping host because duplicate image {index}: {reason}[/yellow]")
-                                return None
-                            elif "api key" in reason.lower():
-                                console.print(f"[red]API key error for {img_host}. Aborting further attempts.[/red]")
-                                return None
-                            if retry_count < max_retries:
-                                retry_count += 1
-                                console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {reason}[/yellow]")
-                                await asyncio.sleep(1.1 * retry_count)
-                                continue
-                            else:
-                                console.print(f"[red]Failed to upload image {index} after {max_retries} attempts: {reason}[/red]")
-                                return None
-
                     except asyncio.TimeoutError:
                         console.print(f"[red]Upload task {index} timed out after 60 seconds[/red]")
                         if future in running_tasks:
                             future.cancel()
                             running_tasks.discard(future)
+                        limiter.record_throttle()
+                        result = None
+
+                    if result is not None and result.get('status') == 'success':
+                        # Reused uploads from the image URL cache say nothing about the host
+                        if responses.statuses:
+                            try:
+                                nbytes = os.path.getsize(task[1])
+                            except OSError:
+                                nbytes = 0
+                            limiter.record_success(time.monotonic() - started, nbytes)
+                        return (index, result)
+                    if result is not None:
+                        reason = str(result.get('reason', 'Unknown error'))
+                        if any(status in THROTTLE_STATUS for status in responses.statuses) or "timed out" in reason.lower():
+                            limiter.record_throttle(parse_retry_after(responses.retry_after))
+                        else:
+                            limiter.record_failure()
 
-                        if retry_count < max_retries:
-                            retry_count += 1
-                            console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index} after timeout[/yellow]")
-                            await asyncio.sleep(1.1 * retry_count)
-                            continue
-                        return None
-
-                except asyncio.CancelledError:
-                    console.print(f"[red]Upload task {index} cancelled.[/red]")
-                    if future and future in running_tasks:
-                        future.cancel()
-                        running_tasks.discard(future)
-                    return None
-
-                except Exception as e:
-                    console.print(f"[red]Error during upload for image {index}: {str(e)}[/red]")
+                if result is None:
                     if retry_count < max_retries:
                         retry_count += 1
-                        console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {str(e)}[/yellow]")
-                        await asyncio.sleep(1.5 * retry_count)
+                        console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index} after timeout[/yellow]")
+                        await asyncio.sleep(limiter.retry_delay(retry_count))
                         continue
-                    else:
-                        console.print(f"[red]Error during upload for image {index} after {max_retries} attempts: {str(e)}[/red]")
-                        return None
+                    return None
+
+                reason = result.get('reason', 'Unknown error')
+                if "duplicate" in reason.lower():
+                    console.print(f"[yellow]Skipping host because duplicate image {index}: {reason}[/yellow]")
+                    return None
+                elif "api key" in reason.lower():
+                    console.print(f"[red]API key error for {img_host}. Aborting further attempts.[/red]")
+                    return None
+                if retry_count < max_retries:
+                    retry_count += 1
+                    console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {reason}[/yellow]")
+                    await asyncio.sleep(limiter.retry_delay(retry_count))
+                    continue
+                else:
+                    console.print(f"[red]Failed to upload image {index} after {max_retries} attempts: {reason}[/red]")
+                    return None
+
+            except asyncio.CancelledError:
+                console.print(f"[red]Upload task {index} cancelled.[/red]")
+                if future and future in running_tasks:
+                    future.cancel()
+                    running_tasks.discard(future)
+                return None
+
+            except Exception as e:
+                console.print(f"[red]Error during upload for image {index}: {str(e)}[/red]")
+                limiter.record_failure()
+                if retry_count < max_retries:
+                    retry_count += 1
+                    console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {str(e)}[/yellow]")
+                    await asyncio.sleep(limiter.retry_delay(retry_count))
+                    continue
+                else:
+                    console.print(f"[red]Error during upload for image {index} after {max_retries} attempts: {str(e)}[/red]")
+                    return None
 
         return None
 
@@ -826,6 +886,10 @@ async def _upload_screens(
             results.sort(key=lambda x: x[0])
         except Exception as e:
             console.print(f"[red]Error during uploads: {str(e)}[/red]")
+        host_limiters.save()
+        if meta['debug']:
+            for line in host_limiters.summary():
+                console.print(f"[blue]Image host {line}[/blue]")
 
         successfully_uploaded = [(index, result) for index, result in results if result['status'] == 'success']
         if meta['debug']:
@@ -896,14 +960,13 @@ async def _upload_screens(
 
 
 async def imgbox_upload(
-    chdir: str,
     image_glob: list[str],
     return_dict: dict[str, Any],
 ) -> list[dict[str, str]]:
     try:
-        os.chdir(chdir)
         image_list: list[dict[str, str]] = []
 
+        import pyimgbox
         async with pyimgbox.Gallery(thumb_width=350, square_thumbs=False) as gallery:
             async def process_image(image: str) -> None:
                 try:
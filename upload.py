@@ -2,6 +2,8 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
 import contextlib
+import copy
+import functools
 import gc
 import json
 import os
@@ -15,11 +17,10 @@ import time
 import traceback
 from collections.abc import Iterable, Mapping
 from pathlib import Path
-from typing import Any, Optional, cast
+from typing import Any, Callable, Optional, cast
 
 import aiofiles
 import cli_ui
-import discord
 import requests
 from packaging import version
 from torf import Torrent
@@ -27,7 +28,6 @@ from typing_extensions import TypeAlias
 
 from bin.get_mkbrr import MkbrrBinaryManager
 from cogs.redaction import Redaction
-from discordbot import DiscordNotifier
 from src.add_comparison import ComparisonManager
 from src.args import Args
 from src.cleanup import cleanup_manager
@@ -38,16 +38,17 @@ from src.dupe_checking import DupeChecker
 from src.get_desc import gen_desc
 from src.get_name import NameManager
 from src.get_tracker_data import TrackerDataManager
+from src.http_pool import configure_http_pool, http_pool_summary
 from src.languages import languages_manager
+from src.metadata_cache import configure_metadata_cache, metadata_cache_summary
 from src.nfo_link import NfoLinkManager
 from src.qbitwait import Wait
 from src.queuemanage import QueueManager
+from src.queuepipeline import ProcessedLog, QueuePipeline, pipeline_stage
 from src.takescreens import TakeScreensManager
 from src.torrentcreate import TorrentCreator
 from src.trackerhandle import process_trackers
-from src.trackers.AR import AR
 from src.trackers.COMMON import COMMON
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, api_trackers, http_trackers, other_api_trackers, tracker_class_map
 from src.trackerstatus import TrackerStatusManager
 from src.uphelper import UploadHelper
@@ -219,6 +220,8 @@ if os.path.exists(_config_path):
         nfo_link_manager = NfoLinkManager(config)
         takescreens_manager = TakeScreensManager(config)
         uploadscreens_manager = UploadScreensManager(config)
+        configure_http_pool(config)
+        configure_metadata_cache(config, base_dir)
         use_discord = False
         discord_cfg_obj = config.get('DISCORD')
         discord_config: Optional[dict[str, Any]] = cast(dict[str, Any], discord_cfg_obj) if isinstance(discord_cfg_obj, dict) else None
@@ -410,9 +413,14 @@ async def validate_tracker_logins(meta: Meta, trackers: Optional[list[str]] = No
         await asyncio.gather(*[validate_single_tracker(tracker) for tracker in valid_trackers])
 
 
-async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
-    """Process the metadata for each queued path."""
+async def process_meta(meta: Meta, base_dir: str, bot: Any = None, reserve_upload_slot: Optional[Callable[[Meta], bool]] = None) -> None:
+    """
+    Process the metadata for each queued path. ``reserve_upload_slot`` is asked
+    for a limit_queue slot once the item passed its dupe checks, before any
+    screenshots are taken; without a slot the item is not uploaded.
+    """
     if use_discord and bot:
+        from discordbot import DiscordNotifier
         await DiscordNotifier.send_discord_notification(
             config, bot, f"Starting upload process for: {meta['path']}", debug=meta.get('debug', False), meta=meta
         )
@@ -439,7 +447,8 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
             console.print("[yellow]Running in Auto Mode")
     prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
     try:
-        meta = await prep.gather_prep(meta=meta, mode='cli')
+        async with pipeline_stage('prep'):
+            meta = await prep.gather_prep(meta=meta, mode='cli')
     except Exception as e:
         console.print(f"Error in gather_prep: {e}")
         console.print(traceback.format_exc())
@@ -558,7 +567,8 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
         if meta['debug']:
             console.print(f"Trackers list during edit process: {meta['trackers']}")
         meta['edit'] = True
-        meta = await prep.gather_prep(meta=meta, mode='cli')
+        async with pipeline_stage('prep'):
+            meta = await prep.gather_prep(meta=meta, mode='cli')
         meta['name_notag'], meta['name'], meta['clean_name'], meta['potential_missing'] = await name_manager.get_name(meta)
         try:
             confirm = await helper.get_confirmation(meta)
@@ -695,6 +705,12 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
             meta['we_are_uploading'] = False
             return
 
+        if reserve_upload_slot is not None and not reserve_upload_slot(meta):
+            console.print(f"[yellow]limit_queue of {meta['limit_queue']} is taken by items already uploading, skipping {os.path.basename(meta['path'])}.[/yellow]")
+            meta['we_are_uploading'] = False
+            meta['limit_queue_full'] = True
+            return
+
         filename: str = meta.get('title', '')
         bdmv_filename = meta.get('filename', '')
         bdinfo = meta.get('bdinfo', '')
@@ -775,10 +791,11 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                     if meta['is_disc'] == "BDMV":
                         use_vs = meta.get('vapoursynth', False)
                         try:
-                            await takescreens_manager.disc_screenshots(
-                                meta, bdmv_filename, bdinfo, meta['uuid'], base_dir, use_vs,
-                                meta.get('image_list', []), meta.get('ffdebug', False), 0
-                            )
+                            async with pipeline_stage('screens'):
+                                await takescreens_manager.disc_screenshots(
+                                    meta, bdmv_filename, bdinfo, meta['uuid'], base_dir, use_vs,
+                                    meta.get('image_list', []), meta.get('ffdebug', False), 0
+                                )
                         except asyncio.CancelledError as e:
                             await cleanup_screenshot_temp_files(meta)
                             await asyncio.sleep(0.1)
@@ -796,12 +813,13 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
 
                     elif meta['is_disc'] == "DVD":
                         try:
-                            await takescreens_manager.dvd_screenshots(
-                                meta,
-                                disc_num=0,
-                                num_screens=0,
-                                retry_cap=False
-                            )
+                            async with pipeline_stage('screens'):
+                                await takescreens_manager.dvd_screenshots(
+                                    meta,
+                                    disc_num=0,
+                                    num_screens=0,
+                                    retry_cap=False
+                                )
                         except asyncio.CancelledError as e:
                             await cleanup_screenshot_temp_files(meta)
                             await asyncio.sleep(0.1)
@@ -822,10 +840,11 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                             if meta['debug']:
                                 console.print(f"videopath: {videopath}, filename: {filename}, meta: {meta['uuid']}, base_dir: {base_dir}, manual_frames: {manual_frames}")
 
-                            await takescreens_manager.screenshots(
-                                videopath, filename, meta['uuid'], base_dir, meta,
-                                manual_frames=manual_frames  # Pass additional kwargs directly
-                            )
+                            async with pipeline_stage('screens'):
+                                await takescreens_manager.screenshots(
+                                    videopath, filename, meta['uuid'], base_dir, meta,
+                                    manual_frames=manual_frames  # Pass additional kwargs directly
+                                )
                         except asyncio.CancelledError as e:
                             await cleanup_screenshot_temp_files(meta)
                             await asyncio.sleep(0.1)
@@ -1019,9 +1038,10 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
 
                         for idx in range(start_index, len(host_order)):
                             meta['imghost'] = host_order[idx]
-                            await uploadscreens_manager.upload_screens(
-                                meta, meta['screens'], 1, 0, meta['screens'], [], return_dict=return_dict, allowed_hosts=allowed_hosts
-                            )
+                            async with pipeline_stage('screens'):
+                                await uploadscreens_manager.upload_screens(
+                                    meta, meta['screens'], 1, 0, meta['screens'], [], return_dict=return_dict, allowed_hosts=allowed_hosts
+                                )
                             image_list_count = len(meta.get('image_list', []) or [])
                             if meta.get('debug'):
                                 console.print(
@@ -1099,20 +1119,21 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
         if meta.get('force_recheck', False):
             waiter = Wait(config)
             await waiter.select_and_recheck_best_torrent(meta, meta['path'], check_interval=5)
-        if not os.path.exists(torrent_path):
-            reuse_torrent = None
-            if meta.get('rehash', False) is False and not meta['base_torrent_created'] and not meta['we_checked_them_all']:
-                reuse_torrent = await client.find_existing_torrent(meta)
-                if reuse_torrent is not None:
-                    await TorrentCreator.create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
-
-            if meta['nohash'] is False and reuse_torrent is None:
+        async with pipeline_stage('torrent'):
+            if not os.path.exists(torrent_path):
+                reuse_torrent = None
+                if meta.get('rehash', False) is False and not meta['base_torrent_created'] and not meta['we_checked_them_all']:
+                    reuse_torrent = await client.find_existing_torrent(meta)
+                    if reuse_torrent is not None:
+                        await TorrentCreator.create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
+
+                if meta['nohash'] is False and reuse_torrent is None:
+                    await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
+                if meta['nohash']:
+                    meta['client'] = "none"
+
+            elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
                 await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
-            if meta['nohash']:
-                meta['client'] = "none"
-
-        elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
-            await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
 
         if os.path.exists(torrent_path):
             raw_trackers = meta.get('trackers')
@@ -1325,8 +1346,7 @@ async def do_the_thing(base_dir: str) -> None:
             if os.name != 'nt':
                 os.chmod(subdir_path, 0o700)
 
-    bot: Any = None
-    connect_task: Optional[asyncio.Task[None]] = None
+    discord_bots: list[tuple[Any, Optional[asyncio.Task[None]]]] = []
     meta: Meta = {}
     paths: list[str] = []
     for each in sys.argv[1:]:
@@ -1375,7 +1395,7 @@ async def do_the_thing(base_dir: str) -> None:
 
             from waitress import create_server  # type: ignore[attr-defined]
 
-            from web_ui.server import app, set_runtime_browse_roots
+            from web_ui.server import app, set_runtime_browse_roots, shutdown_job_runner, start_job_runner
 
             # Set browse roots for web UI
             browse_roots = os.environ.get('UA_BROWSE_ROOTS', '').strip()
@@ -1390,6 +1410,7 @@ async def do_the_thing(base_dir: str) -> None:
                 raise SystemExit("No browse roots specified. Please set UA_BROWSE_ROOTS environment variable or provide explicit paths.")
 
             set_runtime_browse_roots(browse_roots)
+            start_job_runner()
 
             try:
                 _webui_server = create_server(app, host=host, port=port)
@@ -1423,6 +1444,7 @@ async def do_the_thing(base_dir: str) -> None:
                     console.print(f"[red]Web UI server error: {e}[/red]")
                     sys.exit(1)
             finally:
+                shutdown_job_runner()
                 console.print("[yellow]Web UI server stopped[/yellow]")
 
             return  # Exit early when running web UI only
@@ -1501,14 +1523,66 @@ async def do_the_thing(base_dir: str) -> None:
         processed_files_count = 0
         skipped_files_count = 0
         base_meta = dict(meta.items())
+        total_files = len(queue_list)
+        pipeline = QueuePipeline.from_config(config, base_meta, total_files)
+        processed_log = ProcessedLog()
+
+        def log_processed(index: int, item_meta: Meta, current_item_path: str, item_path: str) -> None:
+            if log_file and (not item_meta['debug'] or "debug" in os.path.basename(log_file)):
+                if item_meta.get('site_upload_queue'):
+                    processed_log.record(index, functools.partial(QueueManager.save_processed_path, log_file, current_item_path))
+                else:
+                    processed_log.record(index, functools.partial(save_processed_file, log_file, item_path))
+
+        # Uploads started but not counted yet. In a pipelined run several items get past their
+        # dupe checks side by side, so each one takes a slot against limit_queue before its
+        # screenshots, torrent and uploads, and no new item starts while every slot is taken.
+        reserved_uploads = 0
+
+        def upload_slots_left(limit: int) -> bool:
+            return limit <= 0 or processed_files_count - skipped_files_count + reserved_uploads < limit
+
+        def admit_queue_item() -> bool:
+            return upload_slots_left(int(base_meta.get('limit_queue') or 0))
+
+        async def process_queue_item(index: int, queue_item: Any) -> bool:
+            """Process a single queue item. Returns True once limit_queue has been reached."""
+            slot_reserved = False
 
-        for queue_item in queue_list:
-            total_files = len(queue_list)
-            bot = None
+            def reserve_upload_slot(item_meta: Meta) -> bool:
+                nonlocal reserved_uploads, slot_reserved
+                if not upload_slots_left(int(item_meta.get('limit_queue') or 0)):
+                    return False
+                reserved_uploads += 1
+                slot_reserved = True
+                return True
+
+            def release_upload_slot() -> None:
+                nonlocal reserved_uploads, slot_reserved
+                if slot_reserved:
+                    slot_reserved = False
+                    reserved_uploads -= 1
+
+            try:
+                return await process_item(index, queue_item, reserve_upload_slot, release_upload_slot)
+            finally:
+                release_upload_slot()
+
+        async def process_item(
+            index: int,
+            queue_item: Any,
+            reserve_upload_slot: Callable[[Meta], bool],
+            release_upload_slot: Callable[[], None],
+        ) -> bool:
+            nonlocal processed_files_count, skipped_files_count
+            bot: Any = None
+            connect_task: Optional[asyncio.Task[None]] = None
             current_item_path = ""
             tmp_path = ""
+            path = queue_item if isinstance(queue_item, str) else ""
+            # Items in a pipelined run are processed side by side, so they must not share nested meta values
+            meta = copy.deepcopy(base_meta) if pipeline is not None else base_meta.copy()
             try:
-                meta = base_meta.copy()
 
                 if meta.get('site_upload_queue'):
                     # Extract path and metadata from site upload queue item
@@ -1582,6 +1656,8 @@ async def do_the_thing(base_dir: str) -> None:
                 and not meta['debug']
                 and ((only_unattended and meta.get('unattended', False)) or not only_unattended)
             ):
+                # discord.py is heavy to import, so it is only loaded when the bot is used
+                import discord
                 try:
                     console.print("[cyan]Starting Discord bot initialization...")
                     intents = discord.Intents.default()
@@ -1590,6 +1666,7 @@ async def do_the_thing(base_dir: str) -> None:
                     token = discord_bot_token
                     await asyncio.wait_for(bot.login(token), timeout=10)
                     connect_task = asyncio.create_task(bot.connect())
+                    discord_bots.append((bot, connect_task))
 
                     try:
                         await asyncio.wait_for(bot.wait_until_ready(), timeout=20)
@@ -1597,7 +1674,7 @@ async def do_the_thing(base_dir: str) -> None:
                     except asyncio.TimeoutError:
                         console.print("[bold red]Bot failed to connect within timeout period.")
                         console.print("[yellow]Continuing without Discord integration...")
-                        if 'connect_task' in locals():
+                        if connect_task is not None:
                             connect_task.cancel()
                 except discord.LoginFailure:
                     console.print("[bold red]Discord bot token is invalid. Please check your configuration.")
@@ -1612,9 +1689,13 @@ async def do_the_thing(base_dir: str) -> None:
 
             console.print(f"[green]Gathering info for {os.path.basename(path)}")
 
-            await process_meta(meta, base_dir, bot=bot)
+            await process_meta(meta, base_dir, bot=bot, reserve_upload_slot=reserve_upload_slot)
             tracker_setup = TRACKER_SETUP(config=config)
-            if 'we_are_uploading' not in meta or not meta.get('we_are_uploading', False):
+            if meta.get('limit_queue_full'):
+                # Left for a later run, neither uploaded nor logged as processed
+                pass
+            elif 'we_are_uploading' not in meta or not meta.get('we_are_uploading', False):
+                release_upload_slot()
                 if config['DEFAULT'].get('cross_seeding', True):
                     await process_cross_seeds(meta)
                 if not meta.get('site_check', False):
@@ -1627,11 +1708,7 @@ async def do_the_thing(base_dir: str) -> None:
                             console.print(f"[cyan]Processed {processed_files_count}/{total_files} files with {skipped_files_count} skipped uploading.")
                         else:
                             console.print(f"[cyan]Processed {processed_files_count}/{total_files}.")
-                        if log_file and (not meta['debug'] or "debug" in os.path.basename(log_file)):
-                            if meta.get('site_upload_queue'):
-                                await QueueManager.save_processed_path(log_file, current_item_path)
-                            else:
-                                await save_processed_file(log_file, path)
+                        log_processed(index, meta, current_item_path, path)
 
             else:
                 meta = cast(Meta, meta)
@@ -1696,39 +1773,45 @@ async def do_the_thing(base_dir: str) -> None:
                 skip_uploading_int = int(skip_uploading) if isinstance(skip_uploading, (int, str)) else 0
 
                 if successful_trackers < skip_uploading_int and not meta['debug']:
+                    release_upload_slot()
                     console.print(f"[red]Not enough successful trackers ({successful_trackers}/{skip_uploading_int}). No uploads being processed.[/red]")
                 else:
-                    await process_trackers(
-                        meta,
-                        config,
-                        client,
-                        console,
-                        list(api_trackers),
-                        tracker_class_map,
-                        list(http_trackers),
-                        list(other_api_trackers),
-                    )
-                    if use_discord and bot:
-                        await DiscordNotifier.send_upload_status_notification(config, bot, meta)
+                    try:
+                        async with pipeline_stage('trackers'):
+                            await process_trackers(
+                                meta,
+                                config,
+                                client,
+                                console,
+                                list(api_trackers),
+                                tracker_class_map,
+                                list(http_trackers),
+                                list(other_api_trackers),
+                            )
+                        if use_discord and bot:
+                            from discordbot import DiscordNotifier
+                            await DiscordNotifier.send_upload_status_notification(config, bot, meta)
 
-                    if config['DEFAULT'].get('cross_seeding', True):
-                        await process_cross_seeds(meta)
+                        if config['DEFAULT'].get('cross_seeding', True):
+                            await process_cross_seeds(meta)
 
-                    if 'queue' in meta and meta.get('queue') is not None:
-                        processed_files_count += 1
-                        if 'limit_queue' in meta and int(meta['limit_queue']) > 0:
-                            console.print(f"[cyan]Successfully uploaded {processed_files_count - skipped_files_count} of {meta['limit_queue']} in limit with {total_files} files.")
-                        else:
-                            console.print(f"[cyan]Successfully uploaded {processed_files_count - skipped_files_count}/{total_files} files.")
-                        if log_file and (not meta['debug'] or "debug" in os.path.basename(log_file)):
-                            if meta.get('site_upload_queue'):
-                                await QueueManager.save_processed_path(log_file, current_item_path)
+                        if 'queue' in meta and meta.get('queue') is not None:
+                            processed_files_count += 1
+                            if 'limit_queue' in meta and int(meta['limit_queue']) > 0:
+                                console.print(f"[cyan]Successfully uploaded {processed_files_count - skipped_files_count} of {meta['limit_queue']} in limit with {total_files} files.")
                             else:
-                                await save_processed_file(log_file, path)
+                                console.print(f"[cyan]Successfully uploaded {processed_files_count - skipped_files_count}/{total_files} files.")
+                            log_processed(index, meta, current_item_path, path)
+                    finally:
+                        release_upload_slot()
 
             if meta['debug']:
                 finish_time = time.time()
                 console.print(f"Uploads processed in {finish_time - start_time:.4f} seconds")
+                console.print(http_pool_summary())
+                cache_summary = metadata_cache_summary()
+                if cache_summary:
+                    console.print(cache_summary)
 
             def build_tracker_status_line(tracker: str, status: Any) -> str:
                 try:
@@ -1760,6 +1843,7 @@ async def do_the_thing(base_dir: str) -> None:
                     return f"Error printing {tracker} data: {exc}\n"
 
             if use_discord and bot:
+                from discordbot import DiscordNotifier
                 send_upload_links = bool(discord_config.get('send_upload_links', False)) if discord_config is not None else False
                 if send_upload_links:
                     try:
@@ -1798,11 +1882,7 @@ async def do_the_thing(base_dir: str) -> None:
                 processed_files_count += 1
                 skipped_files_count += 1
                 console.print(f"[cyan]Processed {processed_files_count}/{total_files} files.")
-                if log_file and (not meta['debug'] or "debug" in os.path.basename(log_file)):
-                    if meta.get('site_upload_queue'):
-                        await QueueManager.save_processed_path(log_file, current_item_path)
-                    else:
-                        await save_processed_file(log_file, path)
+                log_processed(index, meta, current_item_path, path)
 
             if meta.get('delete_tmp', False) and tmp_path and os.path.exists(tmp_path) and meta.get('emby', False):
                 try:
@@ -1822,7 +1902,7 @@ async def do_the_thing(base_dir: str) -> None:
                 await cleanup_manager.cleanup()
                 gc.collect()
                 cleanup_manager.reset_terminal()
-                break
+                return True
 
             if sanitize_meta and not meta.get('emby', False):
                 try:
@@ -1833,6 +1913,18 @@ async def do_the_thing(base_dir: str) -> None:
             await cleanup_manager.cleanup()
             gc.collect()
             cleanup_manager.reset_terminal()
+            return False
+
+        if pipeline is not None:
+            await pipeline.run(queue_list, process_queue_item, processed_log, admit=admit_queue_item)
+        else:
+            for index, queue_item in enumerate(queue_list):
+                try:
+                    limit_reached = await process_queue_item(index, queue_item)
+                finally:
+                    await processed_log.finish(index)
+                if limit_reached:
+                    break
 
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred: {e}")
@@ -1842,12 +1934,12 @@ async def do_the_thing(base_dir: str) -> None:
         cleanup_manager.reset_terminal()
 
     finally:
-        if bot is not None:
+        for bot, connect_task in discord_bots:
             await bot.close()
-        if connect_task is not None:
-            connect_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await connect_task
+            if connect_task is not None:
+                connect_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await connect_task
         if not sys.stdin.closed:
             cleanup_manager.reset_terminal()
 
@@ -1929,6 +2021,7 @@ async def process_cross_seeds(meta: Meta) -> None:
                 if tracker != "PTP":
                     dupes = await tracker_class.search_existing(meta, disctype)
                 else:
+                    from src.trackers.PTP import PTP
                     ptp = PTP(config=config)
                     group_id = meta.get('ptp_groupID')
                     if not group_id:
@@ -2003,6 +2096,7 @@ async def process_cross_seeds(meta: Meta) -> None:
 
         if tracker == "AR" and download_url:
             try:
+                from src.trackers.AR import AR
                 ar = AR(config=config)
                 auth_key = await ar.get_auth_key(meta)
 
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import shutil
+import threading
+import time
+from collections.abc import Iterator
 from contextlib import suppress
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,16 +15,117 @@ from typing import Any, Optional
 DEFAULT_LEVEL = "access_denied"  # default: log only failed/denied attempts
 VALID_LEVELS = {"access_denied", "access", "disabled"}
 
+# Rotation defaults: a new file every 10 MiB or 7 days, five compressed backups
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_AGE = 7 * 24 * 3600.0
+DEFAULT_BACKUPS = 5
+# Block size of the reverse reader
+READ_BLOCK = 64 * 1024
+
+
+def _reverse_lines(path: Path) -> Iterator[bytes]:
+    """Lines of a log file, last line first, reading plain files backwards block by block."""
+    if path.suffix == ".gz":
+        # gzip streams cannot be read backwards; backups are bounded by the rotation size
+        with gzip.open(path, "rb") as f:
+            data = f.read()
+        yield from (line for line in reversed(data.split(b"\n")) if line)
+        return
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        rest = b""
+        while pos > 0:
+            size = min(READ_BLOCK, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + rest).split(b"\n")
+            # The first piece may continue in the previous block
+            rest = lines[0]
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line
+        if rest:
+            yield rest
+
+
+def _record_time(line: bytes) -> Optional[float]:
+    try:
+        record = json.loads(line)
+        return datetime.fromisoformat(record["timestamp"]).timestamp()
+    except Exception:
+        return None
+
 
 class AccessLogger:
-    def __init__(self, cfg_dir: Path) -> None:
+    """JSON-lines access log with size and time based rotation.
+
+    The current file is rotated to ``access_log.log.1`` (gzip compressed to
+    ``access_log.log.1.gz`` when ``compress`` is set) once it reaches
+    ``max_bytes`` or its first record is older than ``max_age`` seconds;
+    older backups move up by one and only ``backups`` of them are kept.
+    Reads go backwards from the newest record, so recent entries are found
+    without reading the whole history.
+    """
+
+    def __init__(
+        self,
+        cfg_dir: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+        backups: int = DEFAULT_BACKUPS,
+        compress: bool = True,
+    ) -> None:
         self.cfg_dir = Path(cfg_dir)
         self.cfg_dir.mkdir(parents=True, exist_ok=True)
         # store access level inside webui_auth.json per request
         self.user_file = self.cfg_dir / "webui_auth.json"
         self.log_file = self.cfg_dir / "access_log.log"
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backups = max(0, backups)
+        self.compress = compress
+        # Level read from the user file, with the (mtime, size) it was read at
+        self._level_cache: Optional[tuple[tuple[int, int], str]] = None
+        # Size and first record time of the current file, read on the first write
+        self._size: Optional[int] = None
+        self._started: Optional[float] = None
+        self._write_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, cfg_dir: Path) -> AccessLogger:
+        """Logger with rotation settings from ``UA_ACCESS_LOG_MAX_MB``, ``UA_ACCESS_LOG_MAX_DAYS``,
+        ``UA_ACCESS_LOG_BACKUPS`` and ``UA_ACCESS_LOG_COMPRESS``."""
+
+        def number(name: str, default: float) -> float:
+            try:
+                return float(os.environ.get(name, "") or default)
+            except ValueError:
+                return default
+
+        compress = os.environ.get("UA_ACCESS_LOG_COMPRESS", "1").strip().lower() not in ("0", "false", "no")
+        return cls(
+            cfg_dir,
+            max_bytes=int(number("UA_ACCESS_LOG_MAX_MB", DEFAULT_MAX_BYTES / 1024 / 1024) * 1024 * 1024),
+            max_age=number("UA_ACCESS_LOG_MAX_DAYS", DEFAULT_MAX_AGE / 86400) * 86400,
+            backups=int(number("UA_ACCESS_LOG_BACKUPS", DEFAULT_BACKUPS)),
+            compress=compress,
+        )
 
     def get_level(self) -> str:
+        # Consulted on every API response, so only re-read the file when it changed
+        try:
+            st = self.user_file.stat()
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+        if signature is not None and self._level_cache is not None and self._level_cache[0] == signature:
+            return self._level_cache[1]
+        level = self._read_level()
+        if signature is not None:
+            self._level_cache = (signature, level)
+        return level
+
+    def _read_level(self) -> str:
         try:
             if self.user_file.exists():
                 try:
@@ -49,6 +156,7 @@ class AccessLogger:
             data["access_log_level"] = level
             # write back safely
             self.user_file.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            self._level_cache = None
             return True
         except Exception:
             return False
@@ -150,24 +258,126 @@ class AccessLogger:
                     record["user"] = "<REDACTED>"
 
             # Append as JSON line
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+            with self._write_lock:
+                self._rotate_if_needed(len(line))
+                with open(self.log_file, "ab") as f:
+                    f.write(line)
+                self._size = (self._size or 0) + len(line)
+                if self._started is None:
+                    self._started = time.time()
         except Exception:
             # Best-effort logging: swallow errors
             pass
 
-    def tail(self, n: int = 200) -> list[dict[str, Any]]:
-        try:
-            if not self.log_file.exists():
-                return []
-            # Read last n lines (simple approach)
-            with open(self.log_file, encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            lines = lines[-n:]
-            out = []
-            for ln in lines:
-                with suppress(Exception):
-                    out.append(json.loads(ln))
+    def _rotate_if_needed(self, incoming: int) -> None:
+        # Caller holds the write lock
+        if self._size is None:
+            try:
+                self._size = self.log_file.stat().st_size
+            except OSError:
+                self._size = 0
+            if self._size:
+                # Age of the current file is the age of its first record
+                with suppress(Exception), open(self.log_file, "rb") as f:
+                    self._started = _record_time(f.readline())
+                if self._started is None:
+                    with suppress(OSError):
+                        self._started = self.log_file.stat().st_mtime
+        if not self._size:
+            return
+        too_big = self.max_bytes > 0 and self._size + incoming > self.max_bytes
+        too_old = self.max_age > 0 and self._started is not None and time.time() - self._started > self.max_age
+        if too_big or too_old:
+            self.rotate()
+
+    def _backup(self, index: int) -> Optional[Path]:
+        """The existing backup with this number, compressed or not."""
+        for path in (Path(f"{self.log_file}.{index}.gz"), Path(f"{self.log_file}.{index}")):
+            if path.exists():
+                return path
+        return None
+
+    def rotate(self) -> None:
+        """Move the current file to the first backup and drop the oldest backup."""
+        with suppress(OSError):
+            if self.backups == 0:
+                self.log_file.unlink()
+            else:
+                oldest = self._backup(self.backups)
+                if oldest is not None:
+                    oldest.unlink()
+                for index in range(self.backups - 1, 0, -1):
+                    path = self._backup(index)
+                    if path is not None:
+                        suffix = ".gz" if path.suffix == ".gz" else ""
+                        path.replace(f"{self.log_file}.{index + 1}{suffix}")
+                if self.log_file.exists():
+                    if self.compress:
+                        with open(self.log_file, "rb") as src, gzip.open(f"{self.log_file}.1.gz", "wb") as dst:
+                            shutil.copyfileobj(src, dst)
+                        self.log_file.unlink()
+                    else:
+                        self.log_file.replace(f"{self.log_file}.1")
+        self._size = 0
+        self._started = None
+
+    def _lines_newest_first(self) -> Iterator[bytes]:
+        paths = [self.log_file, *(self._backup(index) for index in range(1, self.backups + 1))]
+        for path in paths:
+            if path is None:
+                continue
+            # A file rotated away while reading ends that file early rather than failing the query
+            with suppress(OSError, EOFError):
+                yield from _reverse_lines(path)
+
+    def query(
+        self,
+        n: int = 200,
+        *,
+        endpoint: Optional[str] = None,
+        user: Optional[str] = None,
+        status: Optional[int] = None,
+        success: Optional[bool] = None,
+    ) -> list[dict[str, Any]]:
+        """The last ``n`` records matching every given filter, oldest first.
+
+        Records are read from the newest backwards, through the rotated
+        backups if needed, and reading stops once ``n`` records matched.
+        Lines that cannot contain a match are skipped before being parsed.
+        """
+        wanted: dict[str, Any] = {}
+        if endpoint is not None:
+            wanted["endpoint"] = endpoint
+        if user is not None:
+            wanted["user"] = user
+        if status is not None:
+            wanted["status"] = int(status)
+        if success is not None:
+            wanted["success"] = bool(success)
+        # Records are written with json.dumps defaults, so a matching line contains these bytes
+        needles = [f'"{key}": {json.dumps(value, ensure_ascii=False)}'.encode() for key, value in wanted.items()]
+
+        out: list[dict[str, Any]] = []
+        if n <= 0:
             return out
+        try:
+            for line in self._lines_newest_first():
+                if not all(needle in line for needle in needles):
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict) or any(record.get(key) != value for key, value in wanted.items()):
+                    continue
+                out.append(record)
+                if len(out) >= n:
+                    break
         except Exception:
-            return []
+            pass
+        out.reverse()
+        return out
+
+    def tail(self, n: int = 200) -> list[dict[str, Any]]:
+        return self.query(n)
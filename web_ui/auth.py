@@ -5,24 +5,30 @@ Provides:
 - Session secret loading (env/file) and AES-GCM key derivation
 - AES-GCM encrypt/decrypt helpers that return base64 payloads
 - File-backed user and credential storage under XDG config dir
+- An in-memory cache of the parsed and decrypted user file, reused until the
+  file changes on disk or is written through these helpers
 """
 from __future__ import annotations
 
 import base64
+import functools
 import json
 import logging
 import math
 import os
 import string
+import threading
 from contextlib import suppress
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 
 from argon2 import PasswordHasher
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class EncryptionError(Exception):
     """Raised when encryption or key derivation fails."""
@@ -35,6 +41,26 @@ ENV_SESSION_SECRET = "SESSION_SECRET"  # nosec B105
 ENV_SESSION_SECRET_FILE = "SESSION_SECRET_FILE"  # nosec B105
 
 
+@functools.cache
+def _container_markers_present() -> bool:
+    """Whether the filesystem shows signs of a container. Checked once, the answer does not change while running."""
+    # Common Docker indicator file
+    try:
+        if Path("/.dockerenv").exists():
+            return True
+    except Exception:
+        pass
+    # Check cgroup for container hints
+    try:
+        with open("/proc/1/cgroup") as f:
+            txt = f.read()
+            if any(k in txt for k in ("docker", "kubepods", "containerd")):
+                return True
+    except Exception:
+        pass
+    return False
+
+
 def get_config_dir() -> Path:
     # Detect container runtime: prefer repository `data/` when running in Docker
     def _running_in_docker() -> bool:
@@ -42,21 +68,7 @@ def get_config_dir() -> Path:
         v = os.environ.get("IN_DOCKER") or os.environ.get("RUNNING_IN_CONTAINER")
         if v and v.lower() in ("1", "true", "yes"):
             return True
-        # Common Docker indicator file
-        try:
-            if Path("/.dockerenv").exists():
-                return True
-        except Exception:
-            pass
-        # Check cgroup for container hints
-        try:
-            with open("/proc/1/cgroup") as f:
-                txt = f.read()
-                if any(k in txt for k in ("docker", "kubepods", "containerd")):
-                    return True
-        except Exception:
-            pass
-        return False
+        return _container_markers_present()
 
     # Repository data dir
     repo_dir = Path(__file__).resolve().parent.parent / "data"
@@ -263,10 +275,100 @@ def verify_password(hash: str, password: str) -> bool:
         return False
 
 
+# Environment variables get_config_dir() depends on
+_CONFIG_DIR_ENV = ("IN_DOCKER", "RUNNING_IN_CONTAINER", "XDG_CONFIG_HOME", "APPDATA", "HOME")
+_user_file_paths: dict[tuple[Optional[str], ...], Path] = {}
+
+
 def _get_user_file() -> Path:
+    # Resolved on every auth check, so remember the answer for the current environment
+    env_key = tuple(os.environ.get(name) for name in _CONFIG_DIR_ENV)
+    path = _user_file_paths.get(env_key)
+    if path is not None:
+        return path
     cfg = get_config_dir()
     cfg.mkdir(parents=True, exist_ok=True)
-    return cfg / "webui_auth.json"
+    path = cfg / "webui_auth.json"
+    _user_file_paths[env_key] = path
+    return path
+
+
+class _UserFileCache:
+    """Values derived from webui_auth.json, kept until the file changes.
+
+    Every web UI request checks IP lists, API tokens and the persisted user,
+    which would otherwise re-read the JSON and run the AES decryption each
+    time. The file is identified by its mtime, size and inode, so changes made
+    by another process are picked up on the next call; writes made through
+    this module invalidate the cache directly.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._signature: Optional[tuple[str, int, int, int]] = None
+        self._values: dict[str, str] = {}
+
+    @staticmethod
+    def _signature_of(path: Path) -> Optional[tuple[str, int, int, int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (str(path), st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def get(self, name: str, compute: Callable[[], T]) -> T:
+        """The cached value ``name``, computed when missing. Callers get a copy they may modify."""
+        signature = self._signature_of(_get_user_file())
+        with self._lock:
+            if signature is None or signature != self._signature:
+                self._signature = signature
+                self._values = {}
+            elif name in self._values:
+                return json.loads(self._values[name])
+        value = compute()
+        if signature is not None:
+            with self._lock:
+                if signature == self._signature:
+                    # Everything cached came out of JSON, and loading it again is cheaper than a deepcopy
+                    self._values[name] = json.dumps(value)
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._signature = None
+            self._values = {}
+
+
+_user_cache = _UserFileCache()
+
+
+def invalidate_user_cache() -> None:
+    """Drop the cached user file state; call after writing webui_auth.json outside this module."""
+    _user_cache.invalidate()
+
+
+def read_user_file() -> dict[str, Any]:
+    """The raw (still encrypted) contents of webui_auth.json, or an empty dict."""
+    def _read() -> dict[str, Any]:
+        path = _get_user_file()
+        if not path.exists():
+            return {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    return _user_cache.get("raw", _read)
+
+
+def _write_user_file(path: Path, data: dict) -> None:
+    try:
+        path.write_text(json.dumps(data), encoding="utf-8")
+    finally:
+        _user_cache.invalidate()
+    with suppress(Exception):
+        os.chmod(path, 0o600)
 
 
 def _get_master_key() -> bytes:
@@ -397,12 +499,14 @@ def create_user(username: str, password: str) -> None:
     username_enc = encrypt_text(key, username)
 
     data = {"username_enc": username_enc, "password_hash": hash_password(password), "extras_enc": extras_enc}
-    path.write_text(json.dumps(data), encoding="utf-8")
-    with suppress(Exception):
-        os.chmod(path, 0o600)
+    _write_user_file(path, data)
 
 
 def load_user() -> Optional[dict]:
+    return _user_cache.get("user", _load_user)
+
+
+def _load_user() -> Optional[dict]:
     path = _get_user_file()
     if not path.exists():
         return None
@@ -449,6 +553,10 @@ def load_user() -> Optional[dict]:
 
 
 def get_totp_secret() -> Optional[str]:
+    return _user_cache.get("totp_secret", _get_totp_secret)
+
+
+def _get_totp_secret() -> Optional[str]:
     u = load_user()
     if not u:
         return None
@@ -487,12 +595,14 @@ def set_totp_secret(secret: Optional[str]) -> None:
 
     key = _get_master_key()
     raw["extras_enc"] = encrypt_text(key, json.dumps(extras, separators=(",",":"), ensure_ascii=False))
-    path.write_text(json.dumps(raw), encoding="utf-8")
-    with suppress(Exception):
-        os.chmod(path, 0o600)
+    _write_user_file(path, raw)
 
 
 def get_recovery_hashes() -> list[str]:
+    return _user_cache.get("recovery_hashes", _get_recovery_hashes)
+
+
+def _get_recovery_hashes() -> list[str]:
     u = load_user()
     if not u:
         return []
@@ -532,12 +642,14 @@ def set_recovery_hashes(hashes: list[str]) -> None:
 
     key = _get_master_key()
     raw["extras_enc"] = encrypt_text(key, json.dumps(extras, separators=(",",":"), ensure_ascii=False))
-    path.write_text(json.dumps(raw), encoding="utf-8")
-    with suppress(Exception):
-        os.chmod(path, 0o600)
+    _write_user_file(path, raw)
 
 
 def get_api_tokens() -> dict:
+    return _user_cache.get("api_tokens", _get_api_tokens)
+
+
+def _get_api_tokens() -> dict:
     u = load_user()
     if not u:
         return {}
@@ -576,9 +688,7 @@ def set_api_tokens(store: dict) -> None:
 
     key = _get_master_key()
     raw["extras_enc"] = encrypt_text(key, json.dumps(extras, separators=(",",":"), ensure_ascii=False))
-    path.write_text(json.dumps(raw), encoding="utf-8")
-    with suppress(Exception):
-        os.chmod(path, 0o600)
+    _write_user_file(path, raw)
 
 
 def verify_user(username: str, password: str) -> bool:
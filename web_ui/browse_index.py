@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import operator
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.console import console
+
+# Regex for splitting filenames on common separators (dots, dashes, underscores, spaces)
+SEP_RE = re.compile(r'[\s.\-_]+')
+
+DEFAULT_RESCAN_INTERVAL = 300.0
+RESULT_CACHE_SIZE = 16
+
+
+def tokenize(name: str) -> tuple[str, ...]:
+    return tuple(t for t in SEP_RE.split(name.lower()) if t)
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    name: str
+    path: str
+    is_dir: bool
+    tokens: tuple[str, ...]
+    # Lower-cased extension, "" for folders
+    ext: str
+    # Order among equally good matches: fewer tokens, folders first, then by name
+    rank_key: tuple[int, int, str, str]
+
+
+def make_entry(name: str, path: str, is_dir: bool) -> IndexEntry:
+    lower = name.lower()
+    tokens = tokenize(name)
+    return IndexEntry(name, path, is_dir, tokens, "" if is_dir else os.path.splitext(lower)[1], (len(tokens), 0 if is_dir else 1, lower, path))
+
+
+@dataclass
+class _DirRecord:
+    mtime_ns: int
+    # Full paths of the indexed entries directly inside the directory
+    children: list[str] = field(default_factory=list)
+    # Subdirectories to descend into (hidden dirs and symlinks are not followed, like os.walk)
+    subdirs: list[str] = field(default_factory=list)
+
+
+def _match_rank(name_tokens: Sequence[str], query_tokens: Sequence[str]) -> Optional[int]:
+    """Rank of a name for a query, or None when the query tokens are not an ordered subsequence of the name tokens.
+
+    0 means the query tokens appear next to each other, higher values mean more tokens in between.
+    """
+    pos = 0
+    first = -1
+    for qt in query_tokens:
+        while pos < len(name_tokens) and name_tokens[pos] != qt:
+            pos += 1
+        if pos == len(name_tokens):
+            return None
+        if first < 0:
+            first = pos
+        pos += 1
+    return pos - first - len(query_tokens)
+
+
+class BrowseIndex:
+    """Filename index of the web UI browse roots.
+
+    A background thread walks the roots once and then rescans them
+    periodically. Rescans only list directories whose mtime changed (a
+    directory's mtime changes when entries are added, removed or renamed in
+    it), so an unchanged tree costs one ``stat`` per directory. Names are
+    tokenised into an inverted index, so a query only looks at entries that
+    contain every query token.
+    """
+
+    def __init__(self, roots: Sequence[str], extensions: Collection[str], rescan_interval: float = DEFAULT_RESCAN_INTERVAL) -> None:
+        self.roots = tuple(os.path.abspath(root) for root in roots)
+        self.extensions = frozenset(ext.lower() for ext in extensions)
+        self.rescan_interval = rescan_interval
+        self._entries: dict[str, IndexEntry] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._dirs: dict[str, _DirRecord] = {}
+        # Bumped on every change, invalidates the cached results
+        self._generation = 0
+        self._results: OrderedDict[tuple[tuple[str, ...], frozenset[str]], tuple[int, list[IndexEntry]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the first full scan has finished."""
+        return self._ready.is_set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="browse-index", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def request_rescan(self) -> None:
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.scan()
+            except Exception as e:
+                # The previous state of the index stays usable
+                console.print(f"Browse index scan failed: {e}", markup=False)
+            self._ready.set()
+            self._wake.wait(self.rescan_interval)
+            self._wake.clear()
+
+    def scan(self) -> None:
+        """Bring the index up to date with the filesystem."""
+        seen: set[str] = set()
+        for root in self.roots:
+            stack = [root]
+            while stack and not self._stop.is_set():
+                dirpath = stack.pop()
+                try:
+                    mtime_ns = os.stat(dirpath).st_mtime_ns
+                except OSError:
+                    continue
+                seen.add(dirpath)
+                record = self._dirs.get(dirpath)
+                if record is None or record.mtime_ns != mtime_ns:
+                    record = self._list_dir(dirpath, mtime_ns)
+                stack.extend(record.subdirs)
+        if self._stop.is_set():
+            return
+        # Directories that were not reached any more are gone (or hidden behind a removed parent)
+        for dirpath in [d for d in self._dirs if d not in seen]:
+            record = self._dirs.pop(dirpath)
+            with self._lock:
+                for path in record.children:
+                    self._remove(path)
+
+    def _list_dir(self, dirpath: str, mtime_ns: int) -> _DirRecord:
+        found: list[IndexEntry] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(dirpath) as it:
+                for dir_entry in it:
+                    name = dir_entry.name
+                    if name.startswith("."):
+                        continue
+                    try:
+                        is_dir = dir_entry.is_dir()
+                    except OSError:
+                        continue
+                    if is_dir:
+                        try:
+                            if not dir_entry.is_symlink():
+                                subdirs.append(dir_entry.path)
+                        except OSError:
+                            continue
+                    elif os.path.splitext(name)[1].lower() not in self.extensions:
+                        continue
+                    found.append(make_entry(name, dir_entry.path, is_dir))
+        except OSError:
+            pass
+
+        old = self._dirs.get(dirpath)
+        current = {entry.path for entry in found}
+        with self._lock:
+            if old is not None:
+                for path in old.children:
+                    if path not in current:
+                        self._remove(path)
+            for entry in found:
+                self._add(entry)
+        record = _DirRecord(mtime_ns, [entry.path for entry in found], subdirs)
+        self._dirs[dirpath] = record
+        return record
+
+    def _add(self, entry: IndexEntry) -> None:
+        previous = self._entries.get(entry.path)
+        if previous == entry:
+            return
+        if previous is not None:
+            self._remove(entry.path)
+        self._entries[entry.path] = entry
+        self._generation += 1
+        for token in set(entry.tokens):
+            self._postings.setdefault(token, set()).add(entry.path)
+
+    def _remove(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        self._generation += 1
+        for token in set(entry.tokens):
+            paths = self._postings.get(token)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self._postings[token]
+
+    def search(self, query: str, extensions: Collection[str], offset: int = 0, limit: int = 100) -> tuple[list[IndexEntry], int]:
+        """Ranked page of entries matching ``query`` and the total number of matches.
+
+        The query tokens must appear as whole tokens, in order, in the name.
+        Files must have one of ``extensions``. Names with the tokens next to
+        each other rank first, then names with fewer other tokens, then
+        folders before files and finally by name.
+        """
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return [], 0
+        allowed = frozenset(ext.lower() for ext in extensions)
+        cache_key = (query_tokens, allowed)
+        with self._lock:
+            cached = self._results.get(cache_key)
+            if cached is not None and cached[0] == self._generation:
+                self._results.move_to_end(cache_key)
+                matches = cached[1]
+                return matches[offset:offset + limit], len(matches)
+            generation = self._generation
+            postings = [self._postings.get(token) for token in set(query_tokens)]
+            if any(paths is None for paths in postings):
+                return [], 0
+            postings_sets = sorted((paths for paths in postings if paths is not None), key=len)
+            candidates = postings_sets[0].intersection(*postings_sets[1:])
+            entries = [self._entries[path] for path in candidates]
+
+        matches = [entry for entry in entries if entry.is_dir or entry.ext in allowed]
+        if len(query_tokens) > 1:
+            gaps = {entry.path: _match_rank(entry.tokens, query_tokens) for entry in matches}
+            matches = [entry for entry in matches if gaps[entry.path] is not None]
+            matches.sort(key=lambda entry: (gaps[entry.path], entry.rank_key))
+        else:
+            matches.sort(key=operator.attrgetter("rank_key"))
+
+        # Typing a query and paging through it repeats the same search, keep the last few until the index changes
+        with self._lock:
+            self._results[cache_key] = (generation, matches)
+            while len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return matches[offset:offset + limit], len(matches)
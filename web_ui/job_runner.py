@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import codecs
+import contextlib
+import itertools
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.console import console
+
+# Subprocess output is read in chunks and sent in batches: output arriving
+# within the window is coalesced into one batch (up to the size limit), and a
+# keepalive is produced when nothing arrived for the interval.
+READ_SIZE = 64 * 1024
+BATCH_WINDOW = 0.05
+BATCH_CHARS = 64 * 1024
+KEEPALIVE_INTERVAL = 1.0
+
+DEFAULT_MAX_JOBS = 2
+DEFAULT_SPARES = 1
+DEFAULT_HISTORY_SIZE = 50
+# Time a cancelled job gets to shut down after SIGTERM before it is killed
+CANCEL_GRACE = 5.0
+
+OUTPUT_ORIGINS = ("stdout", "stderr")
+FINAL_STATES = ("finished", "failed", "cancelled")
+
+
+def pump_output(stream: Any, origin: str, q: queue.Queue[tuple[str, Optional[str]]]) -> None:
+    """Reader thread: forward decoded chunks of a subprocess pipe, then `None` at EOF."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    try:
+        fd = stream.fileno()
+        while True:
+            data = os.read(fd, READ_SIZE)
+            if not data:
+                break
+            text = decoder.decode(data)
+            if text:
+                q.put((origin, text))
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            q.put((origin, tail))
+    except Exception as e:
+        console.print(f"{origin} read error: {e}", markup=False)
+    finally:
+        q.put((origin, None))
+
+
+def batched_output(q: queue.Queue[tuple[str, Optional[str]]], origins: tuple[str, ...]) -> Iterator[Optional[tuple[str, str]]]:
+    """Coalesce the chunks of the reader threads into `(origin, text)` batches.
+
+    Batches end on a line boundary; an unfinished line (a prompt, a progress
+    bar) is sent on its own once no more output arrived within the window.
+    Yields `None` after each keepalive interval without output. Ends when
+    every reader reached EOF.
+    """
+    open_origins = set(origins)
+    pending: dict[str, str] = dict.fromkeys(origins, "")
+    while open_origins:
+        waiting = any(pending.values())
+        try:
+            item = q.get(timeout=BATCH_WINDOW if waiting else KEEPALIVE_INTERVAL)
+        except queue.Empty:
+            if not waiting:
+                yield None
+                continue
+            for origin, text in pending.items():
+                if text:
+                    yield origin, text
+            pending = dict.fromkeys(pending, "")
+            continue
+
+        parts: dict[str, list[str]] = {origin: [text] for origin, text in pending.items() if text}
+        size = 0
+        deadline = time.monotonic() + BATCH_WINDOW
+        while True:
+            origin, text = item
+            if text is None:
+                open_origins.discard(origin)
+            else:
+                parts.setdefault(origin, []).append(text)
+                size += len(text)
+            remaining = deadline - time.monotonic()
+            if size >= BATCH_CHARS or not open_origins or remaining <= 0:
+                break
+            try:
+                item = q.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+        for origin, chunks in parts.items():
+            text = "".join(chunks)
+            # Hold back an unfinished line unless the stream ended or the batch is full
+            cut = len(text) if origin not in open_origins or len(text) >= BATCH_CHARS else text.rfind("\n") + 1
+            pending[origin] = text[cut:]
+            if cut:
+                yield origin, text[:cut]
+
+    for origin, text in pending.items():
+        if text:
+            yield origin, text
+
+
+@dataclass
+class Job:
+    id: str
+    session_id: str
+    argv: list[str]
+    # queued, running, finished, failed or cancelled
+    status: str = "queued"
+    created: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    returncode: Optional[int] = None
+    process: Optional[subprocess.Popen[str]] = None
+    # Output channel of the job, fed by the reader threads of its worker
+    output: queue.Queue[tuple[str, Optional[str]]] = field(default_factory=queue.Queue)
+    done: threading.Event = field(default_factory=threading.Event)
+    cancel_requested: bool = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process is not None else None
+
+    def to_dict(self) -> dict[str, Any]:
+        end = self.finished if self.finished is not None else time.time()
+        return {
+            "id": self.id,
+            "session_id": self.session_id,
+            "argv": self.argv,
+            "status": self.status,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "duration": round(end - self.started, 3) if self.started is not None else None,
+            "returncode": self.returncode,
+            "pid": self.pid,
+        }
+
+
+class JobRunner:
+    """Pool of warm Upload Assistant worker processes for the web UI.
+
+    Spare workers are started ahead of time and import upload.py's
+    dependencies while idle, so a job starts without paying for interpreter
+    and import start-up. Each worker runs exactly one job, which gives jobs
+    their own process (and their own sys.argv, config and console) while up
+    to ``max_jobs`` of them run at once; further jobs wait in a FIFO queue.
+    Finished jobs are kept in a bounded history.
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        max_jobs: int = DEFAULT_MAX_JOBS,
+        spares: int = DEFAULT_SPARES,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+    ) -> None:
+        self.base_dir = os.path.abspath(base_dir)
+        self.max_jobs = max(1, max_jobs)
+        self.spares = max(0, spares)
+        self._ids = itertools.count(1)
+        self._jobs: dict[str, Job] = {}
+        self._queued: deque[Job] = deque()
+        self._running: dict[str, Job] = {}
+        self._history: deque[Job] = deque(maxlen=max(1, history_size))
+        self._idle: deque[subprocess.Popen[str]] = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _spawn_worker(self) -> subprocess.Popen[str]:
+        env = os.environ.copy()
+        env["PYTHONUNBUFFERED"] = "1"
+        env["PYTHONIOENCODING"] = "utf-8"
+        return subprocess.Popen(
+            [sys.executable, "-u", "-m", "web_ui.job_worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=0,
+            cwd=self.base_dir,
+            env=env,
+        )
+
+    def _take_worker(self) -> subprocess.Popen[str]:
+        while self._idle:
+            worker = self._idle.popleft()
+            if worker.poll() is None:
+                return worker
+            self._close_pipes(worker)
+        return self._spawn_worker()
+
+    def _fill_spares(self) -> None:
+        try:
+            while not self._closed and len(self._idle) < self.spares:
+                self._idle.append(self._spawn_worker())
+        except OSError as e:
+            console.print(f"Could not start a spare upload worker: {e}", markup=False)
+
+    def start(self) -> None:
+        """Start the spare workers now rather than with the first job."""
+        with self._lock:
+            self._fill_spares()
+
+    def submit(self, session_id: str, argv: Sequence[str]) -> Job:
+        """Queue a run of upload.py with ``argv`` and start it as soon as a slot is free."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Job runner is shut down")
+            job = Job(id=f"{int(time.time())}-{next(self._ids)}", session_id=session_id, argv=list(argv))
+            self._jobs[job.id] = job
+            self._queued.append(job)
+            self._dispatch()
+        return job
+
+    def _dispatch(self) -> None:
+        # Caller holds the lock
+        if self._closed:
+            return
+        started = False
+        while self._queued and len(self._running) < self.max_jobs:
+            job = self._queued.popleft()
+            try:
+                worker = self._take_worker()
+                if worker.stdin is None:
+                    raise OSError("worker has no stdin")
+                worker.stdin.write(json.dumps({"argv": job.argv}) + "\n")
+                worker.stdin.flush()
+            except OSError as e:
+                console.print(f"Could not start job {job.id}: {e}", markup=False)
+                self._finish(job, "failed", None)
+                continue
+            job.process = worker
+            job.status = "running"
+            job.started = time.time()
+            self._running[job.id] = job
+            started = True
+            for origin, stream in zip(OUTPUT_ORIGINS, (worker.stdout, worker.stderr)):
+                threading.Thread(target=pump_output, args=(stream, origin, job.output), name=f"job-{job.id}-{origin}", daemon=True).start()
+            threading.Thread(target=self._wait, args=(job,), name=f"job-{job.id}-wait", daemon=True).start()
+        if started:
+            self._fill_spares()
+
+    def _wait(self, job: Job) -> None:
+        process = job.process
+        if process is None:
+            return
+        returncode = process.wait()
+        with contextlib.suppress(Exception):
+            if process.stdin is not None:
+                process.stdin.close()
+        with self._lock:
+            self._running.pop(job.id, None)
+            status = "cancelled" if job.cancel_requested else "finished" if returncode == 0 else "failed"
+            self._finish(job, status, returncode)
+            self._dispatch()
+
+    def _finish(self, job: Job, status: str, returncode: Optional[int]) -> None:
+        # Caller holds the lock
+        job.status = status
+        job.returncode = returncode
+        job.finished = time.time()
+        if job.process is None:
+            # Never started: end the output channel ourselves
+            for origin in OUTPUT_ORIGINS:
+                job.output.put((origin, None))
+        if len(self._history) == self._history.maxlen:
+            self._jobs.pop(self._history[0].id, None)
+        self._history.append(job)
+        job.done.set()
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job, or ask a running one to stop and kill it after the grace period."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINAL_STATES:
+                return False
+            job.cancel_requested = True
+            if job.status == "queued":
+                with contextlib.suppress(ValueError):
+                    self._queued.remove(job)
+                self._finish(job, "cancelled", None)
+                return True
+            process = job.process
+        if process is not None:
+            with contextlib.suppress(OSError):
+                process.terminate()
+            threading.Thread(target=self._kill_after_grace, args=(process,), name=f"job-{job_id}-cancel", daemon=True).start()
+        return True
+
+    @staticmethod
+    def _kill_after_grace(process: subprocess.Popen[str]) -> None:
+        try:
+            process.wait(timeout=CANCEL_GRACE)
+        except subprocess.TimeoutExpired:
+            with contextlib.suppress(OSError):
+                process.kill()
+
+    @staticmethod
+    def _close_pipes(process: subprocess.Popen[str]) -> None:
+        for stream in (process.stdin, process.stdout, process.stderr):
+            with contextlib.suppress(Exception):
+                if stream is not None:
+                    stream.close()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> list[Job]:
+        """Running and queued jobs first, then the history with the most recent job first."""
+        with self._lock:
+            return [*self._running.values(), *self._queued, *reversed(self._history)]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "max_jobs": self.max_jobs,
+                "running": len(self._running),
+                "queued": len(self._queued),
+                "idle_workers": sum(1 for worker in self._idle if worker.poll() is None),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the spare workers and cancel every job."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            # Queued jobs are cancelled under the same lock, so a job finishing meanwhile can not start one of them
+            while self._queued:
+                job = self._queued.popleft()
+                job.cancel_requested = True
+                self._finish(job, "cancelled", None)
+            running = [job.id for job in self._running.values()]
+        for worker in idle:
+            with contextlib.suppress(OSError):
+                worker.kill()
+            self._close_pipes(worker)
+        for job_id in running:
+            self.cancel(job_id)
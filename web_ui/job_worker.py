@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import ast
+import contextlib
+import importlib
+import json
+import os
+import runpy
+import sys
+
+# Started by the job runner as ``python -u -m web_ui.job_worker`` in the
+# repository root. The worker imports everything upload.py imports while it
+# waits, so a job only pays for reading the config and its own work. The first
+# line on stdin is the job, ``{"argv": [...]}``; the rest of stdin is the
+# input of the job. One worker runs one job and exits, which keeps the global
+# state of upload.py (sys.argv, config, signal handlers) separate per job.
+
+
+def _warm_imports(upload_script: str) -> None:
+    """Import the modules upload.py imports at the top level, except the user config."""
+    with open(upload_script, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), upload_script)
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            if name == "data" or name.startswith("data."):
+                continue
+            # A module that fails here fails again, with a proper report, when the job runs
+            with contextlib.suppress(Exception):
+                importlib.import_module(name)
+
+
+def main() -> int:
+    upload_script = os.path.join(os.getcwd(), "upload.py")
+    _warm_imports(upload_script)
+
+    line = sys.stdin.readline()
+    if not line:
+        # The runner shut down before handing out a job
+        return 0
+    try:
+        job = json.loads(line)
+        argv = [str(arg) for arg in job["argv"]]
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"Invalid job: {e}", file=sys.stderr)
+        return 2
+
+    # Read the config as it is now, not as it was when the worker started
+    sys.modules.pop("data.config", None)
+    sys.argv = [upload_script, *argv]
+    runpy.run_path(upload_script, run_name="__main__")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
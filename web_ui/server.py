@@ -41,6 +41,8 @@ except Exception:
     ansi_to_html = None
 
 from src.console import console
+from web_ui.browse_index import DEFAULT_RESCAN_INTERVAL, BrowseIndex
+from web_ui.job_runner import DEFAULT_MAX_JOBS, DEFAULT_SPARES, OUTPUT_ORIGINS, Job, JobRunner, batched_output
 
 cfg_dir = auth_mod.get_config_dir()
 cfg_dir.mkdir(parents=True, exist_ok=True)
@@ -51,7 +53,7 @@ try:
 except Exception:
     AccessLogger = None
 
-access_logger = AccessLogger(cfg_dir) if AccessLogger is not None else None
+access_logger = AccessLogger.from_env(cfg_dir) if AccessLogger is not None else None
 
 # Helper: simple file-backed config store under the auth config dir. Values
 # are stored as raw text. This replaces OS keyring usage and allows Docker
@@ -230,13 +232,19 @@ def _load_session_dict() -> dict:
         enc = session.get("enc")
         if not enc:
             return {}
+        # The session is decrypted once per request; g keeps the result next to the payload it came from
+        cached = g.get("_session_dict")
+        if cached is not None and cached[0] == enc:
+            return dict(cached[1])
         key = _derive_aes_key()
         if not key:
             return {}
         dec = auth_mod.decrypt_text(key, enc)
         if not dec:
             return {}
-        return json.loads(dec)
+        d = json.loads(dec)
+        g._session_dict = (enc, d)
+        return dict(d)
     except Exception:
         return {}
 
@@ -249,6 +257,8 @@ def _commit_session_dict(d: dict) -> None:
         raw = json.dumps(d, separators=(",", ":"), ensure_ascii=False)
         enc = auth_mod.encrypt_text(key, raw)
         session["enc"] = enc
+        with contextlib.suppress(Exception):
+            g._session_dict = (enc, dict(d))
     except Exception:
         pass
 
@@ -274,12 +284,9 @@ def _session_pop(key: str, default: Any = None) -> Any:
 def _get_ip_whitelist() -> list[str]:
     """Get the list of whitelisted IPs."""
     try:
-        path = cfg_dir / "webui_auth.json"
-        if path.exists():
-            data = json.loads(path.read_text(encoding="utf-8"))
-            val = data.get("ip_whitelist")
-            if isinstance(val, list):
-                return val
+        val = auth_mod.read_user_file().get("ip_whitelist")
+        if isinstance(val, list):
+            return val
     except Exception:
         pass
     return []
@@ -299,17 +306,16 @@ def _set_ip_whitelist(ips: list[str]) -> None:
         path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     except Exception:
         pass
+    finally:
+        auth_mod.invalidate_user_cache()
 
 
 def _get_ip_blacklist() -> list[str]:
     """Get the list of blacklisted IPs."""
     try:
-        path = cfg_dir / "webui_auth.json"
-        if path.exists():
-            data = json.loads(path.read_text(encoding="utf-8"))
-            val = data.get("ip_blacklist")
-            if isinstance(val, list):
-                return val
+        val = auth_mod.read_user_file().get("ip_blacklist")
+        if isinstance(val, list):
+            return val
     except Exception:
         pass
     return []
@@ -329,6 +335,8 @@ def _set_ip_blacklist(ips: list[str]) -> None:
         path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     except Exception:
         pass
+    finally:
+        auth_mod.invalidate_user_cache()
 
 
 def _get_ip_failures() -> dict[str, list[int]]:
@@ -339,24 +347,21 @@ def _get_ip_failures() -> dict[str, list[int]]:
     timestamps so they behave as recent failures.
     """
     try:
-        path = cfg_dir / "webui_auth.json"
-        if path.exists():
-            data = json.loads(path.read_text(encoding="utf-8"))
-            val = data.get("ip_failures")
-            if isinstance(val, dict):
-                now = int(time.time())
-                out: dict[str, list[int]] = {}
-                for k, v in val.items():
-                    if isinstance(v, list):
-                        # Coerce list members to ints and filter invalid
-                        try:
-                            out[k] = [int(x) for x in v]
-                        except Exception:
-                            out[k] = []
-                    elif isinstance(v, int):
-                        # Legacy count: treat as recent failures
-                        out[k] = [now] * v
-                return out
+        val = auth_mod.read_user_file().get("ip_failures")
+        if isinstance(val, dict):
+            now = int(time.time())
+            out: dict[str, list[int]] = {}
+            for k, v in val.items():
+                if isinstance(v, list):
+                    # Coerce list members to ints and filter invalid
+                    try:
+                        out[k] = [int(x) for x in v]
+                    except Exception:
+                        out[k] = []
+                elif isinstance(v, int):
+                    # Legacy count: treat as recent failures
+                    out[k] = [now] * v
+            return out
     except Exception:
         pass
     return {}
@@ -376,6 +381,8 @@ def _set_ip_failures(failures: dict[str, list[int]]) -> None:
         path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     except Exception:
         pass
+    finally:
+        auth_mod.invalidate_user_cache()
 
 
 def _is_ip_allowed(ip: str) -> bool:
@@ -492,8 +499,13 @@ SUPPORTED_VIDEO_EXTS = {'.mkv', '.mp4', '.ts'}
 # Supported description file extensions for WebUI description file browser
 SUPPORTED_DESC_EXTS = {'.txt', '.nfo', '.md'}
 
-# Regex for splitting filenames on common separators (dots, dashes, underscores, spaces)
-_BROWSE_SEARCH_SEP_RE = re.compile(r'[\s.\-_]+')
+# Filename index behind /api/browse_search, rebuilt when the browse roots change
+_browse_index: Optional[BrowseIndex] = None
+_browse_index_lock = threading.Lock()
+
+# Pool of warm upload workers behind subprocess mode of /api/execute, started on first use
+_job_runner: Optional[JobRunner] = None
+_job_runner_lock = threading.Lock()
 
 # Lock to prevent concurrent in-process uploads (avoids cross-session interference)
 inproc_lock = threading.Lock()
@@ -836,6 +848,8 @@ ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 class ProcessInfo(TypedDict, total=False):
     process: subprocess.Popen[str]
+    # Subprocess runs go through the job runner
+    job: Job
     mode: str
     input_queue: "queue.Queue[str]"
     # Rich Console type is not imported for typing reasons here; use Any
@@ -1118,6 +1132,59 @@ def _get_browse_roots() -> list[str]:
     return roots
 
 
+def _get_browse_index(roots: list[str]) -> BrowseIndex:
+    """The filename index of ``roots``, started in the background on first use."""
+    global _browse_index
+    with _browse_index_lock:
+        wanted = tuple(os.path.abspath(root) for root in roots)
+        if _browse_index is None or _browse_index.roots != wanted:
+            if _browse_index is not None:
+                _browse_index.stop()
+            try:
+                interval = float(os.environ.get("UA_BROWSE_INDEX_INTERVAL", "") or DEFAULT_RESCAN_INTERVAL)
+            except ValueError:
+                interval = DEFAULT_RESCAN_INTERVAL
+            _browse_index = BrowseIndex(wanted, SUPPORTED_VIDEO_EXTS | SUPPORTED_DESC_EXTS, rescan_interval=max(interval, 5.0))
+            _browse_index.start()
+        return _browse_index
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def _get_job_runner() -> JobRunner:
+    """The worker pool for subprocess runs, sized by ``UA_WEBUI_JOB_WORKERS`` and ``UA_WEBUI_JOB_SPARES``."""
+    global _job_runner
+    with _job_runner_lock:
+        if _job_runner is None:
+            _job_runner = JobRunner(
+                str(Path(__file__).parent.parent),
+                max_jobs=_env_int("UA_WEBUI_JOB_WORKERS", DEFAULT_MAX_JOBS),
+                spares=_env_int("UA_WEBUI_JOB_SPARES", DEFAULT_SPARES),
+            )
+            _job_runner.start()
+        return _job_runner
+
+
+def start_job_runner() -> None:
+    """Warm up the worker pool when uploads run as subprocesses (used by upload.py when starting web UI)"""
+    if os.environ.get("UA_WEBUI_USE_SUBPROCESS", "").strip():
+        _get_job_runner()
+
+
+def shutdown_job_runner() -> None:
+    """Stop the spare workers and cancel the jobs of the worker pool, if it was started"""
+    global _job_runner
+    with _job_runner_lock:
+        runner, _job_runner = _job_runner, None
+    if runner is not None:
+        runner.shutdown()
+
+
 def set_runtime_browse_roots(browse_roots: str) -> None:
     """Set browse roots at runtime (used by upload.py when starting web UI)"""
     global _runtime_browse_roots
@@ -1824,6 +1891,25 @@ def strip_ansi(text: str) -> str:
     return ANSI_ESCAPE.sub("", text)
 
 
+def _output_event(origin: str, text: str, raw: bool) -> str:
+    """SSE event for a batch of subprocess output, as raw text or converted from ANSI to HTML."""
+    if raw:
+        return f"data: {json.dumps({'type': 'raw', 'data': text, 'origin': origin})}\n\n"
+    try:
+        if ansi_to_html:
+            html_fragment = ansi_to_html(text)
+        else:
+            import html as _html
+
+            html_fragment = f"<pre>{_html.escape(text)}</pre>"
+    except Exception as e:
+        console.print(f"HTML conversion error: {e}", markup=False)
+        import html as _html
+
+        html_fragment = f"<pre>{_html.escape(text)}</pre>"
+    return f"data: {json.dumps({'type': 'html', 'data': html_fragment, 'origin': origin})}\n\n"
+
+
 @app.route("/")
 def index():
     """Serve the main UI"""
@@ -2184,6 +2270,7 @@ def access_log_level_api():
         return jsonify({"success": False, "error": "Invalid level"}), 400
 
     ok = access_logger.set_level(level)
+    auth_mod.invalidate_user_cache()
     if ok:
         return jsonify({"success": True, "level": level})
     return jsonify({"success": False, "error": "Failed to persist level"}), 500
@@ -2194,7 +2281,8 @@ def access_log_entries_api():
     """Get recent access log entries.
 
     GET: returns recent log entries (requires web session).
-    Query params: n (number of entries, default 50, max 200)
+    Query params: n (number of entries, default 50, max 200), and optional
+    endpoint, user, status and success filters
     """
     # Require authenticated web session
     if not _is_authenticated():
@@ -2215,8 +2303,25 @@ def access_log_entries_api():
     except (ValueError, TypeError):
         n = 50
 
+    filters: dict[str, Any] = {}
+    for key in ("endpoint", "user"):
+        value = request.args.get(key, "").strip()
+        if value:
+            filters[key] = value
+    status_arg = request.args.get("status", "").strip()
+    if status_arg:
+        try:
+            filters["status"] = int(status_arg)
+        except ValueError:
+            return jsonify({"success": False, "error": "Invalid status"}), 400
+    success_arg = request.args.get("success", "").strip().lower()
+    if success_arg:
+        if success_arg not in ("true", "false", "1", "0"):
+            return jsonify({"success": False, "error": "Invalid success filter"}), 400
+        filters["success"] = success_arg in ("true", "1")
+
     try:
-        entries = access_logger.tail(n)
+        entries = access_logger.query(n, **filters)
         return jsonify({"success": True, "entries": entries})
     except Exception:
         return jsonify({"success": False, "error": "Failed to read log entries"}), 500
@@ -2841,6 +2946,10 @@ def browse_search():
             max_results = 100
     except (ValueError, TypeError):
         max_results = 100
+    try:
+        page = max(int(request.args.get("page", "1")), 1)
+    except (ValueError, TypeError):
+        page = 1
 
     if not query:
         return jsonify({"success": True, "items": [], "query": ""})
@@ -2859,88 +2968,36 @@ def browse_search():
     if not roots:
         return jsonify({"success": False, "error": "Browsing is not configured"}), 400
 
-    # Split on common separators
-    query_tokens = [t for t in _BROWSE_SEARCH_SEP_RE.split(query.lower()) if t]
-    if not query_tokens:
-        return jsonify({"success": True, "items": [], "query": query})
-
-    def name_matches(name: str) -> bool:
-        """Check if query tokens appear as whole-word ordered subsequence in the name."""
-        name_tokens = [t for t in _BROWSE_SEARCH_SEP_RE.split(name.lower()) if t]
-        pos = 0
-        for qt in query_tokens:
-            found = False
-            while pos < len(name_tokens):
-                if name_tokens[pos] == qt:
-                    pos += 1
-                    found = True
-                    break
-                pos += 1
-            if not found:
-                return False
-        return True
-
     allowed_exts = SUPPORTED_DESC_EXTS if file_filter == "desc" else SUPPORTED_VIDEO_EXTS
     items: list[BrowseItem] = []
 
     try:
-        for root in roots:
-            root_abs = os.path.abspath(root)
-            if not os.path.isdir(root_abs):
-                continue
+        index = _get_browse_index(roots)
+        # A small tree is indexed by the time the first query is answered; larger
+        # ones return what is indexed so far and say so with "indexing"
+        index.wait_ready(timeout=2.0)
+        offset = (page - 1) * max_results
+        matches, total = index.search(query, allowed_exts, offset=offset, limit=max_results)
+        for entry in matches:
             try:
-                for dirpath, dirnames, filenames in os.walk(root_abs):
-                    # Skip hidden dirs
-                    dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-
-                    # Check dirs
-                    for dirname in dirnames:
-                        if name_matches(dirname):
-                            full_path = os.path.join(dirpath, dirname)
-                            try:
-                                _assert_safe_resolved_path(full_path)
-                            except ValueError:
-                                continue
-                            items.append({"name": dirname, "path": full_path, "type": "folder", "children": []})
-                            if len(items) >= max_results:
-                                break
-
-                    if len(items) >= max_results:
-                        break
-
-                    # Check files
-                    for filename in filenames:
-                        if filename.startswith("."):
-                            continue
-                        if not name_matches(filename):
-                            continue
-                        _, ext = os.path.splitext(filename.lower())
-                        if ext not in allowed_exts:
-                            continue
-                        full_path = os.path.join(dirpath, filename)
-                        try:
-                            _assert_safe_resolved_path(full_path)
-                        except ValueError:
-                            continue
-                        items.append({"name": filename, "path": full_path, "type": "file", "children": None})
-                        if len(items) >= max_results:
-                            break
-
-                    if len(items) >= max_results:
-                        break
-            except PermissionError:
-                continue
-            except Exception as e:
-                console.print(f"Error searching in {root}: {e}", markup=False)
+                _assert_safe_resolved_path(entry.path)
+            except ValueError:
                 continue
-
-            if len(items) >= max_results:
-                break
-
-        # Sort by folders first and then alphabetically
-        items.sort(key=lambda x: (0 if x.get("type") == "folder" else 1, (x.get("name") or "").lower()))
-
-        return jsonify({"success": True, "items": items, "query": query, "count": len(items), "truncated": len(items) >= max_results})
+            if entry.is_dir:
+                items.append({"name": entry.name, "path": entry.path, "type": "folder", "children": []})
+            else:
+                items.append({"name": entry.name, "path": entry.path, "type": "file", "children": None})
+
+        return jsonify({
+            "success": True,
+            "items": items,
+            "query": query,
+            "count": len(items),
+            "total": total,
+            "page": page,
+            "truncated": offset + len(matches) < total,
+            "indexing": not index.ready,
+        })
 
     except Exception as e:
         console.print(f"Error in browse_search: {e}", markup=False)
@@ -3032,11 +3089,16 @@ def execute_command():
         path = data.get("path")
         args = data.get("args", "")
         session_id = data.get("session_id", "default")
+        # Raw mode streams the subprocess output as text with ANSI codes instead of HTML
+        raw_output = str(data.get("raw", "")).strip().lower() in ("1", "true", "yes")
         # If a previous run for this session left state behind, attempt to
         # terminate/cleanup it so the new execution starts with a clean slate.
         with contextlib.suppress(Exception):
             existing = active_processes.pop(session_id, None)
             if existing:
+                previous_job = existing.get("job")
+                if previous_job is not None:
+                    _get_job_runner().cancel(previous_job.id)
                 proc = existing.get("process")
                 if proc and getattr(proc, "poll", None) is None:
                     with contextlib.suppress(Exception):
@@ -3048,6 +3110,7 @@ def execute_command():
             return jsonify({"error": "Missing path", "success": False}), 400
 
         def generate():
+            inproc_lock_held = False
             try:
                 # Build command to run upload.py directly
                 validated_path = _resolve_user_path(path, require_exists=True, require_dir=False)
@@ -3087,6 +3150,18 @@ def execute_command():
                 # preserves Rich output and allows capturing console.input / cli_ui prompts.
                 use_subprocess = bool(os.environ.get("UA_WEBUI_USE_SUBPROCESS", "").strip())
 
+                # Only one in-process run can own the console and its prompts at a time;
+                # while it runs, further runs go to the job pool like subprocess runs.
+                # The lock is taken here, before the console is patched, and is handed
+                # to the worker thread once it starts.
+                if not use_subprocess:
+                    if inproc_lock.acquire(blocking=False):
+                        inproc_lock_held = True
+                    else:
+                        use_subprocess = True
+                        console.print(f"In-process run active; running session {session_id} in the job pool", markup=False)
+                        yield f"data: {json.dumps({'type': 'system', 'data': 'Another in-process run is active, running in an upload worker'})}\n\n"
+
                 if not use_subprocess:
                     # In-process execution path
                     import cli_ui as _cli_ui
@@ -3336,21 +3411,9 @@ def execute_command():
                                 inproc_lock.release()
 
                         worker = threading.Thread(target=run_upload, daemon=True)
-                        # Acquire lock to prevent concurrent inproc runs (avoids cross-session interference)
-                        # Use a timed acquire so we don't block indefinitely; if we fail
-                        # to acquire the lock, return an error to the client.
-                        try:
-                            acquired = inproc_lock.acquire(timeout=2)
-                        except TypeError:
-                            # Some older Python runtimes may not support timeout parameter
-                            acquired = inproc_lock.acquire(blocking=False)
-
-                        if not acquired:
-                            console.print(f"Failed to acquire inproc lock for session {session_id}; another inproc run may be active", markup=False)
-                            yield f"data: {json.dumps({'type': 'error', 'data': 'Another in-process run is active'})}\n\n"
-                            return
-
                         worker.start()
+                        # run_upload releases the inproc lock when it finishes
+                        inproc_lock_held = False
 
                         # Record worker thread for debugging/cleanup
                         try:
@@ -3461,12 +3524,6 @@ def execute_command():
                     return
 
                 else:
-                    # Set environment to unbuffered and force line buffering
-                    env = os.environ.copy()
-                    env["PYTHONUNBUFFERED"] = "1"
-                    env["PYTHONIOENCODING"] = "utf-8"
-                    # Disable Python output buffering
-
                     # Sanity-check the working directory used for the subprocess.
                     # `base_dir` is computed from the application `__file__`, but
                     # perform lightweight validation to satisfy static analysis
@@ -3513,162 +3570,49 @@ def execute_command():
                         yield f"data: {json.dumps({'type': 'error', 'data': 'Unsafe execution request'})}\n\n"
                         return
 
-                    process = subprocess.Popen(  # lgtm[py/command-line-injection]
-                        command,
-                        stdin=subprocess.PIPE,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        bufsize=0,  # Completely unbuffered
-                        cwd=str(base_dir),
-                        env=env,
-                        universal_newlines=True,
-                    )
-
-                    # Store process for input handling (no queue needed)
-                    active_processes[session_id] = {"process": process}
-
-                    # Wrap subprocess handling in try/finally to guarantee cleanup
-                    try:
-                        # Thread to read stdout - stream raw output with ANSI codes
-                        def read_stdout():
-                            try:
-                                if process.stdout is None:
-                                    return
-                                while True:
-                                    # Read in small chunks for real-time streaming
-                                    chunk = process.stdout.read(1)
-                                    if not chunk:
-                                        break
-                                    output_queue.put(("stdout", chunk))
-                            except Exception as e:
-                                console.print(f"stdout read error: {e}", markup=False)
-
-                        # Thread to read stderr - stream raw output
-                        def read_stderr():
-                            try:
-                                if process.stderr is None:
-                                    return
-                                while True:
-                                    chunk = process.stderr.read(1)
-                                    if not chunk:
-                                        break
-                                    output_queue.put(("stderr", chunk))
-                            except Exception as e:
-                                console.print(f"stderr read error: {e}", markup=False)
-
-                        output_queue: queue.Queue[tuple[str, str]] = queue.Queue()
-
-                        # Start threads (no input thread needed - we write directly)
-                        stdout_thread = threading.Thread(target=read_stdout, daemon=True)
-                        stderr_thread = threading.Thread(target=read_stderr, daemon=True)
-
-                        stdout_thread.start()
-                        stderr_thread.start()
-
-                        # Record threads and output queue for debugging/cleanup
-                        try:
-                            if session_id in active_processes:
-                                info = cast(Any, active_processes[session_id])
-                                info["stdout_thread"] = stdout_thread
-                                info["stderr_thread"] = stderr_thread
-                                info["output_queue"] = output_queue
-                        except Exception:
-                            pass
-
-                        console.print(f"Started subprocess reader threads for session {session_id}: stdout={stdout_thread.name}, stderr={stderr_thread.name}", markup=False)
-
-                        def _read_output(q: queue.Queue[tuple[str, str]]) -> tuple[bool, Union[tuple[str, str], None]]:
-                            try:
-                                return True, q.get(timeout=0.1)
-                            except queue.Empty:
-                                return False, None
-
-                        # Stream output as buffered chunks and always emit HTML fragments
-                        # If we are running the upload as a subprocess, stream ANSI->HTML as before.
-                        buffers: dict[str, str] = {"stdout": "", "stderr": ""}
-
-                        while process.poll() is None or not output_queue.empty():
-                            has_output, output = _read_output(output_queue)
-                            if has_output and output is not None:
-                                output_type, char = output
-                                if output_type not in buffers:
-                                    buffers[output_type] = ""
-                                buffers[output_type] += char
-
-                                # Flush on newline or when buffer grows large
-                                if char == "\n" or len(buffers[output_type]) > 512:
-                                    chunk = buffers[output_type]
-                                    buffers[output_type] = ""
-
-                                    # Convert to HTML fragment. If helper missing, escape and wrap in <pre>
-                                    try:
-                                        if ansi_to_html:
-                                            html_fragment = ansi_to_html(chunk)
-                                        else:
-                                            import html as _html
-
-                                            html_fragment = f"<pre>{_html.escape(chunk)}</pre>"
+                    # Hand the run to a warm worker of the job pool; it starts right
+                    # away or waits in the queue until a worker slot is free
+                    job = _get_job_runner().submit(session_id, command[3:])
+                    active_processes[session_id] = {"job": job}
+                    yield f"data: {json.dumps({'type': 'job', 'id': job.id, 'status': job.status})}\n\n"
+                    if job.status == "queued":
+                        yield f"data: {json.dumps({'type': 'system', 'data': 'Waiting for a free upload worker...'})}\n\n"
 
-                                        yield f"data: {json.dumps({'type': 'html', 'data': html_fragment, 'origin': output_type})}\n\n"
-                                    except Exception as e:
-                                        console.print(f"HTML conversion error: {e}", markup=False)
-                                        import html as _html
-
-                                        html_fragment = f"<pre>{_html.escape(chunk)}</pre>"
-                                        yield f"data: {json.dumps({'type': 'html', 'data': html_fragment, 'origin': output_type})}\n\n"
-                            else:
+                    finished = False
+                    try:
+                        # Stream the job's output channel in batches, as HTML fragments or as raw text for API clients
+                        for batch in batched_output(job.output, OUTPUT_ORIGINS):
+                            if batch is None:
                                 # keepalive to keep the SSE connection alive
                                 yield f"data: {json.dumps({'type': 'keepalive'})}\n\n"
-
-                        # Flush remaining buffers as HTML
-                        for t, remaining in list(buffers.items()):
-                            if remaining:
-                                try:
-                                    if ansi_to_html:
-                                        html_fragment = ansi_to_html(remaining)
-                                    else:
-                                        import html as _html
-
-                                        html_fragment = f"<pre>{_html.escape(remaining)}</pre>"
-
-                                    yield f"data: {json.dumps({'type': 'html', 'data': html_fragment, 'origin': t})}\n\n"
-
-                                except Exception as e:
-                                    console.print(f"HTML flush error: {e}", markup=False)
-                                    import html as _html
-
-                                    html_fragment = f"<pre>{_html.escape(remaining)}</pre>"
-                                    yield f"data: {json.dumps({'type': 'html', 'data': html_fragment, 'origin': t})}\n\n"
-
-                        # Wait for process to finish
-                        process.wait()
-
-                        # Clean up (normal path)
-                        if session_id in active_processes:
-                            del active_processes[session_id]
-
-                        yield f"data: {json.dumps({'type': 'exit', 'code': process.returncode})}\n\n"
+                                # Children of the worker may keep the pipes open after it exited
+                                if job.done.is_set():
+                                    break
+                                continue
+                            output_type, chunk = batch
+                            yield _output_event(output_type, chunk, raw_output)
+
+                        job.done.wait()
+                        finished = True
+                        if job.status == "cancelled":
+                            yield f"data: {json.dumps({'type': 'system', 'data': 'Job cancelled'})}\n\n"
+                        yield f"data: {json.dumps({'type': 'exit', 'code': job.returncode})}\n\n"
                     finally:
-                        # Ensure subprocess pipes are closed to avoid leaking file handles
-                        with contextlib.suppress(Exception):
-                            if process.stdin is not None:
-                                process.stdin.close()
+                        # A client that went away does not get to keep a worker busy
+                        if not finished:
+                            _get_job_runner().cancel(job.id)
                         with contextlib.suppress(Exception):
-                            if process.stdout is not None:
-                                process.stdout.close()
-                        with contextlib.suppress(Exception):
-                            if process.stderr is not None:
-                                process.stderr.close()
-                        # Ensure we remove tracking entry if still present
-                        with contextlib.suppress(Exception):
-                            if session_id in active_processes:
+                            if active_processes.get(session_id, {}).get("job") is job:
                                 del active_processes[session_id]
 
             except Exception as e:
                 console.print(f"Execution error for session {session_id}: {e}", markup=False)
                 console.print(traceback.format_exc(), markup=False)
                 yield f"data: {json.dumps({'type': 'error', 'data': 'Execution error'})}\n\n"
+            finally:
+                # The in-process run failed before its worker thread took over the lock
+                if inproc_lock_held:
+                    inproc_lock.release()
 
                 # Clean up on error
                 if session_id in active_processes:
@@ -3723,8 +3667,11 @@ def send_input():
             # Always add newline to send the input
             input_with_newline = user_input + "\n"
 
-            process = process_info.get("process")
+            job = process_info.get("job")
+            process = job.process if job is not None else process_info.get("process")
             if process is None:
+                if job is not None:
+                    return jsonify({"error": "Job is waiting for a free worker", "success": False}), 409
                 return jsonify({"error": "No process found", "success": False}), 500
 
             if process.poll() is None:  # Process still running
@@ -3851,6 +3798,16 @@ def kill_process():
             console.print(f"In-process run terminated for session {session_id}", markup=False)
             return jsonify({"success": True, "message": "In-process run terminated and console state wiped"})
 
+        # Subprocess runs are jobs of the worker pool: SIGTERM first, killed after the grace period
+        job = process_info.get("job")
+        if job is not None:
+            _get_job_runner().cancel(job.id)
+            with contextlib.suppress(Exception):
+                if active_processes.get(session_id, {}).get("job") is job:
+                    del active_processes[session_id]
+            console.print(f"Job {job.id} cancelled for session {session_id}", markup=False)
+            return jsonify({"success": True, "message": "Process terminated"})
+
         # Otherwise assume subprocess.Popen case
         # Retrieve subprocess handle
         process = process_info.get("process")
@@ -3909,6 +3866,61 @@ def kill_process():
         return jsonify({"error": "Kill error", "success": False}), 500
 
 
+def _job_api_auth_error() -> Optional[tuple[Any, int]]:
+    """Bearer token or web session check shared by the job endpoints, None when the caller may proceed."""
+    bearer = _get_bearer_from_header()
+    if bearer:
+        if not _token_is_valid(bearer):
+            return jsonify({"error": "Forbidden (invalid token)", "success": False}), 403
+    elif not _is_authenticated():
+        return jsonify({"error": "Authentication required (web session)", "success": False}), 401
+    elif request.method == "POST" and not _verify_csrf_header():
+        return jsonify({"error": "CSRF token missing or invalid", "success": False}), 403
+    return None
+
+
+@app.route("/api/jobs", methods=["GET"])
+@limiter.limit("200 per hour", key_func=_rate_limit_key_func)
+def list_jobs():
+    """Running, queued and recently finished upload jobs of the worker pool"""
+    auth_error = _job_api_auth_error()
+    if auth_error is not None:
+        return auth_error
+    if _job_runner is None:
+        return jsonify({"success": True, "jobs": [], "pool": None})
+    return jsonify({"success": True, "jobs": [job.to_dict() for job in _job_runner.jobs()], "pool": _job_runner.stats()})
+
+
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+@limiter.limit("200 per hour", key_func=_rate_limit_key_func)
+def get_job(job_id: str):
+    """Status of one upload job"""
+    auth_error = _job_api_auth_error()
+    if auth_error is not None:
+        return auth_error
+    job = _job_runner.get(job_id) if _job_runner is not None else None
+    if job is None:
+        return jsonify({"error": "No such job", "success": False}), 404
+    return jsonify({"success": True, "job": job.to_dict()})
+
+
+@app.route("/api/jobs/<job_id>/cancel", methods=["POST"])
+@limiter.limit("50 per hour", key_func=_rate_limit_key_func)
+def cancel_job(job_id: str):
+    """Cancel a queued or running upload job"""
+    auth_error = _job_api_auth_error()
+    if auth_error is not None:
+        return auth_error
+    runner = _job_runner
+    job = runner.get(job_id) if runner is not None else None
+    if runner is None or job is None:
+        return jsonify({"error": "No such job", "success": False}), 404
+    if not runner.cancel(job_id):
+        return jsonify({"error": f"Job already {job.status}", "success": False}), 409
+    console.print(f"Job {job_id} cancelled", markup=False)
+    return jsonify({"success": True, "job": job.to_dict()})
+
+
 @app.errorhandler(404)
 def not_found(_e: Exception):
     return jsonify({"error": "Not found", "success": False}), 404
@@ -445,6 +445,14 @@ function ConfigLeaf({
     const numericFields = [
       'tracker_pass_checks',
       'mkbrr_threads',
+      'hash_threads',
+      'piece_hash_cache_size_mb',
+      'image_url_cache_days',
+      'image_upload_concurrency',
+      'image_upload_max_concurrency',
+      'bdinfo_scans_per_device',
+      'reuse_verify_pieces',
+      'screenshot_candidates',
       'ffmpeg_compression',
       'screens',
       'cutoff_screens',
@@ -465,7 +473,15 @@ function ConfigLeaf({
       'bluray_single_score',
       'rehash_cooldown',
       'custom_layout',
-      'screens_per_row'
+      'screens_per_row',
+      'queue_pipeline_items',
+      'queue_pipeline_prep',
+      'queue_pipeline_screens',
+      'queue_pipeline_torrent',
+      'queue_pipeline_trackers',
+      'http_max_connections_per_host',
+      'http_keepalive_expiry',
+      'http_upload_inflight_mb'
     ];
     return numericFields.includes(key);
   };
@@ -486,10 +502,14 @@ function ConfigLeaf({
   const getDefaultValue = (key) => {
     switch (key) {
       case 'mkbrr_threads':
+      case 'hash_threads':
       case 'rehash_cooldown':
+      case 'queue_pipeline_items':
         return 0;
       case 'multiScreens':
         return 2;
+      case 'screenshot_candidates':
+        return 3;
       case 'tracker_pass_checks':
       case 'screens':
       case 'cutoff_screens':
@@ -507,13 +527,23 @@ function ConfigLeaf({
       case 'bluray_score':
       case 'bluray_single_score':
       case 'desat':
+      case 'http_max_connections_per_host':
         return 10;
+      case 'http_keepalive_expiry':
+        return 30;
+      case 'image_url_cache_days':
+        return 90;
+      case 'http_upload_inflight_mb':
+        return 64;
       case 'screens_per_row':
         return 2;
       case 'custom_layout':
         return 1;
       case 'ffmpeg_compression':
+      case 'image_upload_concurrency':
         return 6;
+      case 'image_upload_max_concurrency':
+        return 12;
       default:
         return 1;
     }
@@ -642,6 +672,7 @@ function ConfigLeaf({
         case 'tracker_pass_checks':
           return { min: 1, max: 20, step: 1 };
         case 'mkbrr_threads':
+        case 'hash_threads':
           return { min: 0, max: 32, step: 1 };
         case 'ffmpeg_compression':
           return { min: 0, max: 9, step: 1 };
@@ -649,6 +680,21 @@ function ConfigLeaf({
           return { min: 1, max: 50, step: 1 };
         case 'cutoff_screens':
           return { min: 1, max: 50, step: 1 };
+        case 'screenshot_candidates':
+          return { min: 1, max: 10, step: 1 };
+        case 'http_max_connections_per_host':
+          return { min: 1, max: 100, step: 1 };
+        case 'http_keepalive_expiry':
+          return { min: 0, max: 600, step: 5 };
+        case 'image_url_cache_days':
+          return { min: 0, max: 3650, step: 1 };
+        case 'image_upload_concurrency':
+        case 'image_upload_max_concurrency':
+          return { min: 1, max: 32, step: 1 };
+        case 'bdinfo_scans_per_device':
+          return { min: 1, max: 8, step: 1 };
+        case 'http_upload_inflight_mb':
+          return { min: 1, max: 4096, step: 8 };
         case 'thumbnail_size':
           return { min: 100, max: 1000, step: 50 };
         case 'process_limit':
@@ -1146,10 +1192,10 @@ function ItemList({
 
   // Define known subgroupings for better visual breakdown (screenshots-related)
   const subgroupDefinitions = {
-    'General ffmpeg': ['ffmpeg_compression', 'process_limit', 'ffmpeg_limit'],
+    'General ffmpeg': ['ffmpeg_compression', 'process_limit', 'ffmpeg_limit', 'batch_screenshots'],
     'Overlay': ['frame_overlay', 'overlay_text_size'],
     'HDR Tonemapping': ['tone_map', 'algorithm', 'desat', 'use_libplacebo', 'ffmpeg_is_good', 'ffmpeg_warmup'],
-    'Bluray & DVD': ['use_largest_playlist', 'get_bluray_info', 'bluray_score', 'bluray_single_score', 'ping_unit3d'],
+    'Bluray & DVD': ['use_largest_playlist', 'bdinfo_scans_per_device', 'get_bluray_info', 'bluray_score', 'bluray_single_score', 'ping_unit3d'],
     'Extra': ['btn_api', 'user_overrides'],
     'Logos': ['add_logo', 'logo_size', 'logo_language'],
     'Bluray/DVD': ['add_bluray_link', 'use_bluray_images', 'bluray_image_size', 'disc_menu_header'],